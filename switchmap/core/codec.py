@@ -0,0 +1,72 @@
+"""Compact binary encoding of polled device data.
+
+Data is serialized with msgpack, which preserves integer dict keys such as
+ifIndex values, and then compressed. A header identifies the format and its
+version so that the encoding can evolve without breaking older files.
+
+"""
+
+# Standard libraries
+import zlib
+
+# PIP libraries
+import msgpack
+
+# HTTP Content-Type of encoded data
+CONTENT_TYPE = "application/x-switchmap-msgpack"
+
+# File extension of encoded data
+EXTENSION = ".msgpack"
+
+# Header of encoded data
+MAGIC = b"SWMP"
+VERSION = 1
+
+# Favor speed over size. Polled data compresses well at any level
+_COMPRESSION_LEVEL = 3
+
+
+def encode(data):
+    """Encode data.
+
+    Args:
+        data: Data to encode
+
+    Returns:
+        result: Encoded bytes
+
+    """
+    # Encode
+    packed = msgpack.packb(data, use_bin_type=True)
+    result = b"".join(
+        [MAGIC, bytes([VERSION]), zlib.compress(packed, _COMPRESSION_LEVEL)]
+    )
+    return result
+
+
+def decode(payload):
+    """Decode data.
+
+    Args:
+        payload: Bytes created by encode()
+
+    Returns:
+        result: Decoded data
+
+    """
+    # Verify the header
+    if payload[: len(MAGIC)] != MAGIC:
+        raise ValueError("Payload is not switchmap encoded data")
+    version = payload[len(MAGIC)] if len(payload) > len(MAGIC) else None
+    if version != VERSION:
+        raise ValueError(
+            "Unsupported switchmap encoding version {}".format(version)
+        )
+
+    # Decode
+    try:
+        packed = zlib.decompress(payload[len(MAGIC) + 1 :])
+    except zlib.error as error:
+        raise ValueError("Corrupted payload: {}".format(error))
+    result = msgpack.unpackb(packed, raw=False, strict_map_key=False)
+    return result
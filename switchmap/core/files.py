@@ -10,6 +10,7 @@ import yaml
 
 # Application libraries
 from switchmap.core import log
+from switchmap.core import spool
 from switchmap.core import general
 
 
@@ -72,6 +73,62 @@ class _Directory:
         value = "{}{}snmp".format(self._system_root, os.sep)
         return value
 
+    def metrics(self):
+        """Define the system metrics directory.
+
+        Args:
+            None
+
+        Returns:
+            value: metrics directory
+
+        """
+        # Return
+        value = "{}{}metrics".format(self._system_root, os.sep)
+        return value
+
+    def outbox(self):
+        """Define the system outbox directory.
+
+        Args:
+            None
+
+        Returns:
+            value: outbox directory
+
+        """
+        # Return
+        value = "{}{}outbox".format(self._system_root, os.sep)
+        return value
+
+    def queue(self):
+        """Define the system ingest queue directory.
+
+        Args:
+            None
+
+        Returns:
+            value: queue directory
+
+        """
+        # Return
+        value = "{}{}queue".format(self._system_root, os.sep)
+        return value
+
+    def dns(self):
+        """Define the system DNS cache directory.
+
+        Args:
+            None
+
+        Returns:
+            value: DNS cache directory
+
+        """
+        # Return
+        value = "{}{}dns".format(self._system_root, os.sep)
+        return value
+
 
 class _File:
     """A class for creating the names of system files."""
@@ -151,6 +208,99 @@ class _File:
         value = "{}{}{}.snmp".format(self._directory.snmp(), os.sep, prefix)
         return value
 
+    def metrics(self, prefix, create=True):
+        """Define the file storing the statistics of a device's last poll.
+
+        Args:
+            prefix: Prefix of file
+            create: Create directory if True
+
+        Returns:
+            value: metrics file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.metrics())
+        value = "{}{}{}.metrics.json".format(
+            self._directory.metrics(), os.sep, prefix
+        )
+        return value
+
+    def state(self, prefix, create=True):
+        """Define the file storing the results of a device's last poll.
+
+        Args:
+            prefix: Prefix of file
+            create: Create directory if True
+
+        Returns:
+            value: state file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.snmp())
+        value = "{}{}{}.state.json".format(
+            self._directory.snmp(), os.sep, prefix
+        )
+        return value
+
+    def unreachable(self, prefix, create=True):
+        """Define the file marking a device that failed every credential.
+
+        Args:
+            prefix: Prefix of file
+            create: Create directory if True
+
+        Returns:
+            value: unreachable file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.snmp())
+        value = "{}{}{}.unreachable".format(
+            self._directory.snmp(), os.sep, prefix
+        )
+        return value
+
+    def capability(self, prefix, create=True):
+        """Define the file caching the MIBs supported by a device.
+
+        Args:
+            prefix: Prefix of file
+            create: Create directory if True
+
+        Returns:
+            value: capability file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.snmp())
+        value = "{}{}{}.capability.yaml".format(
+            self._directory.snmp(), os.sep, prefix
+        )
+        return value
+
+    def bulk(self, prefix, create=True):
+        """Define the file storing the GETBULK size learned for a device.
+
+        Args:
+            prefix: Prefix of file
+            create: Create directory if True
+
+        Returns:
+            value: bulk file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.snmp())
+        value = "{}{}{}.bulk".format(self._directory.snmp(), os.sep, prefix)
+        return value
+
 
 def move_yaml_files(src, dst):
     """Move all yaml files from source to destination directory.
@@ -171,6 +321,36 @@ def move_yaml_files(src, dst):
             shutil.move(filepath, dst)
 
 
+def read_cache_file(filepath, die=True):
+    """Read the contents of a device data spool file of any format.
+
+    Args:
+        filepath: Path to file to be read
+        die: Die if there is an error
+
+    Returns:
+        result: Dict of data read
+
+    """
+    # Read file
+    try:
+        result = spool.read(filepath)
+    except (OSError, ValueError, KeyError, yaml.YAMLError):
+        log_message = (
+            "Error reading file {}. Check permissions, "
+            "existence and file syntax."
+            "".format(filepath)
+        )
+        if bool(die) is True:
+            log.log2die_safe(2021, log_message)
+        else:
+            log.log2debug(2022, log_message)
+            return {}
+
+    # Return
+    return result
+
+
 def read_yaml_files(directories):
     """Read the contents of all yaml files in a directory.
 
@@ -392,6 +572,142 @@ def snmp_file(hostname, config):
     return result
 
 
+def metrics_file(hostname, config):
+    """Get the file storing the statistics of an agent's last poll.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of metrics file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.metrics(hostname)
+    return result
+
+
+def state_file(hostname, config):
+    """Get the file storing the results of an agent's last poll.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of state file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.state(hostname)
+    return result
+
+
+def outbox_directory(config):
+    """Get the directory storing posts that failed to reach the server.
+
+    Args:
+        config: Config object
+
+    Returns:
+        result: Name of outbox directory
+
+    """
+    # Return
+    d_obj = _Directory(config)
+    result = d_obj.outbox()
+    mkdir(result)
+    return result
+
+
+def queue_file(config):
+    """Get the database file of the ingest queue.
+
+    Args:
+        config: Config object
+
+    Returns:
+        result: Name of queue file
+
+    """
+    # Return
+    d_obj = _Directory(config)
+    mkdir(d_obj.queue())
+    result = "{}{}ingest.sqlite".format(d_obj.queue(), os.sep)
+    return result
+
+
+def dns_file(config):
+    """Get the database file of the DNS cache.
+
+    Args:
+        config: Config object
+
+    Returns:
+        result: Name of DNS cache file
+
+    """
+    # Return
+    d_obj = _Directory(config)
+    mkdir(d_obj.dns())
+    result = "{}{}cache.sqlite".format(d_obj.dns(), os.sep)
+    return result
+
+
+def unreachable_file(hostname, config):
+    """Get the file marking an agent that failed every SNMP credential.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of unreachable file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.unreachable(hostname)
+    return result
+
+
+def capability_file(hostname, config):
+    """Get the MIB capability cache file for an agent.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of capability file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.capability(hostname)
+    return result
+
+
+def bulk_file(hostname, config):
+    """Get the GETBULK size file for an agent.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of bulk file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.bulk(hostname)
+    return result
+
+
 def execute(command, die=True):
     """Run the command UNIX CLI command and record output.
 
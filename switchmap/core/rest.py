@@ -1,18 +1,31 @@
 """Functions for creating URIs."""
 
 # Standard imports
+import os
 import sys
+import gzip
+import json
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from collections import namedtuple
 
 # Import repository libraries
 # from switchmap.poller.configuration import ConfigAPIClient
 from switchmap.core import log
+from switchmap.core import codec
 from switchmap import API_PREFIX
 from switchmap.core.log import ExceptionWrapper
 
+# Maximum number of connections kept alive to each server per process
+_POOL_SIZE = 100
 
-def post(uri, data, config, server=True):
+# Persistent HTTP sessions, one per process
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def post(uri, data, config, server=True, binary=False, compress=False):
     """Create URI for datacenter RRD and oid_id data.
 
     Args:
@@ -20,6 +33,9 @@ def post(uri, data, config, server=True):
         data: Data to post
         config: ConfitAPIClient object
         server: Posting to a server if True, API if False
+        binary: Post compact binary data if True, JSON if False. JSON is
+            used if the server doesn't accept binary data
+        compress: Gzip JSON data if True. Binary data is always compressed
 
     Returns:
         data: Post named tuple
@@ -28,6 +44,7 @@ def post(uri, data, config, server=True):
     # Initialize key variables
     success = False
     response = False
+    result = None
     Post = namedtuple("Post", "success response")
 
     # Create the URL for posting
@@ -47,33 +64,31 @@ def post(uri, data, config, server=True):
     log.log2info(1583, log_message)
 
     # Post data save to cache if this fails
-    with requests.Session() as session:
-
-        # if bool(username) is False or bool(password) is False:
-        #     result = session.post(url, json=data)
-        # else:
-        #     result = session.post(url, json=data, auth=(username, password))
-        # response = True
+    try:
+        session = _session()
+        result = session.post(
+            url, **_request(data, username, password, binary, compress)
+        )
 
-        try:
-            with requests.Session() as session:
-                if bool(username) is False or bool(password) is False:
-                    result = session.post(url, json=data)
-                else:
-                    result = session.post(
-                        url, json=data, auth=(username, password)
-                    )
-                response = True
-        except Exception as error:
-            log_message = "Error posting to {}".format(url)
-            log.log2warning(1537, log_message)
-            log.log2exception(1641, sys.exc_info())
-            return ExceptionWrapper(error)
-        except:
-            log_message = "Failed to post data to API server URL {}.".format(
-                url
+        # Servers that predate binary posts only accept JSON
+        if bool(binary) is True and result.status_code in [400, 415]:
+            log_message = (
+                "Server at {} rejected binary data. Posting JSON."
+                "".format(url)
+            )
+            log.log2debug(2024, log_message)
+            result = session.post(
+                url, **_request(data, username, password, False, compress)
             )
-            log.log2info(1038, log_message)
+        response = True
+    except Exception as error:
+        log_message = "Error posting to {}".format(url)
+        log.log2warning(1537, log_message)
+        log.log2exception(1641, sys.exc_info())
+        return ExceptionWrapper(error)
+    except:
+        log_message = "Failed to post data to API server URL {}.".format(url)
+        log.log2info(1038, log_message)
 
     # Define success
     if response is True:
@@ -95,6 +110,132 @@ def post(uri, data, config, server=True):
     return data
 
 
+class Batch:
+    """Class combining the posts of several devices into one request."""
+
+    def __init__(
+        self,
+        uri,
+        fallback_uri,
+        config,
+        size,
+        binary=False,
+        failed=None,
+        delivered=None,
+    ):
+        """Initialize the class.
+
+        Args:
+            uri: URI for posting a batch of data
+            fallback_uri: URI for posting the data one item at a time if the
+                server doesn't accept batches
+            config: ConfigAPIClient object
+            size: Number of items per batch
+            binary: Post compact binary data if True, gzipped JSON if False
+            failed: Function called with the list of items that couldn't be
+                posted
+            delivered: Function called with the list of items that were
+                posted
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._uri = uri
+        self._fallback_uri = fallback_uri
+        self._config = config
+        self._size = max(1, size)
+        self._binary = binary
+        self._failed = failed
+        self._delivered = delivered
+        self._items = []
+        self._lock = threading.Lock()
+
+    def add(self, data):
+        """Add data to the batch, posting the batch when it is full.
+
+        Args:
+            data: Data to post
+
+        Returns:
+            None
+
+        """
+        # Add the data
+        with self._lock:
+            self._items.append(data)
+            if len(self._items) < self._size:
+                return
+            items = self._items
+            self._items = []
+
+        # Post outside the lock so other devices can keep adding data
+        self._post(items)
+
+    def flush(self):
+        """Post any data remaining in the batch.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Get the data
+        with self._lock:
+            items = self._items
+            self._items = []
+
+        # Post
+        if bool(items) is True:
+            self._post(items)
+
+    def _post(self, items):
+        """Post a batch of data.
+
+        Args:
+            items: List of data to post
+
+        Returns:
+            None
+
+        """
+        # Post
+        result = post(
+            self._uri,
+            items,
+            self._config,
+            binary=self._binary,
+            compress=True,
+        )
+
+        # Servers that predate batch posts
+        failed = []
+        delivered = []
+        response = getattr(result, "response", None)
+        if getattr(response, "status_code", None) == 404:
+            for data in items:
+                result = post(
+                    self._fallback_uri, data, self._config, binary=self._binary
+                )
+                if getattr(result, "success", False) is False:
+                    failed.append(data)
+                else:
+                    delivered.append(data)
+        elif getattr(result, "success", False) is False:
+            failed = items
+        else:
+            delivered = items
+
+        # Report the outcome
+        if bool(failed) is True and self._failed is not None:
+            self._failed(failed)
+        if bool(delivered) is True and self._delivered is not None:
+            self._delivered(delivered)
+
+
 def get(uri, config, server=True, die=True):
     """Get data fro URI from API server.
 
@@ -210,19 +351,19 @@ def _get(url, config, die=True, query=None, stream=False):
 
     # Post data save to cache if this fails
     try:
-        with requests.Session() as session:
-            if bool(query) is False:
-                response = session.get(
-                    url, stream=stream, auth=(username, password)
-                )
-            else:
-                response = session.get(
-                    url,
-                    stream=stream,
-                    auth=(username, password),
-                    params={"query": query},
-                )
-            success = True
+        session = _session()
+        if bool(query) is False:
+            response = session.get(
+                url, stream=stream, auth=(username, password)
+            )
+        else:
+            response = session.get(
+                url,
+                stream=stream,
+                auth=(username, password),
+                params={"query": query},
+            )
+        success = True
     except Exception as exception_error:
         log_message = (
             "Failed to connect to server API URL {}. Error: {}"
@@ -238,6 +379,70 @@ def _get(url, config, die=True, query=None, stream=False):
     return response
 
 
+def _session():
+    """Get the persistent HTTP session of the current process.
+
+    Connections are kept alive between requests so that each post doesn't
+    pay for a new TCP connection and TLS handshake.
+
+    Args:
+        None
+
+    Returns:
+        session: requests.Session object
+
+    """
+    # Sessions must not be shared with forked worker processes
+    pid = os.getpid()
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(pid)
+        if session is None:
+            _SESSIONS.clear()
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSIONS[pid] = session
+    return session
+
+
+def _request(data, username, password, binary, compress):
+    """Create the keyword arguments of a POST request.
+
+    Args:
+        data: Data to post
+        username: Username for simple authentication
+        password: Password for simple authentication
+        binary: Post compact binary data if True, JSON if False
+        compress: Gzip JSON data if True
+
+    Returns:
+        result: Dict of keyword arguments for requests.Session.post
+
+    """
+    # Create the request
+    if bool(binary) is True:
+        result = {
+            "data": codec.encode(data),
+            "headers": {"Content-Type": codec.CONTENT_TYPE},
+        }
+    elif bool(compress) is True:
+        result = {
+            "data": gzip.compress(json.dumps(data).encode(), 5),
+            "headers": {
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+            },
+        }
+    else:
+        result = {"json": data}
+
+    # Add credentials
+    if bool(username) is True and bool(password) is True:
+        result["auth"] = (username, password)
+    return result
+
+
 def _clean_url(url):
     """Remove excess / from url.
 
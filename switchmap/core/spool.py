@@ -0,0 +1,289 @@
+"""Spool files handing off polled device data from the API to the ingester.
+
+The spool format is pluggable. Files are identified by their extension, so
+the ingester reads every supported format regardless of the format the API
+server is configured to write. This includes the plain YAML files written
+by earlier versions of switchmap-ng.
+
+The zone of the data is part of the filename, so that the ingester can
+group the files by zone without reading them.
+
+"""
+
+# Standard libraries
+import os
+import shutil
+import hashlib
+
+# PIP imports
+import yaml
+
+# Application libraries
+from switchmap.core import codec
+from switchmap.core import general
+
+# Use the C implementations of the YAML loader and dumper if available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# First line of YAML spool files whose integer keys don't need converting
+_YAML_HEADER = "# switchmap-ng spool v1\n"
+
+# Longest zone name stored in filenames, leaving room for the hostname
+# within the usual 255 byte filename limit
+_ZONE_LENGTH = 64
+
+
+class _Msgpack:
+    """Compact binary spool files."""
+
+    extension = codec.EXTENSION
+
+    def read(self, filepath):
+        """Read a spool file.
+
+        Args:
+            filepath: Path to file to be read
+
+        Returns:
+            result: Data read
+
+        """
+        # Read. Integer keys are preserved by the encoding.
+        with open(filepath, "rb") as f_handle:
+            result = codec.decode(f_handle.read())
+        return result
+
+    def write(self, f_handle, data, payload=None):
+        """Write a spool file.
+
+        Args:
+            f_handle: File handle opened in binary mode
+            data: Data to write
+            payload: Data already encoded by switchmap.core.codec
+
+        Returns:
+            None
+
+        """
+        # Write
+        if payload is None:
+            payload = codec.encode(data)
+        f_handle.write(payload)
+
+
+class _Yaml:
+    """Human readable spool files."""
+
+    extension = ".yaml"
+
+    def read(self, filepath):
+        """Read a spool file.
+
+        Args:
+            filepath: Path to file to be read
+
+        Returns:
+            result: Data read
+
+        """
+        # Read
+        with open(filepath, "r") as f_handle:
+            header = f_handle.readline()
+            f_handle.seek(0)
+            result = yaml.load(f_handle, Loader=_YAML_LOADER)
+
+        # Files written by earlier versions of switchmap-ng were created
+        # from JSON data whose integer keys had become strings
+        if header != _YAML_HEADER:
+            result = general.consistent_keys(result)
+        return result
+
+    def write(self, f_handle, data, payload=None):
+        """Write a spool file.
+
+        Args:
+            f_handle: File handle opened in binary mode
+            data: Data to write
+            payload: Ignored
+
+        Returns:
+            None
+
+        """
+        # Write
+        f_handle.write(_YAML_HEADER.encode())
+        f_handle.write(yaml.dump(data, Dumper=_YAML_DUMPER, encoding="utf-8"))
+
+
+# Supported formats
+FORMATS = {"msgpack": _Msgpack(), "yaml": _Yaml()}
+_EXTENSIONS = {_.extension: _ for _ in FORMATS.values()}
+
+
+def filename(directory, hostname, zone):
+    """Create the path of the spool file of a device without an extension.
+
+    Args:
+        directory: Spool directory
+        hostname: Hostname of the device
+        zone: Zone of the device
+
+    Returns:
+        result: Path to the spool file without an extension
+
+    """
+    # The zone name is hex encoded so that any name is a valid filename.
+    # Long names are left out and read from the file instead.
+    encoded = zone.encode("utf-8")
+    suffix = (
+        ".{}".format(encoded.hex()) if len(encoded) <= _ZONE_LENGTH else ""
+    )
+
+    # Return
+    result = os.path.join(
+        directory,
+        "{}-{}{}".format(
+            hostname, hashlib.md5(encoded).hexdigest()[:5], suffix
+        ),
+    )
+    return result
+
+
+def zone(filepath):
+    """Get the zone of the data in a spool file from its filename.
+
+    Args:
+        filepath: Path to the spool file
+
+    Returns:
+        result: Zone name, None if the filename doesn't include it
+
+    """
+    # Filenames of earlier versions end with the zone's hash, which
+    # always includes a "-" after the last "."
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    _, separator, encoded = name.rpartition(".")
+    if bool(separator) is False or "-" in encoded:
+        return None
+
+    # Return
+    try:
+        result = bytes.fromhex(encoded).decode("utf-8")
+    except ValueError:
+        result = None
+    return result
+
+
+def is_spool_file(filepath):
+    """Determine whether a file is a spool file.
+
+    Args:
+        filepath: Path to file
+
+    Returns:
+        result: True if the file is a spool file
+
+    """
+    # Return
+    result = os.path.isfile(filepath) and (
+        os.path.splitext(filepath)[1].lower() in _EXTENSIONS
+    )
+    return result
+
+
+def exists(filename):
+    """Determine whether a spool file of any format exists.
+
+    Args:
+        filename: Path to the spool file without an extension
+
+    Returns:
+        result: True if the file exists
+
+    """
+    # Return
+    result = any(
+        os.path.exists("{}{}".format(filename, _)) for _ in _EXTENSIONS
+    )
+    return result
+
+
+def filepaths(src):
+    """Get the spool files in a directory.
+
+    Args:
+        src: Source directory
+
+    Returns:
+        result: List of filepaths
+
+    """
+    # Return
+    result = [
+        os.path.join(src, _)
+        for _ in sorted(os.listdir(src))
+        if is_spool_file(os.path.join(src, _)) is True
+    ]
+    return result
+
+
+def move(src, dst):
+    """Move all spool files from source to destination directory.
+
+    Args:
+        src: Source directory
+        dst: Destination directory
+
+    Returns:
+        None
+
+    """
+    # Move files
+    for filepath in filepaths(src):
+        shutil.move(filepath, dst)
+
+
+def read(filepath):
+    """Read a spool file of any format.
+
+    Args:
+        filepath: Path to file to be read
+
+    Returns:
+        result: Data read
+
+    """
+    # Read
+    spool = _EXTENSIONS[os.path.splitext(filepath)[1].lower()]
+    result = spool.read(filepath)
+    return result
+
+
+def write(filename, data, spool_format, payload=None):
+    """Write a spool file.
+
+    Args:
+        filename: Path to the spool file without an extension
+        data: Data to write
+        spool_format: Name of the format in FORMATS
+        payload: Data already encoded by switchmap.core.codec. Written as
+            is if the format is msgpack
+
+    Returns:
+        filepath: Path to the file written
+
+    """
+    # Initialize key variables
+    spool = FORMATS[spool_format]
+    filepath = "{}{}".format(filename, spool.extension)
+    temp_filepath = "{}.tmp".format(filepath)
+
+    # Write to a temporary file first so that the ingester never reads a
+    # partially written file
+    with open(temp_filepath, "wb") as f_handle:
+        spool.write(f_handle, data, payload=payload)
+    os.replace(temp_filepath, filepath)
+
+    # Return
+    return filepath
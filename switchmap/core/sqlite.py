@@ -0,0 +1,55 @@
+"""Local SQLite databases used to keep state between daemon cycles."""
+
+# Standard libraries
+import sqlite3
+
+
+class Connection:
+    """Context manager committing and closing a SQLite connection."""
+
+    def __init__(self, filename):
+        """Initialize the class.
+
+        Args:
+            filename: Name of the database file
+
+        Returns:
+            None
+
+        """
+        # Transactions are started explicitly where needed
+        self._connection = sqlite3.connect(
+            filename, timeout=30, isolation_level=None
+        )
+
+    def __enter__(self):
+        """Start the context.
+
+        Args:
+            None
+
+        Returns:
+            result: sqlite3.Connection object
+
+        """
+        return self._connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """End the context.
+
+        Args:
+            exc_type: Type of exception raised in the context
+            exc_value: Exception raised in the context
+            traceback: Traceback of the exception
+
+        Returns:
+            None
+
+        """
+        # Commit or roll back any open transaction
+        if self._connection.in_transaction is True:
+            if exc_type is None:
+                self._connection.commit()
+            else:
+                self._connection.rollback()
+        self._connection.close()
@@ -36,6 +36,50 @@ class ConfigPoller(ConfigAPIClient):
             )
             log.log2die_safe(1007, log_message)
 
+    def binary_posts(self):
+        """Get binary_posts.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = bool(self._config_poller.get("binary_posts", True))
+        return result
+
+    def capability_cache_ttl(self):
+        """Get capability_cache_ttl.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = max(
+            0, int(self._config_poller.get("capability_cache_ttl", 86400))
+        )
+        return result
+
+    def device_concurrency(self):
+        """Get device_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = max(1, int(self._config_poller.get("device_concurrency", 1)))
+        return result
+
     def hostnames(self):
         """Get hostnames.
 
@@ -58,6 +102,113 @@ class ConfigPoller(ConfigAPIClient):
         # Return
         return result
 
+    def incremental_polling(self):
+        """Get incremental_polling.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = bool(self._config_poller.get("incremental_polling", False))
+        return result
+
+    def incremental_refresh_interval(self):
+        """Get incremental_refresh_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = max(
+            0,
+            int(self._config_poller.get("incremental_refresh_interval", 3600)),
+        )
+        return result
+
+    def incremental_table_interval(self):
+        """Get incremental_table_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = max(
+            0,
+            int(self._config_poller.get("incremental_table_interval", 300)),
+        )
+        return result
+
+    def outbox_size(self):
+        """Get outbox_size.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = max(0, int(self._config_poller.get("outbox_size", 1000)))
+        return result
+
+    def polling_concurrency(self):
+        """Get polling_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("polling_concurrency", 100))
+        )
+        return result
+
+    def polling_engine(self):
+        """Get polling_engine.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Initialize key variables
+        engines = ["multiprocessing", "asyncio"]
+
+        # Get result
+        result = str(
+            self._config_poller.get("polling_engine", "multiprocessing")
+        ).lower()
+
+        # Error if incorrectly configured
+        if result not in engines:
+            log_message = (
+                'Invalid polling_engine "{}" in the configuration file(s). '
+                "Valid values are: {}".format(result, ", ".join(engines))
+            )
+            log.log2die_safe(2008, log_message)
+
+        # Return
+        return result
+
     def polling_interval(self):
         """Get polling_interval.
 
@@ -72,6 +223,20 @@ class ConfigPoller(ConfigAPIClient):
         result = self._config_poller.get("polling_interval", 86400)
         return result
 
+    def post_batch_size(self):
+        """Get post_batch_size.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = max(1, int(self._config_poller.get("post_batch_size", 1)))
+        return result
+
     def snmp_auth(self):
         """Get list of dicts of SNMP information in configuration file.
 
@@ -118,6 +283,22 @@ class ConfigPoller(ConfigAPIClient):
         # Return
         return result
 
+    def unreachable_cache_ttl(self):
+        """Get unreachable_cache_ttl.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = max(
+            0, int(self._config_poller.get("unreachable_cache_ttl", 3600))
+        )
+        return result
+
     def username(self):
         """Get username.
 
@@ -144,6 +325,7 @@ class ConfigPoller(ConfigAPIClient):
         """
         # Initialize key variables
         _zones = self._config_poller.get("zones", [])
+        polling_interval = self.polling_interval()
         result = []
 
         # Read configuration. Return [] if none found
@@ -168,6 +350,9 @@ class ConfigPoller(ConfigAPIClient):
                         if isinstance(_zone.get("hostnames"), list)
                         else None
                     ),
+                    polling_interval=int(
+                        _zone.get("polling_interval", polling_interval)
+                    ),
                 )
             )
 
@@ -0,0 +1,97 @@
+"""Switchmap-NG asyncio polling engine.
+
+Polls many devices concurrently from a single event loop instead of a
+multiprocessing pool of blocking workers.
+
+"""
+
+# Standard libraries
+import sys
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Import app libraries
+from switchmap.core import log
+
+
+def run(function, arguments, concurrency):
+    """Poll devices concurrently using an asyncio event loop.
+
+    Args:
+        function: Function that polls a single device
+        arguments: List of arguments, one per device, to pass to function
+        concurrency: Maximum number of devices being polled at any one time
+
+    Returns:
+        result: List of values returned by function, in the order of
+            arguments. None for polls that failed
+
+    """
+    # Nothing to do
+    if bool(arguments) is False:
+        return []
+
+    # Poll
+    result = asyncio.run(_run(function, arguments, concurrency))
+    return result
+
+
+async def _run(function, arguments, concurrency):
+    """Schedule the device polls on the event loop.
+
+    Args:
+        function: Function that polls a single device
+        arguments: List of arguments, one per device, to pass to function
+        concurrency: Maximum number of devices being polled at any one time
+
+    Returns:
+        result: List of values returned by function
+
+    """
+    # Initialize key variables
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # easysnmp is a blocking library. Each poll is handed to a worker
+    # thread so that the event loop can wait on many devices at once.
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        tasks = [
+            _poll(loop, executor, semaphore, function, argument)
+            for argument in arguments
+        ]
+        result = await asyncio.gather(*tasks)
+
+    # Return
+    return list(result)
+
+
+async def _poll(loop, executor, semaphore, function, argument):
+    """Poll a single device without exceeding the global in-flight limit.
+
+    Args:
+        loop: Running event loop
+        executor: Executor in which to run the blocking poll
+        semaphore: Semaphore limiting the number of in-flight polls
+        function: Function that polls a single device
+        argument: Argument to pass to the function
+
+    Returns:
+        result: Value returned by function, None if it failed
+
+    """
+    # Initialize key variables
+    result = None
+
+    async with semaphore:
+        try:
+            result = await loop.run_in_executor(executor, function, argument)
+        except Exception:
+            # One failed device must not stop the others from being polled
+            log_message = "Polling failure for {}".format(
+                getattr(argument, "hostname", argument)
+            )
+            log.log2warning(2009, log_message)
+            log.log2exception(2010, sys.exc_info())
+
+    # Return
+    return result
@@ -0,0 +1,377 @@
+"""Switchmap-NG poller outbox.
+
+Stores posts that failed to reach the server on disk and replays them, in
+the order they were made, as soon as the server is reachable again. Only
+the newest post of each device is kept, and it is discarded once a newer
+post of the device has been delivered. Posts of devices that are being
+polled aren't replayed, as they could arrive after the newer data and
+displace it.
+
+"""
+
+# Standard libraries
+import os
+import time
+import json
+import fcntl
+import hashlib
+
+# Import app libraries
+from switchmap.core import log
+from switchmap.core import rest
+from switchmap.core import codec
+from switchmap.core import files
+
+# Delays between replay attempts in seconds
+BACKOFF_MINIMUM = 60
+BACKOFF_MAXIMUM = 3600
+
+# HTTP client errors that are caused by the server or its configuration
+# rather than the post. Other 4xx errors will never succeed, so these posts
+# are moved out of the way instead of being retried.
+_RETRY_STATUS = [401, 403, 404, 408, 429]
+
+
+class Outbox:
+    """Class storing failed posts for later delivery."""
+
+    def __init__(self, config):
+        """Initialize the class.
+
+        Args:
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._config = config
+        self._size = config.outbox_size()
+        self._directory = files.outbox_directory(config)
+        self._backoff_file = os.path.join(self._directory, ".backoff")
+        self._lock_file = os.path.join(self._directory, ".lock")
+        self._failed_directory = os.path.join(self._directory, "failed")
+
+    def add(self, uri, data):
+        """Store a post that failed.
+
+        Args:
+            uri: URI of the post
+            data: Device data posted
+
+        Returns:
+            None
+
+        """
+        # Nothing to do if the outbox is disabled
+        if bool(self._size) is False:
+            return
+
+        # Only the newest data per device is needed
+        key = _key(data)
+        self.discard([key])
+
+        # Name files so that they sort in the order they were created
+        filepath = os.path.join(
+            self._directory,
+            "{:020d}-{}-{}{}".format(
+                time.time_ns(), os.getpid(), key, codec.EXTENSION
+            ),
+        )
+
+        # Write to a temporary file first so that a partially written file
+        # is never replayed
+        temp_file = "{}.tmp".format(filepath)
+        try:
+            with open(temp_file, "wb") as f_handle:
+                f_handle.write(codec.encode({"uri": uri, "data": data}))
+            os.replace(temp_file, filepath)
+        except OSError:
+            log_message = "Unable to write outbox file {}".format(filepath)
+            log.log2warning(2026, log_message)
+            return
+
+        # Keep the outbox within its size limit by dropping the oldest posts
+        filepaths = self.filepaths()
+        for filepath in filepaths[: max(0, len(filepaths) - self._size)]:
+            log_message = "Outbox full. Discarding {}".format(filepath)
+            log.log2warning(2027, log_message)
+            _remove(filepath)
+
+    def delivered(self, items, pending=None):
+        """Discard the stored posts superseded by delivered data.
+
+        The server has just been reached, so the rest of the stored posts
+        are replayed without waiting for the backoff to expire.
+
+        Args:
+            items: List of device data delivered to the server
+            pending: List of (hostname, zone) tuples of the devices being
+                polled. Their stored posts are kept but not replayed.
+
+        Returns:
+            None
+
+        """
+        # Nothing to do if the outbox is disabled or empty
+        if bool(self._size) is False or bool(self.filepaths()) is False:
+            return
+
+        # Replay
+        self.discard([_key(_) for _ in items])
+        self.replay(pending=pending, force=True)
+
+    def replay(self, pending=None, force=False):
+        """Post the stored data to the server in the order it was stored.
+
+        Replaying stops at the first failure and isn't attempted again
+        until an exponentially increasing delay has passed. Posts rejected
+        by the server as invalid are moved to the failed subdirectory.
+
+        Args:
+            pending: List of (hostname, zone) tuples of the devices being
+                polled. Their stored posts are kept but not replayed.
+            force: Replay without waiting for the backoff to expire if True
+
+        Returns:
+            None
+
+        """
+        # Wait for the backoff to expire
+        failures, retry = _read(self._backoff_file)
+        if time.time() < retry and bool(force) is False:
+            return
+
+        # Only one replay at a time, as several devices may be polled in
+        # parallel
+        try:
+            with open(self._lock_file, "a") as f_handle:
+                fcntl.flock(f_handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self._replay(pending, failures)
+        except BlockingIOError:
+            return
+        except OSError:
+            log_message = "Unable to lock outbox file {}".format(
+                self._lock_file
+            )
+            log.log2warning(2054, log_message)
+
+    def _replay(self, pending, failures):
+        """Post the stored data to the server in the order it was stored.
+
+        Args:
+            pending: List of (hostname, zone) tuples of the devices being
+                polled. Their stored posts are kept but not replayed.
+            failures: Number of consecutive replays that failed
+
+        Returns:
+            None
+
+        """
+        # Skip the devices being polled
+        suffixes = tuple(
+            "-{}{}".format(_key(_), codec.EXTENSION) for _ in pending or []
+        )
+        filepaths = [
+            _ for _ in self.filepaths() if _.endswith(suffixes) is False
+        ]
+
+        # Post
+        for filepath in filepaths:
+            try:
+                with open(filepath, "rb") as f_handle:
+                    item = codec.decode(f_handle.read())
+            except (OSError, ValueError):
+                _remove(filepath)
+                continue
+
+            result = rest.post(
+                item["uri"],
+                item["data"],
+                self._config,
+                binary=self._config.binary_posts(),
+            )
+            status = getattr(
+                getattr(result, "response", None), "status_code", None
+            )
+            if (
+                getattr(result, "success", False) is False
+                and isinstance(status, int) is True
+                and 400 <= status < 500
+                and status not in _RETRY_STATUS
+            ):
+                self._fail(filepath, status)
+                continue
+
+            if getattr(result, "success", False) is False:
+                failures += 1
+                delay = min(
+                    BACKOFF_MAXIMUM, BACKOFF_MINIMUM * 2 ** (failures - 1)
+                )
+                log_message = """\
+Unable to replay outbox to the server. {} posts remaining. Retrying in {}s\
+""".format(
+                    len(self.filepaths()), delay
+                )
+                log.log2warning(2028, log_message)
+                _write(self._backoff_file, failures, time.time() + delay)
+                return
+
+            _remove(filepath)
+
+        # Reset the backoff
+        if bool(filepaths) is True:
+            log_message = "Replayed {} posts from the outbox".format(
+                len(filepaths)
+            )
+            log.log2info(2029, log_message)
+        _remove(self._backoff_file)
+
+    def discard(self, keys):
+        """Discard the stored posts of devices.
+
+        Args:
+            keys: List of device keys created by _key()
+
+        Returns:
+            None
+
+        """
+        # Discard
+        suffixes = tuple("-{}{}".format(_, codec.EXTENSION) for _ in keys)
+        for filepath in self.filepaths():
+            if filepath.endswith(suffixes) is True:
+                _remove(filepath)
+
+    def _fail(self, filepath, status):
+        """Move a post the server rejected to the failed subdirectory.
+
+        Args:
+            filepath: Path of the stored post
+            status: HTTP status code of the rejection
+
+        Returns:
+            None
+
+        """
+        # Log
+        log_message = """\
+Server rejected outbox post {} with status {}. Moving it to {}\
+""".format(
+            filepath, status, self._failed_directory
+        )
+        log.log2warning(2049, log_message)
+
+        # Move
+        try:
+            os.makedirs(self._failed_directory, exist_ok=True)
+            os.replace(
+                filepath,
+                os.path.join(
+                    self._failed_directory, os.path.basename(filepath)
+                ),
+            )
+        except OSError:
+            _remove(filepath)
+
+    def filepaths(self):
+        """Get the stored posts, oldest first.
+
+        Args:
+            None
+
+        Returns:
+            result: List of filepaths
+
+        """
+        # Return
+        result = [
+            os.path.join(self._directory, _)
+            for _ in sorted(os.listdir(self._directory))
+            if _.endswith(codec.EXTENSION)
+        ]
+        return result
+
+
+def _key(data):
+    """Create a key identifying the device whose data is posted.
+
+    Args:
+        data: Device data, or a tuple of (hostname, zone)
+
+    Returns:
+        result: Key
+
+    """
+    # Get the device
+    if isinstance(data, tuple) is True:
+        hostname, zone = data
+    else:
+        misc = data.get("misc", {}) if isinstance(data, dict) else {}
+        hostname, zone = misc.get("host"), misc.get("zone")
+
+    # Return
+    result = hashlib.md5(
+        "{}-{}".format(hostname, zone).encode("utf-8")
+    ).hexdigest()[:8]
+    return result
+
+
+def _read(filename):
+    """Read the replay backoff state.
+
+    Args:
+        filename: Name of backoff file
+
+    Returns:
+        result: Tuple of (number of consecutive failures, time of next retry)
+
+    """
+    # Read the file
+    try:
+        with open(filename, "r") as f_handle:
+            state = json.load(f_handle)
+        result = (int(state["failures"]), float(state["retry"]))
+    except (OSError, ValueError, TypeError, KeyError):
+        result = (0, 0)
+
+    # Return
+    return result
+
+
+def _write(filename, failures, retry):
+    """Write the replay backoff state.
+
+    Args:
+        filename: Name of backoff file
+        failures: Number of consecutive failures
+        retry: Time of next retry
+
+    Returns:
+        None
+
+    """
+    # Write
+    try:
+        with open(filename, "w") as f_handle:
+            json.dump({"failures": failures, "retry": retry}, f_handle)
+    except OSError:
+        pass
+
+
+def _remove(filename):
+    """Remove a file that may already have been removed.
+
+    Args:
+        filename: Name of file
+
+    Returns:
+        None
+
+    """
+    # Remove
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
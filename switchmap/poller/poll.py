@@ -7,12 +7,18 @@ Updates the database with device SNMP data.
 # Standard libraries
 from multiprocessing import Pool
 from collections import namedtuple
+from functools import partial
 from pprint import pprint
+import time
+import sys
 import os
 
 # Import app libraries
 from switchmap import API_POLLER_POST_URI
+from switchmap import API_POLLER_BATCH_URI
 from switchmap.poller.snmp import poller
+from switchmap.poller import engine
+from switchmap.poller import outbox
 from switchmap.poller.update import device as udevice
 from switchmap.poller.configuration import ConfigPoller
 from switchmap.core import log
@@ -21,27 +27,91 @@ from switchmap.core import files
 from switchmap import AGENT_POLLER
 
 _META = namedtuple("_META", "zone hostname config")
+_RESULT = namedtuple("_RESULT", "zone hostname started duration success")
 
 
-def devices(multiprocessing=False):
+def devices(multiprocessing=False, arguments=None):
     """Poll all devices for data using subprocesses and create YAML files.
 
     Args:
         multiprocessing: Run multiprocessing when True
+        arguments: List of _META objects for the devices to poll. All the
+            devices in the configuration are polled if None
 
     Returns:
-        None
+        results: List of _RESULT objects
 
     """
-    # Initialize key variables
-    arguments = []
-
     # Get configuration
     config = ConfigPoller()
 
     # Get the number of threads to use in the pool
     pool_size = config.agent_subprocesses()
 
+    # Create a list of arguments
+    if arguments is None:
+        arguments = targets(config)
+
+    # Deliver the data of previous polls that didn't reach the server,
+    # except for the devices about to be polled again. Their stored data
+    # is replaced once the new data is delivered, or replayed later if it
+    # isn't.
+    pending = [(_.hostname, _.zone) for _ in arguments]
+    outbox.Outbox(config).replay(pending=pending)
+
+    # Combine the posts of several devices into one request. Not possible
+    # with multiprocessing as the data is in separate processes.
+    batch = None
+    if config.post_batch_size() > 1 and (
+        config.polling_engine() == "asyncio" or bool(multiprocessing) is False
+    ):
+        batch = rest.Batch(
+            API_POLLER_BATCH_URI,
+            API_POLLER_POST_URI,
+            config,
+            config.post_batch_size(),
+            binary=config.binary_posts(),
+            failed=partial(_failed, config=config),
+            delivered=partial(_delivered, config=config, pending=pending),
+        )
+    function = partial(_timed, batch=batch, pending=pending)
+
+    # Process the data
+    if config.polling_engine() == "asyncio":
+        # Poll concurrently from a single event loop
+        results = engine.run(function, arguments, config.polling_concurrency())
+
+    elif bool(multiprocessing) is False:
+        results = [function(argument) for argument in arguments]
+
+    else:
+        # Create a multiprocessing pool of sub process resources
+        with Pool(processes=pool_size) as pool:
+            # Create sub processes from the pool
+            results = pool.map(partial(_timed, pending=pending), arguments)
+
+    # Post the remaining data
+    if batch is not None:
+        batch.flush()
+
+    # Return
+    results = [_ for _ in results if _ is not None]
+    return results
+
+
+def targets(config):
+    """Create the arguments for polling every device in the configuration.
+
+    Args:
+        config: ConfigPoller object
+
+    Returns:
+        arguments: List of _META objects
+
+    """
+    # Initialize key variables
+    arguments = []
+
     # Create a list of polling objects
     zones = sorted(config.zones())
 
@@ -52,24 +122,57 @@ def devices(multiprocessing=False):
             for _ in zone.hostnames
         )
 
-    # Process the data
-    if bool(multiprocessing) is False:
-        for argument in arguments:
-            device(argument)
+    # Return
+    return arguments
 
-    else:
-        # Create a multiprocessing pool of sub process resources
-        with Pool(processes=pool_size) as pool:
-            # Create sub processes from the pool
-            pool.map(device, arguments)
 
+def _timed(poll, batch=None, pending=None):
+    """Poll single device for data and time how long it takes.
 
-def device(poll, post=True):
+    Args:
+        poll: _META object
+        batch: rest.Batch object to which to add the data instead of posting
+            it immediately. Posted immediately if None
+        pending: List of (hostname, zone) tuples of the devices being polled
+
+    Returns:
+        result: _RESULT object
+
+    """
+    # Initialize key variables
+    started = time.time()
+    success = False
+
+    # Poll. A result is returned even if the poll fails, so that the
+    # device isn't polled again until its next polling interval.
+    try:
+        device(poll, batch=batch, pending=pending)
+        success = True
+    except Exception:
+        log_message = "Polling failure for {}".format(poll.hostname)
+        log.log2warning(2052, log_message)
+        log.log2exception(2053, sys.exc_info())
+
+    # Return
+    result = _RESULT(
+        zone=poll.zone,
+        hostname=poll.hostname,
+        started=started,
+        duration=time.time() - started,
+        success=success,
+    )
+    return result
+
+
+def device(poll, post=True, batch=None, pending=None):
     """Poll single device for data and create YAML files.
 
     Args:
         poll: _META object
         post: Post the data if True, else just print it.
+        batch: rest.Batch object to which to add the data instead of posting
+            it immediately. Posted immediately if None
+        pending: List of (hostname, zone) tuples of the devices being polled
 
     Returns:
         None
@@ -105,9 +208,21 @@ shutdown request was probably requested""".format(
                     data = _device.process()
                     data["misc"]["zone"] = zone
 
-                    if bool(post) is True:
+                    if bool(post) is True and batch is not None:
+                        # Post with the data of other devices
+                        batch.add(data)
+                    elif bool(post) is True:
                         # Update the database tables with polled data
-                        rest.post(API_POLLER_POST_URI, data, config)
+                        result = rest.post(
+                            API_POLLER_POST_URI,
+                            data,
+                            config,
+                            binary=config.binary_posts(),
+                        )
+                        if getattr(result, "success", False) is False:
+                            _failed([data], config)
+                        else:
+                            _delivered([data], config, pending=pending)
                     else:
                         pprint(data)
                 else:
@@ -119,6 +234,39 @@ Device {} returns no data. Check your connectivity and/or SNMP configuration\
                     log.log2debug(1025, log_message)
 
 
+def _failed(items, config):
+    """Store device data that couldn't be posted for later delivery.
+
+    Args:
+        items: List of device data
+        config: ConfigPoller object
+
+    Returns:
+        None
+
+    """
+    # Store
+    store = outbox.Outbox(config)
+    for data in items:
+        store.add(API_POLLER_POST_URI, data)
+
+
+def _delivered(items, config, pending=None):
+    """Replay stored data once the server has been reached.
+
+    Args:
+        items: List of device data delivered to the server
+        config: ConfigPoller object
+        pending: List of (hostname, zone) tuples of the devices being polled
+
+    Returns:
+        None
+
+    """
+    # Replay
+    outbox.Outbox(config).delivered(items, pending=pending)
+
+
 def cli_device(hostname):
     """Poll single device for data and create YAML files.
 
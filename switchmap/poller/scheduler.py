@@ -0,0 +1,180 @@
+"""Switchmap-NG device polling scheduler.
+
+Decides which devices are due to be polled, and in what order, based on
+per-zone polling intervals, how stale each device's data is and how long
+each device took to poll the last time.
+
+"""
+
+# Standard libraries
+import time
+
+# Import app libraries
+from switchmap.core import log
+
+
+class Scheduler:
+    """Class scheduling device polls."""
+
+    def __init__(self, config):
+        """Initialize the class.
+
+        Args:
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._devices = {}
+
+        # Every device is due immediately after startup
+        self.refresh(config)
+
+    def refresh(self, config):
+        """Update the devices to schedule from the configuration.
+
+        Devices that are new to the configuration are due immediately.
+        Devices that are no longer in it are dropped. The schedule of the
+        others is kept, using their zone's current polling interval.
+
+        Args:
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        devices = {}
+
+        # Get the devices in the configuration
+        for zone in config.zones():
+            for hostname in zone.hostnames:
+                key = (zone.name, hostname)
+                device = self._devices.get(
+                    key,
+                    {
+                        "started": None,
+                        "duration": 0.0,
+                        "due": 0.0,
+                        "missed": False,
+                    },
+                )
+                if device["started"] is not None:
+                    device["due"] = device["started"] + max(
+                        1, zone.polling_interval
+                    )
+                device["interval"] = max(1, zone.polling_interval)
+                devices[key] = device
+
+        # Update
+        self._devices = devices
+
+    def due(self, now=None):
+        """Get the devices that are due to be polled.
+
+        Devices that have already missed their deadline come first. The
+        remainder are ordered by how long they took to poll the last time,
+        slowest first, so that they don't hold up the end of the polling
+        cycle. Ties are broken by staleness.
+
+        Args:
+            now: Current time. The system time is used if None
+
+        Returns:
+            result: List of (zone, hostname) tuples
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+        candidates = []
+
+        # Get the devices that are due
+        for key, device in self._devices.items():
+            if device["due"] > now:
+                continue
+            overdue = now >= device["due"] + device["interval"]
+            staleness = (
+                float("inf")
+                if device["started"] is None
+                else now - device["started"]
+            )
+            candidates.append(
+                (
+                    not (overdue or device["missed"]),
+                    -device["duration"],
+                    -staleness,
+                    key,
+                )
+            )
+
+        # Return
+        result = [_[-1] for _ in sorted(candidates)]
+        return result
+
+    def update(self, results):
+        """Update the schedule with the results of device polls.
+
+        Args:
+            results: List of poll._RESULT objects
+
+        Returns:
+            None
+
+        """
+        # Update the schedule
+        for result in results:
+            device = self._devices.get((result.zone, result.hostname))
+            if device is None:
+                continue
+
+            # The poll must complete before the next one is due
+            deadline = (
+                result.started + device["interval"]
+                if device["started"] is None
+                else device["due"] + device["interval"]
+            )
+            completed = result.started + result.duration
+            device["missed"] = completed > deadline
+            if device["missed"] is True:
+                log_message = """\
+Device {} in zone {} missed its polling deadline by {:.1f}s. Poll took {:.1f}s \
+with a {}s polling interval""".format(
+                    result.hostname,
+                    result.zone,
+                    completed - deadline,
+                    result.duration,
+                    device["interval"],
+                )
+                log.log2warning(2020, log_message)
+
+            # Schedule the next poll. Failed polls are retried at the next
+            # interval, but say nothing about how long the device takes
+            device["started"] = result.started
+            if result.success is True:
+                device["duration"] = result.duration
+            device["due"] = result.started + device["interval"]
+
+    def wait(self, now=None):
+        """Get the time to wait until the next device is due.
+
+        Args:
+            now: Current time. The system time is used if None
+
+        Returns:
+            result: Seconds to wait
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+
+        # Nothing to schedule
+        if bool(self._devices) is False:
+            return 1
+
+        # Return
+        due = min(_["due"] for _ in self._devices.values())
+        result = max(1, int(due - now + 0.999))
+        return result
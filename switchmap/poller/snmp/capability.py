@@ -0,0 +1,155 @@
+"""Cache of the MIBs supported by a device."""
+
+import os
+import time
+
+# PIP imports
+import yaml
+
+# Import project libraries
+from switchmap.core import log
+from switchmap.core import files
+
+
+class Cache:
+    """Class caching the results of OID existence checks across polls."""
+
+    def __init__(self, hostname, sysobjectid, sysuptime, config):
+        """Initialize the class.
+
+        Args:
+            hostname: Hostname of the device
+            sysobjectid: sysObjectID of the device
+            sysuptime: sysUpTime of the device
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._hostname = hostname
+        self._sysobjectid = sysobjectid
+        self._sysuptime = sysuptime
+        self._ttl = config.capability_cache_ttl()
+        self._filename = files.capability_file(hostname, config)
+        self._timestamp = int(time.time())
+        self._oids = {}
+
+        # Read the results of previous polls
+        if bool(self._ttl) is True:
+            self._load()
+
+    def get(self, oid):
+        """Get the cached existence of an OID.
+
+        Args:
+            oid: OID to check
+
+        Returns:
+            result: True or False if cached, None if not
+
+        """
+        # Return
+        result = self._oids.get(oid)
+        return result
+
+    def set(self, oid, exists):
+        """Cache the existence of an OID.
+
+        Args:
+            oid: OID checked
+            exists: True if the OID exists on the device
+
+        Returns:
+            None
+
+        """
+        # Update
+        self._oids[oid] = bool(exists)
+
+    def save(self):
+        """Write the cache to disk.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Nothing to do if caching is disabled
+        if bool(self._ttl) is False:
+            return
+
+        # Initialize key variables
+        data = {
+            "sysobjectid": self._sysobjectid,
+            "sysuptime": self._sysuptime,
+            "timestamp": self._timestamp,
+            "oids": self._oids,
+        }
+        temp_file = "{}.tmp".format(self._filename)
+
+        # Write to a temporary file first so that a concurrent reader never
+        # sees a partially written cache
+        try:
+            with open(temp_file, "w") as f_handle:
+                yaml.safe_dump(data, f_handle, default_flow_style=False)
+            os.replace(temp_file, self._filename)
+        except OSError:
+            log_message = "Unable to write capability cache file {}".format(
+                self._filename
+            )
+            log.log2warning(2014, log_message)
+
+    def _load(self):
+        """Read the cache written by a previous poll if it is still valid.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Nothing to do
+        if os.path.isfile(self._filename) is False:
+            return
+
+        # Read the file
+        try:
+            with open(self._filename, "r") as f_handle:
+                data = yaml.safe_load(f_handle)
+        except (OSError, yaml.YAMLError):
+            data = None
+
+        # Ignore corrupted files
+        if (
+            isinstance(data, dict) is False
+            or isinstance(data.get("oids"), dict) is False
+        ):
+            return
+
+        # Discard the cache if it has expired, if the device has been
+        # replaced by another model or if it has rebooted and may be
+        # running new software
+        if data.get("sysobjectid") != self._sysobjectid:
+            reason = "sysObjectID changed"
+        elif int(time.time()) - data.get("timestamp", 0) >= self._ttl:
+            reason = "expired"
+        elif self._sysuptime < data.get("sysuptime", 0):
+            reason = "sysUpTime reset"
+        else:
+            reason = None
+
+        if bool(reason) is True:
+            log_message = "Discarding capability cache for {}: {}".format(
+                self._hostname, reason
+            )
+            log.log2debug(2015, log_message)
+            return
+
+        # Use the cache
+        self._timestamp = data["timestamp"]
+        self._oids = data["oids"]
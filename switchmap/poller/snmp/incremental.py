@@ -0,0 +1,278 @@
+"""Incremental polling of devices whose state hasn't changed."""
+
+import os
+import time
+import json
+
+# Import project libraries
+from switchmap.core import log
+from switchmap.core import files
+from switchmap.core import general
+
+# OID used to detect changes on the device
+IFLASTCHANGE = ".1.3.6.1.2.1.2.2.1.9"
+
+# Interface columns refreshed with GETs when an interface changes state
+IFSTATE = {
+    "ifOperStatus": ".1.3.6.1.2.1.2.2.1.8",
+    "ifAdminStatus": ".1.3.6.1.2.1.2.2.1.7",
+    "ifSpeed": ".1.3.6.1.2.1.2.2.1.5",
+    "ifHighSpeed": ".1.3.6.1.2.1.31.1.1.1.15",
+}
+
+# Sections that only change when interfaces change state. The uptime in
+# the system section is always refreshed.
+STATIC = ["layer2", "system"]
+
+# Sections that hold the MAC and ARP tables. These change without any
+# change of interface state, so they are walked again every
+# incremental_table_interval. The layer1 rows of interfaces that have
+# changed state are refreshed in the meantime.
+DYNAMIC = ["layer1", "layer3"]
+
+
+class State:
+    """Class tracking the state of a device between polls."""
+
+    def __init__(self, snmp_object, config):
+        """Initialize the class.
+
+        Args:
+            snmp_object: SNMP Interact class object from snmp_manager.py
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._snmp_object = snmp_object
+        self._hostname = snmp_object.hostname()
+        self._refresh = config.incremental_refresh_interval()
+        self._tables = config.incremental_table_interval()
+        self._filename = files.state_file(self._hostname, config)
+
+        # Get the state of the device now and at the end of the last poll
+        self._previous = _read(self._filename)
+        self._current = self._fingerprint()
+
+    def reusable(self):
+        """Get the sections of the last poll's data that are still valid.
+
+        Args:
+            None
+
+        Returns:
+            result: List of section names
+
+        """
+        # Initialize key variables
+        result = []
+        previous = self._previous
+        current = self._current
+        now = time.time()
+
+        # Poll everything if there is nothing to compare against, if the
+        # device has rebooted or if interfaces were added or removed
+        if bool(previous) is False or bool(current) is False:
+            return result
+        if current["sysuptime"] < previous["sysuptime"]:
+            return result
+        if set(current["iflastchange"]) != set(previous["iflastchange"]):
+            return result
+
+        # Each section is walked again once it is due a refresh
+        for names, interval in [
+            (STATIC, self._refresh),
+            (DYNAMIC, min(self._tables, self._refresh)),
+        ]:
+            for name in names:
+                if now - previous["walked"].get(name, 0) < interval:
+                    result.append(name)
+
+        # Interfaces going up or down may change VLANs and neighbors
+        if bool(self._changed()) is True:
+            result = [_ for _ in result if _ not in STATIC]
+
+        # Return
+        return sorted(result)
+
+    def section(self, name):
+        """Get a section of the last poll's data.
+
+        Args:
+            name: Name of the section
+
+        Returns:
+            result: Section data
+
+        """
+        # JSON converts integer keys such as ifIndex values to strings.
+        # Convert them back so the data matches freshly polled data.
+        data = general.consistent_keys(
+            {name: self._previous["data"].get(name)}
+        )
+        result = data[name]
+
+        # The uptime always changes. Use the value polled for the
+        # fingerprint rather than the one from the last full poll.
+        if name == "system" and bool(self._current) is True:
+            mib = result.get("SNMPv2-MIB") if bool(result) else None
+            if isinstance(mib, dict) is True and "sysUpTime" in mib:
+                mib["sysUpTime"] = {0: int(self._current["sysuptime"])}
+
+        # Refresh the state of the interfaces that have changed
+        if name == "layer1" and bool(result) is True:
+            for ifindex in self._changed():
+                row = result.get(int(ifindex))
+                if isinstance(row, dict) is True:
+                    self._interface(ifindex, row)
+
+        # Return
+        return result
+
+    def save(self, data, reused):
+        """Save the state of the device for the next poll.
+
+        Args:
+            data: Data polled from the device
+            reused: List of sections reused from the last poll
+
+        Returns:
+            None
+
+        """
+        # Nothing to compare against next time
+        if bool(self._current) is False:
+            return
+
+        # Only walking a section restarts its refresh interval
+        walked = {
+            name: (
+                self._previous["walked"][name]
+                if name in reused
+                else int(time.time())
+            )
+            for name in STATIC + DYNAMIC
+        }
+
+        # Write to a temporary file first so that a partially written
+        # state file is never read
+        state = dict(self._current)
+        state["walked"] = walked
+        state["data"] = data
+        temp_file = "{}.tmp".format(self._filename)
+        try:
+            with open(temp_file, "w") as f_handle:
+                json.dump(state, f_handle)
+            os.replace(temp_file, self._filename)
+        except (OSError, TypeError, ValueError) as error:
+            log_message = """\
+Unable to write poll state file {}. Incremental polling of host {} is \
+disabled until it can be written: {}""".format(
+                self._filename, self._hostname, error
+            )
+            log.log2warning(2017, log_message)
+
+    def _changed(self):
+        """Get the interfaces that changed state since the last poll.
+
+        Args:
+            None
+
+        Returns:
+            result: List of ifIndex strings
+
+        """
+        # Initialize key variables
+        previous = self._previous["iflastchange"]
+
+        # Return
+        result = sorted(
+            ifindex
+            for ifindex, value in self._current["iflastchange"].items()
+            if previous.get(ifindex) != value
+        )
+        return result
+
+    def _interface(self, ifindex, row):
+        """Refresh the state of an interface in layer1 data.
+
+        Args:
+            ifindex: ifIndex of the interface
+            row: layer1 data of the interface
+
+        Returns:
+            None
+
+        """
+        # Only get the columns the device reported in the last poll
+        row["ifLastChange"] = self._current["iflastchange"][ifindex]
+        for title, oid in sorted(IFSTATE.items()):
+            if title in row:
+                values = self._snmp_object.get(
+                    "{}.{}".format(oid, ifindex), normalized=True
+                )
+                row[title] = values.get(ifindex, row[title])
+
+    def _fingerprint(self):
+        """Get the values used to detect changes on the device.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of values, None if they can't be retrieved
+
+        """
+        # Initialize key variables
+        result = None
+
+        # Get the uptime
+        sysuptime = self._snmp_object.sysuptime()
+        if sysuptime is None:
+            return result
+
+        # Get the time of the last state change of each interface
+        iflastchange = self._snmp_object.swalk(IFLASTCHANGE, normalized=True)
+
+        # Return
+        result = {
+            "sysuptime": sysuptime,
+            "iflastchange": {
+                str(key): value for key, value in iflastchange.items()
+            },
+        }
+        return result
+
+
+def _read(filename):
+    """Read the state saved by the last poll.
+
+    Args:
+        filename: Name of state file
+
+    Returns:
+        result: Dict of state, None if there is no valid state
+
+    """
+    # Initialize key variables
+    result = None
+    keys = ["sysuptime", "iflastchange", "walked", "data"]
+
+    # Read the file
+    if os.path.isfile(filename) is True:
+        try:
+            with open(filename, "r") as f_handle:
+                result = json.load(f_handle)
+        except (OSError, ValueError):
+            result = None
+
+    # Ignore corrupted files
+    if isinstance(result, dict) is False or (
+        False in [key in result for key in keys]
+    ):
+        result = None
+
+    # Return
+    return result
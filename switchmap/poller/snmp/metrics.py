@@ -0,0 +1,122 @@
+"""Timing and SNMP statistics for device polls."""
+
+import time
+import threading
+from contextlib import contextmanager
+
+
+class Metrics:
+    """Class collecting where the time of a device poll goes."""
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._lock = threading.Lock()
+        self._start = time.time()
+        self._oids = {}
+        self._timers = {}
+
+    def record(self, oid, seconds=0, rows=0, pdus=0, timeouts=0, retries=0):
+        """Record statistics for an SNMP request.
+
+        Args:
+            oid: OID requested
+            seconds: Time taken by the request
+            rows: Number of rows returned
+            pdus: Number of PDUs exchanged with the device
+            timeouts: Number of timeouts encountered
+            retries: Number of times the request was retried
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            entry = self._oids.setdefault(
+                oid,
+                {
+                    "requests": 0,
+                    "seconds": 0.0,
+                    "rows": 0,
+                    "pdus": 0,
+                    "timeouts": 0,
+                    "retries": 0,
+                },
+            )
+            if bool(seconds) is True:
+                entry["requests"] += 1
+            entry["seconds"] += seconds
+            entry["rows"] += rows
+            entry["pdus"] += pdus
+            entry["timeouts"] += timeouts
+            entry["retries"] += retries
+
+    @contextmanager
+    def timer(self, category, name):
+        """Time a block of code.
+
+        Args:
+            category: Category of the timing, such as "sections" or "mibs"
+            name: Name of the item being timed
+
+        Returns:
+            None
+
+        """
+        started = time.time()
+        try:
+            yield
+        finally:
+            elapsed = time.time() - started
+            with self._lock:
+                timings = self._timers.setdefault(category, {})
+                timings[name] = timings.get(name, 0.0) + elapsed
+
+    def summary(self):
+        """Summarize the statistics collected so far.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of statistics
+
+        """
+        with self._lock:
+            oids = {oid: dict(entry) for oid, entry in self._oids.items()}
+            timers = {
+                category: dict(timings)
+                for category, timings in self._timers.items()
+            }
+
+        # Create totals
+        result = {
+            "duration": round(time.time() - self._start, 3),
+            "requests": 0,
+            "rows": 0,
+            "pdus": 0,
+            "timeouts": 0,
+            "retries": 0,
+        }
+        for entry in oids.values():
+            for key in ["requests", "rows", "pdus", "timeouts", "retries"]:
+                result[key] += entry[key]
+            entry["seconds"] = round(entry["seconds"], 3)
+
+        # Add the details
+        for category, timings in timers.items():
+            result[category] = {
+                name: round(seconds, 3) for name, seconds in timings.items()
+            }
+        result["oids"] = oids
+
+        # Return
+        return result
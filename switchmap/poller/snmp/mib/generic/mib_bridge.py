@@ -1,6 +1,7 @@
 """Class interacts with devices supporting BRIDGE-MIB."""
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from switchmap.poller.snmp.base_query import Query
 from switchmap.core import general
@@ -263,10 +264,7 @@ class BridgeQuery(Query):
 
         # Process values
         oid = ".1.3.6.1.2.1.17.4.3.1.2"
-        for context_name in context_names:
-            results = self._snmp_object.swalk(
-                oid, normalized=False, context_name=context_name
-            )
+        for results in self._swalk_contexts(oid, context_names):
             for key, value in results.items():
                 new_key = key[len(oid) :]
                 data_dict[new_key] = value
@@ -332,10 +330,7 @@ class BridgeQuery(Query):
 
         # Process values
         oid = ".1.3.6.1.2.1.17.4.3.1.1"
-        for context_name in context_names:
-            results = self._snmp_object.swalk(
-                oid, normalized=False, context_name=context_name
-            )
+        for results in self._swalk_contexts(oid, context_names):
             for key, mac_value in results.items():
                 # Assign the mac address to the dictionary
                 new_key = key[len(oid) :]
@@ -376,6 +371,48 @@ class BridgeQuery(Query):
         # Return data
         return data_dict
 
+    def _swalk_contexts(self, oid, context_names):
+        """Walk an OID in several SNMP contexts concurrently.
+
+        Args:
+            oid: OID to walk
+            context_names: List of context names
+
+        Returns:
+            results: List of walk results in the same order as context_names
+
+        """
+        # Initialize key variables
+        workers = min(len(context_names), self._snmp_object.concurrency())
+
+        # Walk each context in turn if the device can only handle one
+        # request at a time
+        if workers <= 1:
+            results = [
+                self._snmp_object.swalk(
+                    oid, normalized=False, context_name=context_name
+                )
+                for context_name in context_names
+            ]
+
+        else:
+            # Results are collected in the order of the context names, so
+            # merging them gives the same outcome as walking sequentially
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._snmp_object.swalk,
+                        oid,
+                        normalized=False,
+                        context_name=context_name,
+                    )
+                    for context_name in context_names
+                ]
+                results = [future.result() for future in futures]
+
+        # Return
+        return results
+
     def _cisco_context_style(self, vlan):
         """Return style value to use to query VLAN data on a cisco switch.
 
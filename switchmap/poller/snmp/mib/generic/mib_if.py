@@ -97,63 +97,44 @@ class IfQuery(Query):
         """
         # Initialize key variables
         final = defaultdict(lambda: defaultdict(dict))
-
-        # Get interface ifDescr data
-        _get_data("ifDescr", self.ifdescr, final)
-
-        # Get interface ifAlias data
-        _get_data("ifAlias", self.ifalias, final)
-
-        # Get interface ifSpeed data
-        _get_data("ifSpeed", self.ifspeed, final)
-
-        # Get interface ifOperStatus data
-        _get_data("ifOperStatus", self.ifoperstatus, final)
-
-        # Get interface ifAdminStatus data
-        _get_data("ifAdminStatus", self.ifadminstatus, final)
-
-        # Get interface ifType data
-        _get_data("ifType", self.iftype, final)
-
-        # Get interface ifName data
-        _get_data("ifName", self.ifname, final)
-
-        # Get interface ifIndex data
-        _get_data("ifIndex", self.ifindex, final)
-
-        # Get interface ifPhysAddress data
-        _get_data("ifPhysAddress", self.ifphysaddress, final)
-
-        # Get interface ifInOctets data
-        _get_data("ifInOctets", self.ifinoctets, final)
-
-        # Get interface ifOutOctets data
-        _get_data("ifOutOctets", self.ifoutoctets, final)
-
-        # Get interface ifInBroadcastPkts data
-        _get_data("ifInBroadcastPkts", self.ifinbroadcastpkts, final)
-
-        # Get interface ifOutBroadcastPkts data
-        _get_data("ifOutBroadcastPkts", self.ifoutbroadcastpkts, final)
-
-        # Get interface ifInMulticastPkts data
-        _get_data("ifInMulticastPkts", self.ifinmulticastpkts, final)
-
-        # Get interface ifOutMulticastPkts data
-        _get_data("ifOutMulticastPkts", self.ifoutmulticastpkts, final)
-
-        # Get interface ifLastChange data
-        _get_data("ifLastChange", self.iflastchange, final)
+        columns = [
+            ("ifDescr", self.ifdescr),
+            ("ifAlias", self.ifalias),
+            ("ifSpeed", self.ifspeed),
+            ("ifOperStatus", self.ifoperstatus),
+            ("ifAdminStatus", self.ifadminstatus),
+            ("ifType", self.iftype),
+            ("ifName", self.ifname),
+            ("ifIndex", self.ifindex),
+            ("ifPhysAddress", self.ifphysaddress),
+            ("ifInOctets", self.ifinoctets),
+            ("ifOutOctets", self.ifoutoctets),
+            ("ifInBroadcastPkts", self.ifinbroadcastpkts),
+            ("ifOutBroadcastPkts", self.ifoutbroadcastpkts),
+            ("ifInMulticastPkts", self.ifinmulticastpkts),
+            ("ifOutMulticastPkts", self.ifoutmulticastpkts),
+            ("ifLastChange", self.iflastchange),
+        ]
+
+        # Walk all the columns of the table in a single pass
+        table = self.snmp_object.table(
+            [func(oidonly=True) for _, func in columns], normalized=True
+        )
+
+        # Get interface data
+        for title, func in columns:
+            _get_data(title, func, final, table=table)
 
         # Return
         return final
 
-    def iflastchange(self, oidonly=False):
+    def iflastchange(self, oidonly=False, results=None):
         """Return dict of IFMIB ifLastChange for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifLastChange using the oid's last node as key
@@ -170,7 +151,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -178,12 +160,14 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifinoctets(self, safe=False, oidonly=False):
+    def ifinoctets(self, safe=False, oidonly=False, results=None):
         """Return dict of IFMIB ifInOctets for each ifIndex for device.
 
         Args:
             safe: Do a failsafe walk if True
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifInOctets using the oid's last node as key
@@ -200,10 +184,11 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        if safe is False:
-            results = self.snmp_object.swalk(oid, normalized=True)
-        else:
-            results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            if safe is False:
+                results = self.snmp_object.swalk(oid, normalized=True)
+            else:
+                results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -211,12 +196,14 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifoutoctets(self, safe=False, oidonly=False):
+    def ifoutoctets(self, safe=False, oidonly=False, results=None):
         """Return dict of IFMIB ifOutOctets for each ifIndex for device.
 
         Args:
             safe: Do a failsafe walk if True
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifOutOctets using the oid's last node as key
@@ -233,10 +220,11 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        if safe is False:
-            results = self.snmp_object.swalk(oid, normalized=True)
-        else:
-            results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            if safe is False:
+                results = self.snmp_object.swalk(oid, normalized=True)
+            else:
+                results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -244,12 +232,14 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifdescr(self, safe=False, oidonly=False):
+    def ifdescr(self, safe=False, oidonly=False, results=None):
         """Return dict of IFMIB ifDescr for each ifIndex for device.
 
         Args:
             safe: Do a failsafe walk if True
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifDescr using the oid's last node as key
@@ -266,10 +256,11 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        if safe is False:
-            results = self.snmp_object.swalk(oid, normalized=True)
-        else:
-            results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            if safe is False:
+                results = self.snmp_object.swalk(oid, normalized=True)
+            else:
+                results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = str(bytes(value), encoding="utf-8")
@@ -277,11 +268,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def iftype(self, oidonly=False):
+    def iftype(self, oidonly=False, results=None):
         """Return dict of IFMIB ifType for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifType using the oid's last node as key
@@ -298,7 +291,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -306,11 +300,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifspeed(self, oidonly=False):
+    def ifspeed(self, oidonly=False, results=None):
         """Return dict of IFMIB ifSpeed for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifSpeed using the oid's last node as key
@@ -327,7 +323,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -335,11 +332,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifadminstatus(self, oidonly=False):
+    def ifadminstatus(self, oidonly=False, results=None):
         """Return dict of IFMIB ifAdminStatus for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifAdminStatus using the oid's last node as key
@@ -356,7 +355,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -364,11 +364,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifoperstatus(self, oidonly=False):
+    def ifoperstatus(self, oidonly=False, results=None):
         """Return dict of IFMIB ifOperStatus for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifOperStatus using the oid's last node as key
@@ -385,7 +387,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -393,11 +396,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifalias(self, oidonly=False):
+    def ifalias(self, oidonly=False, results=None):
         """Return dict of IFMIB ifAlias for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifAlias using the oid's last node as key
@@ -414,7 +419,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = str(bytes(value), encoding="utf-8")
@@ -422,11 +428,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifname(self, oidonly=False):
+    def ifname(self, oidonly=False, results=None):
         """Return dict of IFMIB ifName for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifName using the oid's last node as key
@@ -443,7 +451,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = str(bytes(value), encoding="utf-8")
@@ -451,11 +460,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifindex(self, oidonly=False):
+    def ifindex(self, oidonly=False, results=None):
         """Return dict of IFMIB ifindex for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifindex using the oid's last node as key
@@ -472,7 +483,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -480,11 +492,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifphysaddress(self, oidonly=False):
+    def ifphysaddress(self, oidonly=False, results=None):
         """Return dict of IFMIB ifPhysAddress for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifPhysAddress using the oid's last node as key
@@ -501,7 +515,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID to get MAC address
             data_dict[int(key)] = general.octetstr_2_string(value)
@@ -509,11 +524,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifinmulticastpkts(self, oidonly=False):
+    def ifinmulticastpkts(self, oidonly=False, results=None):
         """Return dict of IFMIB ifInMulticastPkts for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifInMulticastPkts. Key = OID's last node.
@@ -530,7 +547,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -538,11 +556,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifoutmulticastpkts(self, oidonly=False):
+    def ifoutmulticastpkts(self, oidonly=False, results=None):
         """Return dict of IFMIB ifOutMulticastPkts for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifOutMulticastPkts. Key = OID's last node.
@@ -559,7 +579,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -567,11 +588,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifinbroadcastpkts(self, oidonly=False):
+    def ifinbroadcastpkts(self, oidonly=False, results=None):
         """Return dict of IFMIB ifInBroadcastPkts for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifInBroadcastPkts. Key = OID's last node.
@@ -588,7 +611,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -596,11 +620,13 @@ class IfQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifoutbroadcastpkts(self, oidonly=False):
+    def ifoutbroadcastpkts(self, oidonly=False, results=None):
         """Return dict of IFMIB ifOutBroadcastPkts for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifOutBroadcastPkts. Key = OID's last node.
@@ -617,7 +643,8 @@ class IfQuery(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -715,20 +742,25 @@ class IfQuery(Query):
         return final
 
 
-def _get_data(title, func, dest):
+def _get_data(title, func, dest, table=None):
     """Populate dest with data from the given function.
 
     Args:
         title: The name of the data
         func: The function which will return the data
         dest: a dict which will store the data
+        table: Results of Interact.table() that include the function's
+            OID. The function walks the OID itself if None
 
     Returns:
         dest: The modified destination dict
 
     """
     # Get interface data
-    values = func()
+    if table is None:
+        values = func()
+    else:
+        values = func(results=table.get(func(oidonly=True)))
     for key, value in values.items():
         dest[key][title] = value
 
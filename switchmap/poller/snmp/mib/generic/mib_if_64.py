@@ -98,42 +98,37 @@ class If64Query(Query):
         """
         # Initialize key variables
         final = defaultdict(lambda: defaultdict(dict))
-
-        # Get interface ifHCOutBroadcastPkts data
-        _get_data("ifHCOutBroadcastPkts", self.ifhcoutbroadcastpkts, final)
-
-        # Get interface ifHCOutMulticastPkts data
-        _get_data("ifHCOutMulticastPkts", self.ifhcoutmulticastpkts, final)
-
-        # Get interface ifHCOutUcastPkts data
-        _get_data("ifHCOutUcastPkts", self.ifhcoutucastpkts, final)
-
-        # Get interface ifHCOutOctets data
-        _get_data("ifHCOutOctets", self.ifhcoutoctets, final)
-
-        # Get interface ifHCInBroadcastPkts data
-        _get_data("ifHCInBroadcastPkts", self.ifhcinbroadcastpkts, final)
-
-        # Get interface ifHCInMulticastPkts data
-        _get_data("ifHCInMulticastPkts", self.ifhcinmulticastpkts, final)
-
-        # Get interface ifHCInUcastPkts data
-        _get_data("ifHCInUcastPkts", self.ifhcinucastpkts, final)
-
-        # Get interface ifHCInOctets data
-        _get_data("ifHCInOctets", self.ifhcinoctets, final)
-
-        # Get interface ifHighSpeed data
-        _get_data("ifHighSpeed", self.ifhighspeed, final)
+        columns = [
+            ("ifHCOutBroadcastPkts", self.ifhcoutbroadcastpkts),
+            ("ifHCOutMulticastPkts", self.ifhcoutmulticastpkts),
+            ("ifHCOutUcastPkts", self.ifhcoutucastpkts),
+            ("ifHCOutOctets", self.ifhcoutoctets),
+            ("ifHCInBroadcastPkts", self.ifhcinbroadcastpkts),
+            ("ifHCInMulticastPkts", self.ifhcinmulticastpkts),
+            ("ifHCInUcastPkts", self.ifhcinucastpkts),
+            ("ifHCInOctets", self.ifhcinoctets),
+            ("ifHighSpeed", self.ifhighspeed),
+        ]
+
+        # Walk all the columns of the table in a single pass
+        table = self.snmp_object.table(
+            [func(oidonly=True) for _, func in columns], normalized=True
+        )
+
+        # Get interface data
+        for title, func in columns:
+            _get_data(title, func, final, table=table)
 
         # Return
         return final
 
-    def ifhighspeed(self, oidonly=False):
+    def ifhighspeed(self, oidonly=False, results=None):
         """Return dict of IFMIB ifHighSpeed for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifHighSpeed using the oid's last node as key
@@ -150,7 +145,8 @@ class If64Query(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -158,11 +154,13 @@ class If64Query(Query):
         # Return the interface descriptions
         return data_dict
 
-    def ifhcinucastpkts(self, oidonly=False):
+    def ifhcinucastpkts(self, oidonly=False, results=None):
         """Return dict of IFMIB ifHCInUcastPkts for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifHCInUcastPkts using the oid's last node as key
@@ -179,7 +177,8 @@ class If64Query(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -187,11 +186,13 @@ class If64Query(Query):
         # Return
         return data_dict
 
-    def ifhcoutucastpkts(self, oidonly=False):
+    def ifhcoutucastpkts(self, oidonly=False, results=None):
         """Return dict of IFMIB ifHCOutUcastPkts for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifHCOutUcastPkts. Key = OID's last node.
@@ -208,7 +209,8 @@ class If64Query(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -216,11 +218,13 @@ class If64Query(Query):
         # Return
         return data_dict
 
-    def ifhcinmulticastpkts(self, oidonly=False):
+    def ifhcinmulticastpkts(self, oidonly=False, results=None):
         """Return dict of IFMIB ifHCInMulticastPkts for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifHCInMulticastPkts. Key = OID's last node.
@@ -237,7 +241,8 @@ class If64Query(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -245,13 +250,15 @@ class If64Query(Query):
         # Return
         return data_dict
 
-    def ifhcoutmulticastpkts(self, oidonly=False):
+    def ifhcoutmulticastpkts(self, oidonly=False, results=None):
         """Return dict of IFMIB ifHCOutMulticastPkts.
 
         Keyed by ifIndex for the device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifHCOutMulticastPkts. Key = OID's last node.
@@ -268,7 +275,8 @@ class If64Query(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -276,11 +284,13 @@ class If64Query(Query):
         # Return
         return data_dict
 
-    def ifhcinbroadcastpkts(self, oidonly=False):
+    def ifhcinbroadcastpkts(self, oidonly=False, results=None):
         """Return dict of IFMIB ifHCInBroadcastPkts for each ifIndex for device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifHCInBroadcastPkts. Key = OID's last node.
@@ -297,7 +307,8 @@ class If64Query(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -305,13 +316,15 @@ class If64Query(Query):
         # Return
         return data_dict
 
-    def ifhcoutbroadcastpkts(self, oidonly=False):
+    def ifhcoutbroadcastpkts(self, oidonly=False, results=None):
         """Return dict of IFMIB ifHCOutBroadcastPkts.
 
         Keyed by ifIndex for the device.
 
         Args:
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifHCOutBroadcastPkts. Key = OID's last node.
@@ -328,7 +341,8 @@ class If64Query(Query):
             return oid
 
         # Process results
-        results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -336,12 +350,14 @@ class If64Query(Query):
         # Return
         return data_dict
 
-    def ifhcinoctets(self, safe=False, oidonly=False):
+    def ifhcinoctets(self, safe=False, oidonly=False, results=None):
         """Return dict of IFMIB ifHCInOctets for each ifIndex for device.
 
         Args:
             safe: Do a failsafe walk if True
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifHCInOctets. Key = OID's last node.
@@ -358,10 +374,11 @@ class If64Query(Query):
             return oid
 
         # Process results
-        if safe is False:
-            results = self.snmp_object.swalk(oid, normalized=True)
-        else:
-            results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            if safe is False:
+                results = self.snmp_object.swalk(oid, normalized=True)
+            else:
+                results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -369,12 +386,14 @@ class If64Query(Query):
         # Return
         return data_dict
 
-    def ifhcoutoctets(self, safe=False, oidonly=False):
+    def ifhcoutoctets(self, safe=False, oidonly=False, results=None):
         """Return dict of IFMIB ifHCOutOctets for each ifIndex for device.
 
         Args:
             safe: Do a failsafe walk if True
             oidonly: Return OID's value, not results, if True
+            results: Normalized walk results already fetched for the OID.
+                The OID is walked if None
 
         Returns:
             data_dict: Dict of ifHCOutOctets. Key = OID's last node.
@@ -391,10 +410,11 @@ class If64Query(Query):
             return oid
 
         # Process results
-        if safe is False:
-            results = self.snmp_object.swalk(oid, normalized=True)
-        else:
-            results = self.snmp_object.swalk(oid, normalized=True)
+        if results is None:
+            if safe is False:
+                results = self.snmp_object.swalk(oid, normalized=True)
+            else:
+                results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
             data_dict[int(key)] = value
@@ -403,20 +423,25 @@ class If64Query(Query):
         return data_dict
 
 
-def _get_data(title, func, dest):
+def _get_data(title, func, dest, table=None):
     """Populate dest with data from the given function.
 
     Args:
         title: The name of the data
         func: The function which will return the data
         dest: a dict which will store the data
+        table: Results of Interact.table() that include the function's
+            OID. The function walks the OID itself if None
 
     Returns:
         dest: The modified destination dict
 
     """
     # Process data
-    values = func()
+    if table is None:
+        values = func()
+    else:
+        values = func(results=table.get(func(oidonly=True)))
     for key, value in values.items():
         dest[key][title] = value
 
@@ -1,11 +1,16 @@
 """SNMP Poller module."""
 
+# Standard libraries
+import os
+import json
+
 # Switchmap imports
 from switchmap.poller.configuration import ConfigPoller
 from switchmap.poller import POLLING_OPTIONS, SNMP, POLL
 from . import snmp_info
 from . import snmp_manager
 from switchmap.core import log
+from switchmap.core import files
 
 
 class Poll:
@@ -53,7 +58,8 @@ class Poll:
                 POLL(
                     hostname=hostname,
                     authorization=authorization,
-                )
+                ),
+                concurrency=self._server_config.device_concurrency(),
             )
         else:
             log_message = (
@@ -86,12 +92,61 @@ Querying topology data from host {}.""".format(
         )
         log.log2info(1078, log_message)
 
-        # Return the data polled from the device
+        # Return the data polled from the device. The SNMP sessions are
+        # reused for the entire poll and released when it completes.
         status = snmp_info.Query(self._snmp_object)
-        _data = status.everything()
+        try:
+            _data = status.everything()
+        finally:
+            self._snmp_object.close()
+
+        # Export the statistics of the poll
+        if bool(_data) is True:
+            _export_metrics(
+                self._hostname, _data["misc"]["metrics"], self._server_config
+            )
         return _data
 
 
+def _export_metrics(hostname, summary, config):
+    """Log and save the statistics of a device poll.
+
+    Args:
+        hostname: Hostname polled
+        summary: Dict of statistics from metrics.Metrics.summary()
+        config: ConfigPoller object
+
+    Returns:
+        None
+
+    """
+    # Log a summary
+    log_message = """\
+Polled host {} in {}s. Requests: {}, PDUs: {}, rows: {}, timeouts: {}, \
+retries: {}""".format(
+        hostname,
+        summary["duration"],
+        summary["requests"],
+        summary["pdus"],
+        summary["rows"],
+        summary["timeouts"],
+        summary["retries"],
+    )
+    log.log2debug(2018, log_message)
+
+    # Write to a temporary file first so that readers never see a partially
+    # written file
+    filename = files.metrics_file(hostname, config)
+    temp_file = "{}.tmp".format(filename)
+    try:
+        with open(temp_file, "w") as f_handle:
+            json.dump({hostname: summary}, f_handle, indent=2)
+        os.replace(temp_file, filename)
+    except OSError:
+        log_message = "Unable to write poll metrics file {}".format(filename)
+        log.log2warning(2019, log_message)
+
+
 def _do_poll(authorization):
     """Determine whether doing a poll is valid.
 
@@ -3,8 +3,10 @@
 import time
 from collections import defaultdict
 
+from switchmap.poller.configuration import ConfigPoller
 from . import iana_enterprise
 from . import get_queries
+from . import incremental
 
 
 class Query:
@@ -43,13 +45,36 @@ class Query:
         """
         # Initialize key variables
         data = {}
+        state = None
+        reused = []
+        config = ConfigPoller()
+
+        # Find the sections of the last poll's data that are still valid
+        if config.incremental_polling() is True:
+            state = incremental.State(self.snmp_object, config)
+            reused = state.reusable()
 
         # Append data
         data["misc"] = self.misc()
-        data["layer1"] = self.layer1()
-        data["layer2"] = self.layer2()
-        data["layer3"] = self.layer3()
-        data["system"] = self.system()
+        for section, method in [
+            ("layer1", self.layer1),
+            ("layer2", self.layer2),
+            ("layer3", self.layer3),
+            ("system", self.system),
+        ]:
+            if section in reused:
+                data[section] = state.section(section)
+            else:
+                with self.snmp_object.metrics().timer("sections", section):
+                    data[section] = method()
+
+        # Save the state for the next poll
+        if state is not None:
+            data["misc"]["incremental"] = reused
+            state.save(data, reused)
+
+        # Report where the time went
+        data["misc"]["metrics"] = self.snmp_object.metrics().summary()
 
         # Return
         return data
@@ -96,9 +121,12 @@ class Query:
         for item in [
             Query(self.snmp_object) for Query in get_queries("system")
         ]:
-            if item.supported():
-                processed = True
-                data = _add_system(item, data)
+            with self.snmp_object.metrics().timer(
+                "mibs", "system.{}".format(item.__class__.__name__)
+            ):
+                if item.supported():
+                    processed = True
+                    data = _add_system(item, data)
 
         # Return
         if processed is True:
@@ -125,9 +153,12 @@ class Query:
         for item in [
             Query(self.snmp_object) for Query in get_queries("layer1")
         ]:
-            if item.supported():
-                processed = True
-                data = _add_layer1(item, data)
+            with self.snmp_object.metrics().timer(
+                "mibs", "layer1.{}".format(item.__class__.__name__)
+            ):
+                if item.supported():
+                    processed = True
+                    data = _add_layer1(item, data)
 
         # Return
         if processed is True:
@@ -152,9 +183,12 @@ class Query:
         for item in [
             Query(self.snmp_object) for Query in get_queries("layer2")
         ]:
-            if item.supported():
-                processed = True
-                data = _add_layer2(item, data)
+            with self.snmp_object.metrics().timer(
+                "mibs", "layer2.{}".format(item.__class__.__name__)
+            ):
+                if item.supported():
+                    processed = True
+                    data = _add_layer2(item, data)
 
         # Return
         if processed is True:
@@ -179,9 +213,12 @@ class Query:
         for item in [
             Query(self.snmp_object) for Query in get_queries("layer3")
         ]:
-            if item.supported():
-                processed = True
-                data = _add_layer3(item, data)
+            with self.snmp_object.metrics().timer(
+                "mibs", "layer3.{}".format(item.__class__.__name__)
+            ):
+                if item.supported():
+                    processed = True
+                    data = _add_layer3(item, data)
 
         # Return
         if processed is True:
@@ -2,6 +2,9 @@
 
 import os
 import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import easysnmp
 from easysnmp import exceptions
@@ -12,6 +15,27 @@ from switchmap.poller import POLL
 from switchmap.core import log
 from switchmap.core import files
 from . import iana_enterprise
+from . import capability
+from . import metrics
+
+# Bounds for the number of rows requested in each GETBULK PDU. Devices start
+# at the maximum and back off towards the minimum if they can't cope.
+MAX_REPETITIONS = 100
+MIN_REPETITIONS = 5
+
+# Seconds after which a device that was backed off is tried with larger
+# PDUs again
+PROBE_INTERVAL = 86400
+
+# Maximum number of SNMP credential probes running at once across all the
+# devices polled by the process. Probes that lose the race keep running
+# until they time out, so the threads are shared rather than created for
+# each device.
+PROBE_WORKERS = 32
+
+# Credential probe threads of the current process
+_PROBES = {"pid": None, "executor": None}
+_PROBES_LOCK = threading.Lock()
 
 
 class Validate:
@@ -41,9 +65,22 @@ class Validate:
         """
         # Initialize key variables
         cache_exists = False
+        config = ConfigPoller()
+
+        # Skip devices that recently failed to respond to every credential
+        unreachable = files.unreachable_file(self._options.hostname, config)
+        ttl = config.unreachable_cache_ttl()
+        if _recently_unreachable(unreachable, ttl) is True:
+            log_message = """\
+Skipping host {}. No SNMP credentials worked within the last {}s\
+""".format(
+                self._options.hostname, ttl
+            )
+            log.log2debug(2016, log_message)
+            return None
 
         # Create cache directory / file if not yet created
-        filename = files.snmp_file(self._options.hostname, ConfigPoller())
+        filename = files.snmp_file(self._options.hostname, config)
         if os.path.exists(filename) is True:
             cache_exists = True
 
@@ -73,6 +110,9 @@ class Validate:
             if bool(authentication):
                 _update_cache(filename, authentication.group)
 
+        # Remember devices for which no credentials worked
+        _update_unreachable(unreachable, bool(authentication))
+
         # Return
         return authentication
 
@@ -90,50 +130,116 @@ class Validate:
         # Initialize key variables
         result = None
 
-        # Probe device with all SNMP options
-        for authorization in self._options.authorizations:
-            # Only process enabled SNMP values
-            if bool(authorization.enabled) is False:
-                continue
-
-            # Setup contact with the remote device
-            device = Interact(
-                POLL(
-                    hostname=self._options.hostname,
-                    authorization=authorization,
-                )
-            )
-
-            # Try successive groups
-            if group is None:
-                # Verify connectivity
-                if device.contactable() is True:
+        # Only probe the enabled credentials in the group, if specified
+        authorizations = [
+            authorization
+            for authorization in self._options.authorizations
+            if bool(authorization.enabled) is True
+            and (group is None or authorization.group == group)
+        ]
+
+        # Nothing to probe concurrently
+        if len(authorizations) <= 1:
+            for authorization in authorizations:
+                if self._contactable(authorization) is True:
                     result = authorization
+            return result
+
+        # Probe with all the credentials at once. Each wrong credential
+        # costs a full SNMP timeout, so trying them in turn is slow.
+        executor = _probe_executor()
+        futures = {
+            executor.submit(self._contactable, authorization): authorization
+            for authorization in authorizations
+        }
+        try:
+            for future in as_completed(futures):
+                if future.result() is True:
+                    result = futures[future]
                     break
-            else:
-                if authorization.group == group:
-                    # Verify connectivity
-                    if device.contactable() is True:
-                        result = authorization
+        finally:
+            # Don't wait for the remaining probes to time out. Drop those
+            # that haven't started yet.
+            for future in futures:
+                future.cancel()
 
         # Return
         return result
 
+    def _contactable(self, authorization):
+        """Determine whether a device responds to an SNMP authorization.
+
+        Args:
+            authorization: SNMP authorization object to try
+
+        Returns:
+            contactable: True if the device responds
+
+        """
+        # Setup contact with the remote device
+        device = Interact(
+            POLL(
+                hostname=self._options.hostname,
+                authorization=authorization,
+            )
+        )
+
+        # Verify connectivity
+        try:
+            contactable = device.contactable()
+        finally:
+            device.close()
+
+        # Return
+        return contactable
+
 
 class Interact:
     """Class Gets SNMP data."""
 
-    def __init__(self, _poll):
+    def __init__(self, _poll, concurrency=1):
         """Initialize the Interact class.
 
         Args:
             _poll: POLL object containing SNMP configuration and target info
+            concurrency: Maximum number of SNMP requests that may be in
+                flight to the device at any one time
 
         Returns:
             None
         """
         # Initialize key variables
         self._poll = _poll
+        self._concurrency = max(1, int(concurrency))
+
+        # Limit the number of requests in flight to the device. easysnmp
+        # sessions are not thread safe, so each one also gets its own lock.
+        self._inflight = threading.BoundedSemaphore(self._concurrency)
+        self._lock = threading.Lock()
+        self._locks = {}
+
+        # SNMP sessions keyed by context name. These are reused for the
+        # duration of the device poll to avoid the overhead of creating a
+        # new session, and SNMPv3 engine discovery, for every query
+        self._sessions = {}
+
+        # Context names whose sessions have answered at least one query
+        self._verified = set()
+
+        # GETBULK max-repetitions learned for the device. Read from the
+        # cache file on first use. The value in the file is only updated
+        # once a request of the new size has succeeded.
+        self._max_repetitions = None
+        self._saved_repetitions = None
+        self._probing = False
+
+        # Timing and SNMP statistics for the poll
+        self._metrics = metrics.Metrics()
+
+        # Cache of the MIBs the device supports. Loaded on first use.
+        self._capabilities = None
+        self._capabilities_loaded = False
+        self._capabilities_lock = threading.Lock()
 
         # Fail if there is no authentication
         if bool(self._poll.authorization) is False:
@@ -142,6 +248,112 @@ class Interact:
             )
             log.log2die(1045, log_message)
 
+    def close(self):
+        """Close all cached SNMP sessions.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        # easysnmp frees its session resources when the Session object is
+        # garbage collected, so dropping the references is sufficient
+        with self._lock:
+            self._sessions.clear()
+            self._verified.clear()
+
+        # Save the MIBs found to be supported during the poll
+        with self._capabilities_lock:
+            if self._capabilities is not None:
+                self._capabilities.save()
+            self._capabilities = None
+            self._capabilities_loaded = False
+
+    def metrics(self):
+        """Get the timing and SNMP statistics collected for the device.
+
+        Args:
+            None
+
+        Returns:
+            result: metrics.Metrics object
+
+        """
+        # Return
+        result = self._metrics
+        return result
+
+    def max_repetitions(self):
+        """Get the GETBULK max-repetitions to use for the device.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of rows to request per GETBULK PDU
+
+        """
+        # Read the value learned during previous polls
+        with self._lock:
+            if self._max_repetitions is None:
+                filename = files.bulk_file(self._poll.hostname, ConfigPoller())
+                self._saved_repetitions = _read_repetitions(filename)
+                self._max_repetitions = self._saved_repetitions
+
+                # Periodically try larger PDUs in case the device's problem
+                # was temporary
+                if (
+                    self._max_repetitions < MAX_REPETITIONS
+                    and time.time() - os.path.getmtime(filename)
+                    > PROBE_INTERVAL
+                ):
+                    self._max_repetitions = min(
+                        MAX_REPETITIONS, self._max_repetitions * 2
+                    )
+                    self._probing = True
+            result = self._max_repetitions
+
+        # Return
+        return result
+
+    def concurrency(self):
+        """Get the maximum number of concurrent requests to the device.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of requests in flight
+
+        """
+        # Return
+        result = self._concurrency
+        return result
+
+    def session(self, context_name=""):
+        """Get the cached SNMP session for a context, creating it if needed.
+
+        Args:
+            context_name: String containing SNMPv3 context name.
+                Default is empty string.
+
+        Returns:
+            session: SNMP session
+
+        """
+        # Create the session if it doesn't already exist
+        with self._lock:
+            session = self._sessions.get(context_name)
+            if session is None:
+                session = _Session(
+                    self._poll, context_name=context_name
+                ).session
+                self._sessions[context_name] = session
+
+        # Return
+        return session
+
     def enterprise_number(self):
         """Get SNMP enterprise number for the device.
 
@@ -233,6 +445,28 @@ class Interact:
         # Return
         return object_id
 
+    def sysuptime(self):
+        """Get the sysUpTime of the device.
+
+        Args:
+            None
+
+        Returns:
+            result: sysUpTime in hundredths of a second, or None if not
+                available
+        """
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.1.3.0"
+        result = None
+
+        # Get sysUpTime
+        results = self.get(oid, check_reachability=True)
+        if bool(results) is True:
+            result = results[oid]
+
+        # Return
+        return result
+
     def oid_exists(self, oid_to_get, context_name=""):
         """Determine if an OID exists on the device.
 
@@ -246,21 +480,65 @@ class Interact:
         """
         # Initialize key variables
         validity = False
+        cache = None
+
+        # Use the result of a previous poll. VLAN contexts come and go, so
+        # only the default context is cached.
+        if bool(context_name) is False:
+            cache = self._capability_cache()
+            if cache is not None:
+                cached = cache.get(oid_to_get)
+                if cached is not None:
+                    return cached
 
         # Validate OID
-        if self._oid_exists_get(oid_to_get, context_name=context_name) is True:
-            validity = True
+        validity, definitive = self._oid_exists_get(
+            oid_to_get, context_name=context_name
+        )
 
         if validity is False:
-            if (
-                self._oid_exists_walk(oid_to_get, context_name=context_name)
-                is True
-            ):
-                validity = True
+            validity, walked = self._oid_exists_walk(
+                oid_to_get, context_name=context_name
+            )
+            definitive = validity or (definitive and walked)
+
+        # Update the cache. Failures caused by timeouts or other errors may
+        # be temporary, so only answers given by the device are cached.
+        if cache is not None and definitive is True:
+            cache.set(oid_to_get, validity)
 
         # Return
         return validity
 
+    def _capability_cache(self):
+        """Get the cache of the MIBs supported by the device.
+
+        Args:
+            None
+
+        Returns:
+            result: capability.Cache object, None if the device can't be
+                identified
+
+        """
+        with self._capabilities_lock:
+            # Load the cache
+            if self._capabilities_loaded is False:
+                self._capabilities_loaded = True
+                sysobjectid = self.sysobjectid(check_reachability=True)
+                sysuptime = self.sysuptime()
+                if bool(sysobjectid) is True and sysuptime is not None:
+                    self._capabilities = capability.Cache(
+                        self._poll.hostname,
+                        sysobjectid,
+                        sysuptime,
+                        ConfigPoller(),
+                    )
+
+            # Return
+            result = self._capabilities
+            return result
+
     def _oid_exists_get(self, oid_to_get, context_name=""):
         """Determine existence of OID on device.
 
@@ -271,14 +549,16 @@ class Interact:
                 defContext token in the snmp.conf file.
 
         Returns:
-            validity: True if exists
+            result: Tuple of (validity, definitive). validity is True if
+                the OID exists. definitive is False if the device didn't
+                answer
 
         """
         # Initialize key variables
         validity = False
 
         # Process
-        (_, validity, result) = self.query(
+        (_contactable, validity, result) = self.query(
             oid_to_get,
             get=True,
             check_reachability=True,
@@ -294,7 +574,8 @@ class Interact:
                 validity = False
 
         # Return
-        return validity
+        result = (validity, _contactable is True)
+        return result
 
     def _oid_exists_walk(self, oid_to_get, context_name=""):
         """Determine existence of OID on device.
@@ -306,14 +587,16 @@ class Interact:
                 defContext token in the snmp.conf file.
 
         Returns:
-            validity: True if exists
+            result: Tuple of (validity, definitive). validity is True if
+                the OID exists. definitive is False if the device didn't
+                answer
 
         """
         # Initialize key variables
         validity = False
 
         # Process
-        (_, validity, results) = self.query(
+        (_contactable, validity, results) = self.query(
             oid_to_get,
             get=False,
             check_reachability=True,
@@ -329,7 +612,8 @@ class Interact:
                     break
 
         # Return
-        return validity
+        result = (validity, _contactable is True)
+        return result
 
     def swalk(self, oid_to_get, normalized=False, context_name=""):
         """Perform a safe SNMPwalk that handles errors gracefully.
@@ -362,6 +646,83 @@ class Interact:
         # Return
         return results
 
+    def table(self, oids, normalized=False, context_name=""):
+        """Walk several columns of a conceptual table in a single pass.
+
+        The columns are fetched together in one stream of interleaved
+        GETBULK requests instead of one walk per column.
+
+        Args:
+            oids: List of column OIDs to walk
+            normalized: If True, then return results as a dict keyed by
+                only the last node of an OID, otherwise return results
+                keyed by the entire OID string.
+            context_name: Set the contextName used for SNMPv3 messages.
+                The default contextName is the empty string "".  Overrides the
+                defContext token in the snmp.conf file.
+
+        Returns:
+            result: Dict keyed by column OID. Each value is a dict of the
+                column's results formatted the same way as swalk()
+
+        """
+        # Initialize key variables
+        result = {}
+
+        # Check if the OIDs are valid
+        for oid in oids:
+            if _oid_valid_format(oid) is False:
+                log_message = "OID {} has an invalid format".format(oid)
+                log.log2die(2011, log_message)
+
+        # GETBULK is not supported in SNMPv1
+        if self._poll.authorization.version == 1:
+            for oid in oids:
+                result[oid] = self.swalk(
+                    oid, normalized=normalized, context_name=context_name
+                )
+            return result
+
+        # Get the data
+        try:
+            rows = self._table(oids, context_name)
+        except exceptions.EasySNMPConnectionError:
+            # Walking the columns one at a time would only time out again.
+            # Return blank values as swalk() does.
+            log_message = _exception_message(
+                self._poll.hostname,
+                ", ".join(oids),
+                context_name,
+                sys.exc_info(),
+            )
+            log.log2info(2048, log_message)
+            result = {oid: {} for oid in oids}
+            return result
+        except (exceptions.EasySNMPError, SystemError):
+            # Some agents mishandle GETBULK requests for several columns.
+            # Fall back to walking the columns one at a time.
+            log_message = _exception_message(
+                self._poll.hostname,
+                ", ".join(oids),
+                context_name,
+                sys.exc_info(),
+            )
+            log.log2info(2012, log_message)
+            for oid in oids:
+                result[oid] = self.swalk(
+                    oid, normalized=normalized, context_name=context_name
+                )
+            return result
+
+        # Format results
+        for oid in oids:
+            result[oid] = _format_results(
+                rows[oid], oid, normalized=normalized
+            )
+
+        # Return
+        return result
+
     def walk(
         self,
         oid_to_get,
@@ -490,24 +851,42 @@ class Interact:
             log_message = "OID {} has an invalid format".format(oid_to_get)
             log.log2die(1057, log_message)
 
-        # Create SNMP session
-        session = _Session(self._poll, context_name=context_name).session
+        # Sessions that have already been used successfully may have gone
+        # stale. These are the only ones worth reconnecting on error.
+        reusable = context_name in self._verified
+        started = time.time()
+        timeouts = 0
+        retries = 0
 
         # Fill the results object by getting OID data
         try:
-            # Get the data
-            if get is True:
-                results = [session.get(oid_to_get)]
+            try:
+                results = self._request(oid_to_get, get, context_name)
+            except (
+                exceptions.EasySNMPConnectionError,
+                exceptions.EasySNMPTimeoutError,
+            ) as exception_error:
+                if isinstance(
+                    exception_error, exceptions.EasySNMPTimeoutError
+                ):
+                    timeouts += 1
+                if reusable is False:
+                    raise
+                retries += 1
+
+                # Discard the stale session and retry once on a new one
+                log_message = """\
+Reconnecting SNMP session to host {} for context "{}"\
+""".format(
+                    self._poll.hostname, context_name
+                )
+                log.log2debug(2007, log_message)
+                self._sessions.pop(context_name, None)
+                self._verified.discard(context_name)
+                results = self._request(oid_to_get, get, context_name)
 
-            else:
-                if self._poll.authorization.version != 1:
-                    # Bulkwalk for SNMPv2 and SNMPv3
-                    results = session.bulkwalk(
-                        oid_to_get, non_repeaters=0, max_repetitions=25
-                    )
-                else:
-                    # Bulkwalk not supported in SNMPv1
-                    results = session.walk(oid_to_get)
+            # The session works
+            self._verified.add(context_name)
 
         # Crash on error, return blank results if doing certain types of
         # connectivity checks
@@ -527,6 +906,8 @@ class Interact:
                 context_name,
                 sys.exc_info(),
             )
+            if isinstance(exception_error, exceptions.EasySNMPTimeoutError):
+                timeouts += 1
 
             # Process easysnmp errors
             (_contactable, exists) = _process_error(
@@ -571,10 +952,258 @@ class Interact:
         # Format results
         values = _format_results(results, oid_to_get, normalized=normalized)
 
+        # Record statistics
+        self._metrics.record(
+            oid_to_get,
+            seconds=time.time() - started,
+            rows=len(values),
+            timeouts=timeouts,
+            retries=retries,
+        )
+
         # Return
         return_value = (_contactable, exists, values)
         return return_value
 
+    def _request(self, oid_to_get, get, context_name):
+        """Send an SNMP request using the cached session for the context.
+
+        Args:
+            oid_to_get: OID to get
+            get: Flag determining whether to do a GET or WALK
+            context_name: Set the contextName used for SNMPv3 messages.
+
+        Returns:
+            results: List of easysnmp SNMPVariable objects
+
+        """
+        # Get the session and the lock that serializes its use
+        session = self.session(context_name=context_name)
+        lock = self._context_lock(context_name)
+
+        # Get the data
+        with self._inflight, lock:
+            if get is True:
+                results = [session.get(oid_to_get)]
+                pdus = 1
+
+            else:
+                if self._poll.authorization.version != 1:
+                    # Bulkwalk for SNMPv2 and SNMPv3
+                    results = self._bulk(
+                        lambda max_repetitions: session.bulkwalk(
+                            oid_to_get,
+                            non_repeaters=0,
+                            max_repetitions=max_repetitions,
+                        ),
+                        oid_to_get,
+                        context_name,
+                    )
+
+                    # easysnmp doesn't report the number of PDUs. Every PDU
+                    # but the last returns max-repetitions rows.
+                    pdus = len(results) // self.max_repetitions() + 1
+                else:
+                    # Bulkwalk not supported in SNMPv1
+                    results = session.walk(oid_to_get)
+                    pdus = len(results) + 1
+
+        # Record statistics
+        self._metrics.record(oid_to_get, pdus=pdus)
+
+        # Return
+        return results
+
+    def _table(self, oids, context_name):
+        """Walk several table columns using interleaved GETBULK requests.
+
+        Args:
+            oids: List of column OIDs to walk
+            context_name: Set the contextName used for SNMPv3 messages.
+
+        Returns:
+            rows: Dict of lists of easysnmp SNMPVariable objects keyed by
+                column OID
+
+        """
+        # Initialize key variables
+        rows = {oid: [] for oid in oids}
+        cursors = {oid: oid for oid in oids}
+        label = ",".join(oids)
+        started = time.time()
+        pdus = 0
+        session = self.session(context_name=context_name)
+        lock = self._context_lock(context_name)
+
+        # Each request asks for the next rows of every unfinished column.
+        # The agent returns them interleaved, one varbind per column in
+        # each repetition.
+        while bool(cursors) is True:
+            columns = list(cursors.keys())
+            with self._inflight, lock:
+                varbinds = self._bulk(
+                    lambda max_repetitions: session.get_bulk(
+                        [cursors[column] for column in columns],
+                        non_repeaters=0,
+                        max_repetitions=max_repetitions,
+                    ),
+                    label,
+                    context_name,
+                )
+            pdus += 1
+
+            # Assign each varbind to its column
+            finished = set()
+            progress = False
+            for position, varbind in enumerate(varbinds):
+                column = columns[position % len(columns)]
+                if column in finished:
+                    continue
+
+                # A column is finished when the agent walks past its end
+                oid = ".{}.{}".format(
+                    varbind.oid.lstrip("."), varbind.oid_index
+                )
+                if (
+                    varbind.snmp_type.upper() == "ENDOFMIBVIEW"
+                    or oid.startswith("{}.".format(column)) is False
+                    or oid == cursors[column]
+                ):
+                    finished.add(column)
+                    continue
+
+                rows[column].append(varbind)
+                cursors[column] = oid
+                progress = True
+
+            # Stop walking finished columns. Stop altogether if the agent
+            # isn't returning any new data.
+            for column in finished:
+                cursors.pop(column)
+            if progress is False:
+                break
+
+        # Record statistics
+        self._metrics.record(
+            label,
+            seconds=time.time() - started,
+            rows=sum(len(_) for _ in rows.values()),
+            pdus=pdus,
+        )
+
+        # Return
+        return rows
+
+    def _bulk(self, request, oid, context_name):
+        """Make a GETBULK request, reducing the PDU size until it succeeds.
+
+        Args:
+            request: Function that makes the request. It is passed the
+                max-repetitions to use
+            oid: OID being requested. Used for statistics
+            context_name: Set the contextName used for SNMPv3 messages.
+
+        Returns:
+            results: Results of the request
+
+        """
+        while True:
+            max_repetitions = self.max_repetitions()
+            try:
+                results = request(max_repetitions)
+                break
+            except exceptions.EasySNMPError as exception_error:
+                # Back off when the agent said the response was too big.
+                # Agents that silently drop large responses time out
+                # instead, which only means the same once the device has
+                # answered in this session. Otherwise the device or network
+                # is more likely to be down.
+                smaller = _pdu_too_large(exception_error) or (
+                    isinstance(
+                        exception_error, exceptions.EasySNMPTimeoutError
+                    )
+                    and context_name in self._verified
+                )
+                if smaller is False or max_repetitions <= MIN_REPETITIONS:
+                    raise
+                self._metrics.record(oid, retries=1)
+                self._backoff(max_repetitions)
+
+        # Remember the size that worked
+        self._learned(max_repetitions)
+
+        # Return
+        return results
+
+    def _backoff(self, max_repetitions):
+        """Halve the GETBULK max-repetitions.
+
+        Args:
+            max_repetitions: The max-repetitions that failed
+
+        Returns:
+            None
+
+        """
+        # Update the value unless another thread already has
+        with self._lock:
+            if self._max_repetitions != max_repetitions:
+                return
+            self._max_repetitions = max(MIN_REPETITIONS, max_repetitions // 2)
+            value = self._max_repetitions
+
+        # Log
+        log_message = (
+            """Reducing GETBULK max-repetitions for host {} to {}""".format(
+                self._poll.hostname, value
+            )
+        )
+        log.log2debug(2013, log_message)
+
+    def _learned(self, max_repetitions):
+        """Remember a GETBULK max-repetitions that succeeded for next time.
+
+        Args:
+            max_repetitions: The max-repetitions that succeeded
+
+        Returns:
+            None
+
+        """
+        # Only save a change, or the outcome of a probe so that the next
+        # probe waits for PROBE_INTERVAL
+        with self._lock:
+            if max_repetitions != self._max_repetitions or (
+                max_repetitions == self._saved_repetitions
+                and self._probing is False
+            ):
+                return
+            self._saved_repetitions = max_repetitions
+            self._probing = False
+
+        # Save
+        _update_cache(
+            files.bulk_file(self._poll.hostname, ConfigPoller()),
+            str(max_repetitions),
+        )
+
+    def _context_lock(self, context_name):
+        """Get the lock serializing the use of a context's session.
+
+        Args:
+            context_name: Set the contextName used for SNMPv3 messages.
+
+        Returns:
+            lock: Lock for the session
+
+        """
+        # Create the lock if it doesn't already exist
+        with self._lock:
+            lock = self._locks.setdefault(context_name, threading.Lock())
+
+        # Return
+        return lock
+
 
 class _Session:
     """Class to create an SNMP session with a device."""
@@ -964,12 +1593,118 @@ def _oid_valid_format(oid):
     return True
 
 
+def _pdu_too_large(exception_error):
+    """Determine whether an SNMP error means a GETBULK response was too big.
+
+    Args:
+        exception_error: easysnmp exception
+
+    Returns:
+        result: True if a smaller max-repetitions may succeed
+
+    """
+    # Agents return a tooBig error when the response exceeds their
+    # maximum message size
+    message = str(exception_error).lower().replace(" ", "")
+    result = "toobig" in message
+    return result
+
+
+def _read_repetitions(filename):
+    """Read the GETBULK max-repetitions cached for a device.
+
+    Args:
+        filename: String containing path to cache file
+
+    Returns:
+        result: Cached max-repetitions, MAX_REPETITIONS if there is none
+
+    """
+    # Initialize key variables
+    result = MAX_REPETITIONS
+
+    # Read the file
+    if os.path.isfile(filename) is True:
+        with open(filename) as f_handle:
+            value = f_handle.readline().strip()
+        if value.isdigit() is True:
+            result = min(MAX_REPETITIONS, max(MIN_REPETITIONS, int(value)))
+
+    # Return
+    return result
+
+
+def _probe_executor():
+    """Get the thread pool shared by the credential probes of the process.
+
+    Args:
+        None
+
+    Returns:
+        result: ThreadPoolExecutor object
+
+    """
+    # Threads don't survive a fork, so each process creates its own pool
+    with _PROBES_LOCK:
+        if _PROBES["pid"] != os.getpid():
+            _PROBES["pid"] = os.getpid()
+            _PROBES["executor"] = ThreadPoolExecutor(max_workers=PROBE_WORKERS)
+        result = _PROBES["executor"]
+
+    # Return
+    return result
+
+
+def _recently_unreachable(filename, ttl):
+    """Determine whether a device recently failed every SNMP credential.
+
+    Args:
+        filename: String containing path to the unreachable file
+        ttl: Number of seconds for which the failure is remembered
+
+    Returns:
+        result: True if the device should not be probed again yet
+
+    """
+    # Initialize key variables
+    result = False
+
+    # Check the age of the file
+    if bool(ttl) is True and os.path.isfile(filename) is True:
+        result = time.time() - os.path.getmtime(filename) < ttl
+
+    # Return
+    return result
+
+
+def _update_unreachable(filename, contactable):
+    """Record whether any SNMP credentials worked for a device.
+
+    Args:
+        filename: String containing path to the unreachable file
+        contactable: True if the device responded to a credential
+
+    Returns:
+        None
+
+    """
+    # Forget past failures
+    if bool(contactable) is True:
+        if os.path.isfile(filename) is True:
+            os.remove(filename)
+        return
+
+    # Record the time of the failure
+    with open(filename, "w+") as f_handle:
+        f_handle.write(str(int(time.time())))
+
+
 def _update_cache(filename, group):
-    """Update SNMP credentials cache file.
+    """Update an SNMP cache file.
 
     Args:
         filename: String containing path to cache file
-        group: String containing SNMP group name to cache
+        group: String containing the SNMP group name, or other value, to cache
 
     Returns:
         None
@@ -1,19 +1,23 @@
 """Database server API. HTTP POST routes."""
 
 # Standard imports
-import os
-import hashlib
+import gzip
+import json
 
 # PIP3 imports
-from flask import Blueprint, request, jsonify
-import yaml
+from flask import Blueprint, request, jsonify, abort
 
 # Repository imports
 from switchmap.core import log
+from switchmap.core import codec
+from switchmap.core import spool
+from switchmap.core import general
 from switchmap import API_POLLER_POST_URI
+from switchmap import API_POLLER_BATCH_URI
 from switchmap import API_POLLER_SEARCH_URI
 from switchmap.server.configuration import ConfigServer
 from switchmap.server.db.misc import search
+from switchmap.server.db.ingest import queue
 
 
 # Define the API_POST global variable
@@ -35,46 +39,33 @@ def post_device_data():
     config = ConfigServer()
 
     # Get data
-    data = request.json
-    try:
-        hostname = data["misc"]["host"]
-    except:
-        hostname = None
-    try:
-        zone = data["misc"]["zone"]
-    except:
-        zone = None
+    data, payload = _posted()
+    _store(data, config, payload=payload)
 
-    if bool(hostname):
-        # Only write data if file doesn't exist. This reduces the risk of
-        # duplicate data if data from a previously existing file is still
-        # being ingested.
-        filepath = "{}{}{}-{}.yaml".format(
-            config.cache_directory(),
-            os.sep,
-            hostname,
-            hashlib.md5(zone.encode("utf-8")).hexdigest()[:5],
-        )
-        if os.path.exists(filepath) is False:
-            # Write data to file
-            # data_as_string = json.dumps(data)
-            with open(filepath, "w") as f_handle:
-                yaml.dump(data, f_handle)
+    # Return
+    return "OK"
 
-            # Log
-            log_message = "Successfully created data cache file {}.".format(
-                filepath
-            )
-            log.log2info(1043, log_message)
 
-        else:
-            # Log
-            log_message = (
-                "Cache file {} already exists. Will not update.".format(
-                    filepath
-                )
-            )
-            log.log2info(1042, log_message)
+@API_POST.route(API_POLLER_BATCH_URI, methods=["POST"])
+def post_device_batch():
+    """Accept posts of data from several network devices from pollers.
+
+    Args:
+        None
+
+    Returns:
+        _response: OK message when successful
+
+    """
+    # Initialize key variables
+    config = ConfigServer()
+
+    # Get data
+    items, _ = _posted()
+    if isinstance(items, list) is False:
+        abort(400)
+    for data in items:
+        _store(data, config)
 
     # Return
     return "OK"
@@ -109,3 +100,103 @@ def post_searchterm():
         return jsonify(result)
     else:
         return jsonify(result)
+
+
+def _posted():
+    """Get the network device data posted by a poller.
+
+    Pollers send compact binary data, older pollers send JSON. Either may
+    be gzip compressed.
+
+    Args:
+        None
+
+    Returns:
+        result: Tuple of (data, payload). payload is the binary data as
+            posted, None if JSON was posted
+
+    """
+    # Initialize key variables
+    payload = None
+
+    # Get data
+    try:
+        body = request.get_data()
+        if request.content_encoding == "gzip":
+            body = gzip.decompress(body)
+
+        if request.mimetype == codec.CONTENT_TYPE:
+            payload = body
+            data = codec.decode(payload)
+        elif request.is_json is True:
+            # JSON converts integer keys to strings. Convert them back.
+            data = general.consistent_keys(json.loads(body))
+        else:
+            abort(415)
+    except (ValueError, OSError, EOFError):
+        log_message = "Invalid {} data posted by {}".format(
+            request.mimetype, request.remote_addr
+        )
+        log.log2warning(2023, log_message)
+        abort(400)
+
+    # Return
+    result = (data, payload)
+    return result
+
+
+def _store(data, config, payload=None):
+    """Store network device data for ingestion.
+
+    Args:
+        data: Network device data
+        config: ConfigServer object
+        payload: Binary data as posted. Written as is if not None and the
+            spool format allows it
+
+    Returns:
+        None
+
+    """
+    try:
+        hostname = data["misc"]["host"]
+    except:
+        hostname = None
+    try:
+        zone = data["misc"]["zone"]
+    except:
+        zone = None
+
+    if bool(hostname) and config.ingest_mode() == "queue":
+        # Queue the data for the ingester
+        queue.Queue(config).put(hostname, zone, data, payload=payload)
+
+        # Log
+        log_message = "Queued data from {} for ingestion.".format(hostname)
+        log.log2debug(2031, log_message)
+
+    elif bool(hostname):
+        # Only write data if file doesn't exist. This reduces the risk of
+        # duplicate data if data from a previously existing file is still
+        # being ingested.
+        filename = spool.filename(config.cache_directory(), hostname, zone)
+        if spool.exists(filename) is False:
+            # Write data to file
+            filepath = spool.write(
+                filename, data, config.spool_format(), payload=payload
+            )
+
+            # Log
+            log_message = "Successfully created data cache file {}.".format(
+                filepath
+            )
+            log.log2info(1043, log_message)
+
+        else:
+            # Log
+            log_message = (
+                "Cache file {} already exists. Will not update.".format(
+                    filename
+                )
+            )
+            log.log2info(1042, log_message)
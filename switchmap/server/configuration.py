@@ -8,6 +8,7 @@ from switchmap.core.configuration import ConfigAPI
 from switchmap.core import log
 from switchmap.core import general
 from switchmap.core import files
+from switchmap.core import spool
 
 
 class ConfigServer(ConfigAPI):
@@ -190,6 +191,62 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def dns_cache_ttl(self):
+        """Get dns_cache_ttl.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = int(self._config_server.get("dns_cache_ttl", 86400))
+        return result
+
+    def dns_negative_cache_ttl(self):
+        """Get dns_negative_cache_ttl.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = int(self._config_server.get("dns_negative_cache_ttl", 3600))
+        return result
+
+    def dns_timeout(self):
+        """Get dns_timeout.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = float(self._config_server.get("dns_timeout", 2))
+        return result
+
+    def dns_workers(self):
+        """Get dns_workers.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = int(self._config_server.get("dns_workers", 20))
+        return result
+
     def ingest_directory(self):
         """Determine the ingest_directory.
 
@@ -218,6 +275,31 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def ingest_mode(self):
+        """Get ingest_mode.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Initialize key variables
+        modes = ["spool", "queue"]
+
+        # Get result
+        result = str(self._config_server.get("ingest_mode", "spool")).lower()
+
+        # Error if incorrectly configured
+        if result not in modes:
+            log_message = (
+                'Invalid ingest_mode "{}" in the configuration file(s). '
+                "Valid values are: {}".format(result, ", ".join(modes))
+            )
+            log.log2die_safe(2030, log_message)
+        return result
+
     def ingest_interval(self):
         """Get ingest_interval.
 
@@ -249,6 +331,73 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def purge_batch_size(self):
+        """Get purge_batch_size.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = int(self._config_server.get("purge_batch_size", 5000))
+        return result
+
+    def purge_pause(self):
+        """Get purge_pause.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = float(self._config_server.get("purge_pause", 0.1))
+        return result
+
+    def snapshot_interval(self):
+        """Get snapshot_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = int(self._config_server.get("snapshot_interval", 0))
+        return result
+
+    def spool_format(self):
+        """Get spool_format.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        # Get result
+        result = str(self._config_server.get("spool_format", "msgpack"))
+        result = result.lower()
+
+        # Error if incorrectly configured
+        if result not in spool.FORMATS:
+            log_message = (
+                'Invalid spool_format "{}" in the configuration file(s). '
+                "Valid values are: {}".format(
+                    result, ", ".join(sorted(spool.FORMATS))
+                )
+            )
+            log.log2die_safe(2025, log_message)
+        return result
+
     def username(self):
         """Get username.
 
@@ -1,14 +1,59 @@
 """Class to process connection."""
 
 import sys
+import threading
+from contextlib import contextmanager
 
-from sqlalchemy.sql import Select, Update, Delete
+from sqlalchemy.sql import Select, Update, Delete, Insert
 from sqlalchemy.orm import Session
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.core import log
 from switchmap.server.db import ENGINE
 
+# Maximum number of values in the "IN" clause of a bulk select and of rows
+# in a bulk insert statement
+CHUNK_SIZE = 1000
+
+# Transaction in progress in each thread
+_LOCAL = threading.local()
+
+
+@contextmanager
+def transaction():
+    """Run the database functions of this module in a single transaction.
+
+    The functions called within the context share one connection and
+    session instead of checking out a connection each. Everything is
+    committed when the context ends, or rolled back if it ends with an
+    exception. Nested contexts join the transaction already in progress.
+
+    Args:
+        None
+
+    Returns:
+        session: Session of the transaction
+
+    """
+    # Join the transaction in progress
+    if getattr(_LOCAL, "session", None) is not None:
+        yield _LOCAL.session
+        return
+
+    # Start a transaction
+    with ENGINE.connect() as connection:
+        with Session(bind=connection, future=True) as session:
+            _LOCAL.session = session
+            try:
+                yield session
+                session.commit()
+            except:
+                session.rollback()
+                raise
+            finally:
+                _LOCAL.session = None
+
 
 def db_select_row(error_code, statement):
     """Support 'Select' actions for __ENTIRE__ row.
@@ -36,15 +81,21 @@ Only the "Select" ORM expression is supported. Not "{}"'''.format(
         log.log2die(error_code, log_message)
 
     # Process transaction
-    with ENGINE.connect() as connection:
-        with Session(bind=connection, future=True) as session:
-            try:
-                result = session.execute(statement).scalars().all()
-            except:
-                # Log error
-                log.log2info(error_code, 'DB "select_row" error.')
-                log.log2exception(error_code, sys.exc_info())
-                raise
+    with _session() as session:
+        try:
+            # Refresh objects already loaded by the transaction in progress
+            result = (
+                session.execute(
+                    statement.execution_options(populate_existing=True)
+                )
+                .scalars()
+                .all()
+            )
+        except:
+            # Log error
+            log.log2info(error_code, 'DB "select_row" error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
 
     # Return
     return result
@@ -77,15 +128,14 @@ Only the "Select" ORM expression is supported. Not "{}"\
         log.log2die(error_code, log_message)
 
     # Process transaction
-    with ENGINE.connect() as connection:
-        with Session(bind=connection, future=True) as session:
-            try:
-                iterator_ = session.execute(statement)
-            except:
-                # Log error
-                log.log2info(error_code, 'DB "Select" failure.')
-                log.log2exception(error_code, sys.exc_info())
-                raise
+    with _session() as session:
+        try:
+            iterator_ = session.execute(statement)
+        except:
+            # Log error
+            log.log2info(error_code, 'DB "Select" failure.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
 
     # Get named tuple equivalents
     for row in iterator_.mappings():
@@ -121,30 +171,81 @@ Only the "Update" ORM expression is supported. Not "{}"'''.format(
         log.log2die(error_code, log_message)
 
     # Process transaction
-    with ENGINE.connect() as connection:
-        with Session(bind=connection, future=True) as session:
-            try:
-                if bool(values):
-                    session.execute(statement, values)
-                else:
-                    session.execute(statement)
-            except:
-                # Recover and log error
-                session.rollback()
-                log.log2info(error_code, 'DB "Update" error.')
-                log.log2exception(error_code, sys.exc_info())
-                raise
-
-            try:
-                session.commit()
-            except:
-                # Recover and log error
-                session.rollback()
-                log.log2info(error_code, 'DB "Update" commit error.')
-                log.log2exception(error_code, sys.exc_info())
-                raise
+    with _session() as session:
+        try:
+            if bool(values):
+                session.execute(statement, values)
             else:
-                result = True
+                session.execute(statement)
+        except:
+            # Recover and log error
+            _rollback(session)
+            log.log2info(error_code, 'DB "Update" error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
+
+        try:
+            _commit(session)
+        except:
+            # Recover and log error
+            _rollback(session)
+            log.log2info(error_code, 'DB "Update" commit error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
+        else:
+            result = True
+
+    # Return
+    return result
+
+
+def db_insert(error_code, statement, values):
+    """Provide a transactional support for Insert actions of many rows.
+
+    Args:
+        error_code: Error code to use in messages
+        statement: SqlALchemy Insert statement to execute
+        values: List of dicts of column values, one per row
+
+    Returns:
+        result: True if the transaction is successful
+
+    """
+    # Initialize key variables
+    result = False
+
+    # Check to ensure the function executes the correct type of statement
+    if isinstance(statement, Insert) is False:
+        log_message = """\
+Only the "Insert" ORM expression is supported. Not "{}"\
+""".format(
+            type(statement)
+        )
+        log.log2die(error_code, log_message)
+
+    # Process transaction
+    with _session() as session:
+        try:
+            # Insert in chunks to limit the size of each statement
+            for chunk in mit.chunked(values, CHUNK_SIZE):
+                session.execute(statement, chunk)
+        except:
+            # Recover and log error
+            _rollback(session)
+            log.log2info(error_code, 'DB "Insert" error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
+
+        try:
+            _commit(session)
+        except:
+            # Recover and log error
+            _rollback(session)
+            log.log2info(error_code, 'DB "Insert" commit error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
+        else:
+            result = True
 
     # Return
     return result
@@ -173,24 +274,23 @@ Only the "Delete" ORM expression is supported. Not "{}"'''.format(
         log.log2die(error_code, log_message)
 
     # Process transaction
-    with ENGINE.connect() as connection:
-        with Session(bind=connection, future=True) as session:
-            try:
-                session.execute(statement).scalars().all()
-            except:
-                # Log error
-                log.log2info(error_code, 'DB "delete_row" error.')
-                log.log2exception(error_code, sys.exc_info())
-                raise
-
-            try:
-                session.commit()
-            except:
-                # Recover and log error
-                session.rollback()
-                log.log2info(error_code, 'DB "delete_row" commit error.')
-                log.log2exception(error_code, sys.exc_info())
-                raise
+    with _session() as session:
+        try:
+            session.execute(statement).scalars().all()
+        except:
+            # Log error
+            log.log2info(error_code, 'DB "delete_row" error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
+
+        try:
+            _commit(session)
+        except:
+            # Recover and log error
+            _rollback(session)
+            log.log2info(error_code, 'DB "delete_row" commit error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
 
 
 def db_delete(error_code, statement):
@@ -216,26 +316,25 @@ Only the "Delete" ORM expression is supported. Not "{}"'''.format(
         log.log2die(error_code, log_message)
 
     # Process transaction
-    with ENGINE.connect() as connection:
-        with Session(bind=connection, future=True) as session:
-            try:
-                result_ = session.execute(statement)
-                result = result_.rowcount
-            except:
-                # Recover and log error
-                session.rollback()
-                log.log2info(error_code, 'DB "Delete" error.')
-                log.log2exception(error_code, sys.exc_info())
-                raise
-
-            try:
-                session.commit()
-            except:
-                # Recover and log error
-                session.rollback()
-                log.log2info(error_code, 'DB "Delete" commit error.')
-                log.log2exception(error_code, sys.exc_info())
-                raise
+    with _session() as session:
+        try:
+            result_ = session.execute(statement)
+            result = result_.rowcount
+        except:
+            # Recover and log error
+            _rollback(session)
+            log.log2info(error_code, 'DB "Delete" error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
+
+        try:
+            _commit(session)
+        except:
+            # Recover and log error
+            _rollback(session)
+            log.log2info(error_code, 'DB "Delete" commit error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
 
     # Return
     return result
@@ -256,32 +355,85 @@ def db_add_all(error_code, instances, die=True):
     # Initialize key variables
     result = False
 
+    with _session() as session:
+        try:
+            session.add_all(instances)
+        except:
+            # Recover and log error
+            _rollback(session)
+            log.log2info(error_code, 'DB "add_all" error.')
+            log.log2exception(error_code, sys.exc_info())
+            if bool(die):
+                raise
+            log.log2debug(error_code, "Continuing processing.")
+
+        # Sometimes the commit fails
+        try:
+            _commit(session)
+        except:
+            # Recover and log error
+            _rollback(session)
+            log.log2info(error_code, 'DB "add_all" commit error.')
+            log.log2exception(error_code, sys.exc_info())
+            if bool(die):
+                raise
+            log.log2debug(error_code, "Continuing processing.")
+        else:
+            result = True
+
+    # Return
+    return result
+
+
+@contextmanager
+def _session():
+    """Get a session for a single database operation.
+
+    Args:
+        None
+
+    Returns:
+        session: Session of the transaction in progress if any, otherwise
+            a new session
+
+    """
+    # Use the transaction in progress
+    if getattr(_LOCAL, "session", None) is not None:
+        yield _LOCAL.session
+        return
+
+    # Create a session
     with ENGINE.connect() as connection:
         with Session(bind=connection, future=True) as session:
-            try:
-                session.add_all(instances)
-            except:
-                # Recover and log error
-                session.rollback()
-                log.log2info(error_code, 'DB "add_all" error.')
-                log.log2exception(error_code, sys.exc_info())
-                if bool(die):
-                    raise
-                log.log2debug(error_code, "Continuing processing.")
+            yield session
 
-            # Sometimes the commit fails
-            try:
-                session.commit()
-            except:
-                # Recover and log error
-                session.rollback()
-                log.log2info(error_code, 'DB "add_all" commit error.')
-                log.log2exception(error_code, sys.exc_info())
-                if bool(die):
-                    raise
-                log.log2debug(error_code, "Continuing processing.")
-            else:
-                result = True
 
-    # Return
-    return result
+def _commit(session):
+    """Commit a session unless it belongs to the transaction in progress.
+
+    Args:
+        session: Session to commit
+
+    Returns:
+        None
+
+    """
+    # The transaction in progress is committed when it ends
+    if session is not getattr(_LOCAL, "session", None):
+        session.commit()
+
+
+def _rollback(session):
+    """Roll back a session unless it belongs to the transaction in progress.
+
+    Args:
+        session: Session to roll back
+
+    Returns:
+        None
+
+    """
+    # The transaction in progress is rolled back when it ends with the
+    # exception being raised
+    if session is not getattr(_LOCAL, "session", None):
+        session.rollback()
@@ -2,15 +2,22 @@
 
 import os.path
 import os
+import sys
+import time
 import tempfile
+from concurrent import futures
+from concurrent.futures.process import BrokenProcessPool
 from operator import attrgetter
+from collections import defaultdict
 
 # Import project libraries
 from multiprocessing import get_context
 from switchmap.core import log
 from switchmap.core import files
+from switchmap.core import spool
 from switchmap.core import general
 from switchmap import AGENT_INGESTER, AGENT_POLLER
+from switchmap.server.db import db
 from switchmap.server.db.table import IZone
 from switchmap.server.db.table import IRoot
 from switchmap.server.db.table import IMacIp
@@ -18,6 +25,7 @@ from switchmap.server.db.table import IIpPort
 from switchmap.server.db.table import event as _event
 from switchmap.server.db.table import zone as _zone
 from switchmap.server.db.table import root as _root
+from switchmap.server.db.table import device as _device
 from switchmap.server.db.table import ip as _ip
 from switchmap.server.db.table import ipport as _ipport
 from switchmap.server.db.table import mac as _mac
@@ -26,6 +34,7 @@ from switchmap.server.db.table import macport as _macport
 from switchmap.server import ZoneData, ZoneDevice, EventObjects
 from switchmap.server.db.ingest.update import device as update_device
 from switchmap.server.db.ingest.update import zone as update_zone
+from switchmap.server.db.ingest import queue
 
 
 class Ingest:
@@ -55,6 +64,7 @@ class Ingest:
         self._test = test
         self._test_cache_directory = test_cache_directory
         self._multiprocessing = bool(multiprocessing)
+        self._pool = None
 
     def process(self):
         """Process files in the cache.
@@ -85,29 +95,23 @@ class Ingest:
             # and ingester are running on the same machine
             if os.path.isfile(poller_lock_file) is False:
                 # Copy files from cache to ingest
-                files.move_yaml_files(cache_directory, tmpdir)
+                spool.move(cache_directory, tmpdir)
 
                 # Parallel process the files
-                setup_success = setup(tmpdir, self._config)
+                setup_success = setup(
+                    tmpdir, self._config, executor=self._executor()
+                )
 
                 if bool(setup_success) is True:
-                    # Populate the arguments
+                    # Populate the arguments. The data is read from the
+                    # files by the sub processes that need it.
                     arguments = [
-                        [item.idx_zone, item.data, item.filepath, item.config]
+                        [item.idx_zone, item.filepath, item.config]
                         for item in setup_success.zones
                     ]
 
-                    # Process the device independent zone data in the
-                    # database first
-                    if bool(arguments) is True:
-                        pairmacips = self.zone(arguments)
-
-                    # Process the device dependent in the database second
-                    if bool(pairmacips):
-                        self.device(arguments)
-
-                    # Update the IpPort table
-                    insert_ipports(pairmacips)
+                    # Process the zone and device data
+                    self.pipeline(arguments)
 
                     # Cleanup
                     self.cleanup(setup_success.event)
@@ -119,12 +123,76 @@ class Ingest:
                 )
                 log.log2info(1077, log_message)
 
-    def zone(self, arguments):
-        """Ingest the files' zone data.
+    def queued(self):
+        """Ingest the device data waiting in the ingest queue.
+
+        Each device is ingested as soon as it is dequeued and added to the
+        most recent event, so that it is visible without waiting for the
+        rest of the polling cycle.
+
+        Args:
+            None
+
+        Returns:
+            count: Number of devices ingested
+
+        """
+        # Initialize key variables
+        count = 0
+        skip_file = files.skip_file(AGENT_INGESTER, self._config)
+        store = queue.Queue(self._config)
+
+        while os.path.isfile(skip_file) is False:
+            # Get the next device
+            item = store.get()
+            if item is None:
+                break
+            idx_item, data = item
+
+            # Ingest it into the event being displayed. The device is
+            # ingested completely or not at all
+            try:
+                # Do the DNS lookups before locking any database rows
+                hostnames = update_zone.hostnames(data)
+                with db.transaction():
+                    event = _current_event()
+                    _zone = _zone_data(event, data)
+                    replace_device(
+                        _zone.idx_zone,
+                        _zone.data,
+                        "queue item {}".format(idx_item),
+                        self._config,
+                        hostnames=hostnames,
+                    )
+            except Exception:
+                # Don't let bad data stop the ingest of other devices
+                attempts = store.fail(idx_item)
+                log_message = """\
+Failed to ingest queue item {} (attempt {} of {})""".format(
+                    idx_item, attempts, queue.MAX_ATTEMPTS
+                )
+                log.log2warning(2050, log_message)
+                log.log2exception(2051, sys.exc_info())
+                continue
+
+            # Done
+            store.done(idx_item)
+            count += 1
+
+        # Return
+        return count
+
+    def pipeline(self, arguments):
+        """Ingest the files' zone and device data.
+
+        The device dependent data of a zone is processed as soon as the
+        device independent data of all the zone's files is in the database,
+        instead of waiting for that of every zone. The processing of
+        different zones therefore overlaps in the pool of sub processes.
 
         Args:
             arguments: List of arguments for the processing the zone
-                [[item.idx_zone, item.data, item.filepath, item.config]]
+                [[item.idx_zone, item.filepath, item.config]]
 
         Returns:
             success: True if successful
@@ -132,98 +200,135 @@ class Ingest:
         """
         # Initialize key variables
         success = False
-        rows = []
+        zones = {}
+        jobs = {}
+        held = []
+        found = False
 
         # Return if necessary
         if bool(arguments) is False:
             return success
 
-        # Get the number of threads to use in the pool
-        pool_size = self._config.agent_subprocesses()
-
-        # Process the data files
-        if bool(self._test) is False:
-            if bool(self._multiprocessing) is False:
-                ############################
-                # Process files serially
-                ############################
-                for argument in arguments:
-                    rows.append(process_zone(*argument))
-
-            else:
-                ############################
-                # Process files in parallel
-                ############################
-
-                # Create a pool of sub process resources
-                with get_context("spawn").Pool(processes=pool_size) as pool:
-                    # Create sub processes from the pool
-                    rows = pool.starmap(process_zone, arguments)
-
-        else:
-            ############################
-            # Process files sequentially
-            ############################
-            for argument in arguments:
-                rows.append(process_zone(*argument))
+        # Group the files by zone
+        for argument in arguments:
+            zone = zones.setdefault(
+                argument[0], {"arguments": [], "rows": [], "pairmacips": []}
+            )
+            zone["arguments"].append(argument)
+
+        # Get the pool of sub processes
+        executor = self._executor()
+
+        # Process the device independent zone data of every file. The sub
+        # processes read the files themselves.
+        for idx_zone, zone in zones.items():
+            zone["pending"] = len(zone["arguments"])
+            for argument in zone["arguments"]:
+                jobs[executor.submit(process_zone_file, *argument)] = (
+                    process_zone_file,
+                    idx_zone,
+                )
 
-        # Insert ARP table
-        pairmacips = insert_arptable(rows)
+        try:
+            # Start the next stage of each zone as its files complete
+            while bool(jobs) is True:
+                done, _ = futures.wait(
+                    jobs, return_when=futures.FIRST_COMPLETED
+                )
+                for job in done:
+                    stage, idx_zone = jobs.pop(job)
+                    zone = zones[idx_zone]
+                    zone["pending"] -= 1
+                    rows = job.result()
+
+                    if stage is process_zone_file:
+                        # Ignore files skipped during shutdown
+                        if rows is not None:
+                            zone["rows"].append(rows)
+                        if bool(zone["pending"]) is True:
+                            continue
+
+                        # Insert the zone's ARP table
+                        with db.transaction():
+                            zone["pairmacips"] = insert_arptable(zone["rows"])
+                        found = found or bool(zone["pairmacips"])
+                        held.append(idx_zone)
+
+                        # Device dependent data is only processed if at
+                        # least one zone has ARP table entries
+                        if bool(found) is False:
+                            continue
+
+                        # Process the device dependent data
+                        for _idx_zone in held:
+                            _zone = zones[_idx_zone]
+                            _zone["pending"] = len(_zone["arguments"])
+                            for argument in _zone["arguments"]:
+                                jobs[
+                                    executor.submit(
+                                        process_device_file, *argument
+                                    )
+                                ] = (process_device_file, _idx_zone)
+                        held = []
+
+                    elif bool(zone["pending"]) is False:
+                        # Update the IpPort table once all the zone's
+                        # devices are in the database
+                        with db.transaction():
+                            insert_ipports(zone["pairmacips"])
+        except BrokenProcessPool:
+            # Start a new pool next time if a sub process died
+            self.close()
+            raise
 
         # Return
         success = True
-        return pairmacips
+        return success
 
-    def device(self, arguments):
-        """Ingest the files' device data.
+    def close(self):
+        """Stop the pool of sub processes.
 
         Args:
-            arguments: List of arguments for the processing the zone
-                [[item.idx_zone, item.data, item.filepath, item.config]]
+            None
 
         Returns:
-            success: True if successful
+            None
 
         """
-        # Initialize key variables
-        success = False
+        # Stop the pool
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
 
-        # Return if necessary
-        if bool(arguments) is False:
-            return success
+    def _executor(self):
+        """Get the executor of ingest jobs.
 
-        # Get the number of threads to use in the pool
-        pool_size = self._config.agent_subprocesses()
+        The pool of sub processes is created once and kept alive across
+        calls to process(), so that each sub process imports the
+        application only once.
 
-        # Process the data files
-        if bool(self._test) is False:
-            if bool(self._multiprocessing) is False:
-                ############################
-                # Process files serially
-                ############################
-                for argument in arguments:
-                    process_device(*argument)
-
-            else:
-                ############################
-                # Process files in parallel
-                ############################
+        Args:
+            None
 
-                # Create a pool of sub process resources
-                with get_context("spawn").Pool(processes=pool_size) as pool:
-                    # Create sub processes from the pool
-                    pool.starmap(process_device, arguments)
+        Returns:
+            result: Executor object
 
-        else:
-            ############################
-            # Process files sequentially
-            ############################
-            for argument in arguments:
-                process_device(*argument)
+        """
+        # Process files serially unless multiprocessing is enabled
+        if bool(self._test) is True or bool(self._multiprocessing) is False:
+            result = _Serial()
+            return result
+
+        # Create the pool
+        if self._pool is None:
+            self._pool = futures.ProcessPoolExecutor(
+                max_workers=self._config.agent_subprocesses(),
+                mp_context=get_context("spawn"),
+            )
 
         # Return
-        success = True
-        return success
+        result = self._pool
+        return result
 
     def cleanup(self, event):
         """Ingest the files' device data.
@@ -261,7 +366,10 @@ class Ingest:
                     "Purging database based on configuration parameters."
                 )
                 log.log2debug(1058, log_message)
-                _event.purge()
+                _event.purge(
+                    batch_size=self._config.purge_batch_size(),
+                    pause=self._config.purge_pause(),
+                )
 
         else:
             # Delete all DB records related to the event.
@@ -269,7 +377,45 @@ class Ingest:
             _event.delete(event.idx_event)
 
 
-def process_zone(idx_zone, data, filepath, config):
+class _Serial:
+    """Executor running jobs as soon as they are submitted."""
+
+    def map(self, function, *iterables):
+        """Run a job for each item of the iterables.
+
+        Args:
+            function: Function to run
+            *iterables: Iterables of arguments of the function
+
+        Returns:
+            result: Iterator of results
+
+        """
+        # Return
+        result = map(function, *iterables)
+        return result
+
+    def submit(self, function, *args):
+        """Run a job.
+
+        Args:
+            function: Function to run
+            *args: Arguments of the function
+
+        Returns:
+            result: Completed concurrent.futures.Future object
+
+        """
+        # Run the job
+        result = futures.Future()
+        try:
+            result.set_result(function(*args))
+        except Exception as error:
+            result.set_exception(error)
+        return result
+
+
+def process_zone(idx_zone, data, filepath, config, hostnames=None):
     """Ingest a single file for device updates.
 
     Args:
@@ -277,6 +423,8 @@ def process_zone(idx_zone, data, filepath, config):
         data: Cache file containing data
         filepath: Cache file filepath that contains the data
         config: Daemon configuration
+        hostnames: Dict of hostnames keyed by IP address from
+            update_zone.hostnames(). The hostnames are looked up if None
 
     Returns:
         rows: ZoneObjects object
@@ -293,8 +441,35 @@ shutdown request was probably requested""".format(
         log.log2debug(1075, log_message)
         return
 
+    # Do the DNS lookups before the transaction so that database locks
+    # aren't held while waiting for them
+    if hostnames is None:
+        hostnames = update_zone.hostnames(data)
+
+    # Process the ingested data using a single database connection
+    with db.transaction():
+        rows = update_zone.process(data, idx_zone, hostnames=hostnames)
+    return rows
+
+
+def process_zone_file(idx_zone, filepath, config):
+    """Ingest the zone data of a single cache file.
+
+    The file is read here so that its data doesn't have to be passed to
+    sub processes.
+
+    Args:
+        idx_zone: Zone index to be used for the data
+        filepath: Cache file filepath that contains the data
+        config: Daemon configuration
+
+    Returns:
+        rows: ZoneObjects object
+
+    """
     # Process the ingested data
-    rows = update_zone.process(data, idx_zone)
+    data = files.read_cache_file(filepath)
+    rows = process_zone(idx_zone, data, filepath, config)
     return rows
 
 
@@ -322,19 +497,89 @@ shutdown request was probably requested""".format(
         log.log2debug(1049, log_message)
         return
 
+    # Process the ingested data in a single transaction
+    with db.transaction():
+        update_device.process(data, idx_zone)
+
+
+def process_device_file(idx_zone, filepath, config):
+    """Ingest the device data of a single cache file.
+
+    The file is read here so that its data doesn't have to be passed to
+    sub processes.
+
+    Args:
+        idx_zone: Zone index to be used for the data
+        filepath: Cache file filepath that contains the data
+        config: Daemon configuration
+
+    Returns:
+        None
+
+    """
     # Process the ingested data
-    update_device.process(data, idx_zone)
+    data = files.read_cache_file(filepath)
+    process_device(idx_zone, data, filepath, config)
+
+
+def replace_device(idx_zone, data, filepath, config, hostnames=None):
+    """Ingest the data of a device, replacing what it last reported.
+
+    The device's MAC, IP and VLAN to port mappings are deleted before its
+    data is added, so that entries the device no longer reports don't
+    remain in the zone.
+
+    Args:
+        idx_zone: Zone index to be used for the data
+        data: Cache file containing data
+        filepath: Cache file filepath that contains the data
+        config: Daemon configuration
+        hostnames: Dict of hostnames keyed by IP address from
+            update_zone.hostnames(). The hostnames are looked up if None
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    hostname = data["misc"]["host"]
+
+    # Do the DNS lookups before the transaction
+    if hostnames is None:
+        hostnames = update_zone.hostnames(data)
+
+    # Process the ingested data in a single transaction
+    with db.transaction():
+        # Delete the mappings the device last reported
+        exists = _device.exists(idx_zone, hostname)
+        if bool(exists) is True:
+            _device.delete_ports(exists.idx_device)
+
+        # Add the zone and device data
+        pairmacips = insert_arptable(
+            [process_zone(idx_zone, data, filepath, config, hostnames)]
+        )
+        process_device(idx_zone, data, filepath, config)
+        insert_ipports(pairmacips)
+
+        # Restore the IP addresses of the MAC addresses on the device's
+        # ports that were found in the ARP tables of other devices
+        exists = _device.exists(idx_zone, hostname)
+        if bool(exists) is True:
+            _ipport.upsert_row(_ipport.implied(exists.idx_device))
 
 
-def setup(src, config):
+def setup(src, config, executor=None):
     """Ingest the files in parallel.
 
     Args:
         src: Directory where device YAML files are located
         config: Configuration object
+        executor: Executor with which to read the files. The files are
+            read serially if None
 
     Returns:
-        result: EventObjects object
+        result: EventObjects object. The data of each zone is None
 
     """
     # Initialize key variables
@@ -346,16 +591,17 @@ def setup(src, config):
 
     # Parallel processing
     if bool(filepaths) is True:
-        # Create an event
-        event = _event.create()
+        # Get the event to ingest into
+        event = _snapshot_event(config)
 
-        # Get the _zone data from each file
-        for filepath in filepaths:
-            _zone = _get_zone(event, filepath)
+        # Get the zone of each file
+        executor = _Serial() if executor is None else executor
+        names = executor.map(_zone_name, filepaths)
+        for filepath, name in zip(filepaths, names):
             _zones.append(
                 ZoneDevice(
-                    idx_zone=_zone.idx_zone,
-                    data=_zone.data,
+                    idx_zone=_idx_zone(event, name),
+                    data=None,
                     filepath=filepath,
                     config=config,
                 )
@@ -366,6 +612,63 @@ def setup(src, config):
     return result
 
 
+def _snapshot_event(config):
+    """Get the event into which to ingest cache files.
+
+    Every ingest creates a new event, a full snapshot of the topology,
+    unless snapshot_interval is set. The rows of the most recent snapshot
+    are then updated in place until it is older than the interval, so that
+    unchanged rows are updated instead of copied.
+
+    Args:
+        config: ConfigServer object
+
+    Returns:
+        result: Event object
+
+    """
+    # Reuse the event being displayed if it is recent enough. The very
+    # first event is never purged so it is never reused.
+    interval = config.snapshot_interval()
+    if bool(interval) is True:
+        root = _root.idx_exists(1)
+        event = _event.idx_exists(root.idx_event) if bool(root) else False
+        if bool(event) is True and event.idx_event != 1:
+            if time.time() - event.epoch_utc < interval:
+                return event
+
+    # Create an event
+    result = _event.create()
+    return result
+
+
+def _current_event():
+    """Get the event whose data is being displayed, creating it if needed.
+
+    Args:
+        None
+
+    Returns:
+        result: Event object
+
+    """
+    # Get the event of the root
+    root = _root.idx_exists(1)
+    result = _event.idx_exists(root.idx_event) if bool(root) else False
+
+    # Create an event if there is none
+    if bool(result) is False:
+        result = _event.create()
+        root = _root.idx_exists(1)
+        _root.update_row(
+            root.idx_root,
+            IRoot(idx_event=result.idx_event, name=root.name, enabled=1),
+        )
+
+    # Return
+    return result
+
+
 def _filepaths(src):
     """Get and _event ID for the next polling cycle.
 
@@ -373,41 +676,65 @@ def _filepaths(src):
         src: Source directory
 
     Returns:
-        filepaths: List of all yaml files in the directory
+        filepaths: List of all cache files in the directory
 
     """
-    # Initialize key variables
-    filepaths = []
-
     # Log progress
-    log_message = "Reading ingest YAML files."
+    log_message = "Reading ingest cache files."
     log.log2info(1234, log_message)
 
     # Process files
-    src_files = os.listdir(src)
-    for filename in src_files:
-        filepath = os.path.join(src, filename)
-        if os.path.isfile(filepath) and filepath.lower().endswith(".yaml"):
-            filepaths.append(filepath)
+    filepaths = spool.filepaths(src)
     return filepaths
 
 
-def _get_zone(event, filepath):
-    """Create an RZone object from YAML file data.
+def _zone_name(filepath):
+    """Get the name of the zone of the data in a cache file.
+
+    Args:
+        filepath: Cache filepath
+
+    Returns:
+        result: Zone name
+
+    """
+    # Only files written by earlier versions need to be read
+    result = spool.zone(filepath)
+    if result is None:
+        result = files.read_cache_file(filepath)["misc"]["zone"]
+    return result
+
+
+def _zone_data(event, data):
+    """Create an RZone object from device data.
 
     Args:
         event: RZone object
-        filepath: YAML filepath
+        data: Device data
 
     Returns:
         result: ZoneData object
 
     """
-    # Read the yaml file
-    data = files.read_yaml_file(filepath)
+    # Return
+    result = ZoneData(
+        idx_zone=_idx_zone(event, data["misc"]["zone"]), data=data
+    )
+    return result
+
 
+def _idx_zone(event, name):
+    """Get the index of a zone of the event, creating the zone if needed.
+
+    Args:
+        event: RZone object
+        name: Zone name
+
+    Returns:
+        result: idx_zone
+
+    """
     # Get the zone information
-    name = data["misc"]["zone"]
     exists = _zone.exists(event.idx_event, name)
 
     if bool(exists) is False:
@@ -430,7 +757,7 @@ def _get_zone(event, filepath):
         exists = _zone.exists(event.idx_event, name)
 
     # Return
-    result = ZoneData(idx_zone=exists.idx_zone, data=data)
+    result = exists.idx_zone
     return result
 
 
@@ -470,10 +797,10 @@ def insert_arptable(data, test=False):
     )
     log.log2debug(1084, log_message)
     if bool(test) is False:
-        _mac.insert_row(macs)
+        _mac.upsert_row(macs)
     else:
         for row in sorted(macs, key=attrgetter("mac")):
-            _mac.insert_row(row)
+            _mac.upsert_row(row)
 
     # Insert IP addresses for all zones
     log_message = (
@@ -482,10 +809,10 @@ def insert_arptable(data, test=False):
     )
     log.log2debug(1085, log_message)
     if bool(test) is False:
-        _ip.insert_row(ips)
+        _ip.upsert_row(ips)
     else:
         for row in sorted(ips, key=attrgetter("address")):
-            _ip.insert_row(row)
+            _ip.upsert_row(row)
 
     # Insert ARP entries for all zones
     log_message = "Updating MAC to IP address mapping in the database."
@@ -515,31 +842,36 @@ def insert_macips(items, test=False):
     if isinstance(items, list) is False:
         items = [items]
 
-    # Process data
-    for item in items:
-        # Update the database
-        mac_exists = _mac.exists(item.idx_zone, item.mac)
-        ip_exists = _ip.exists(item.idx_zone, item.ip)
+    # Process data a zone at a time
+    for idx_zone, _items in _by_zone(items).items():
+        # Get the zone's MAC and IP indexes in bulk
+        idx_macs, idx_ips = _indexes(
+            idx_zone,
+            [item.mac for item in _items],
+            [item.ip for item in _items],
+        )
 
-        # Insert
-        if bool(mac_exists) and bool(ip_exists):
-            macip_exists = _macip.exists(mac_exists.idx_mac, ip_exists.idx_ip)
-            if bool(macip_exists) is False:
+        for item in _items:
+            idx_mac = idx_macs.get(_mac_key(item.mac))
+            idx_ip = idx_ips.get(_ip_key(item.ip))
+
+            # Insert. Existing entries are updated
+            if bool(idx_mac) and bool(idx_ip):
                 # Create a DB record
                 rows.append(
                     IMacIp(
-                        idx_ip=ip_exists.idx_ip,
-                        idx_mac=mac_exists.idx_mac,
+                        idx_ip=idx_ip,
+                        idx_mac=idx_mac,
                         enabled=1,
                     )
                 )
 
     # Insert the values
     if bool(test) is False:
-        _macip.insert_row(rows)
+        _macip.upsert_row(rows)
     else:
-        for row in sorted(rows, key=attrgetter("idx_mac", "idx_ip")):
-            _macip.insert_row(row)
+        for row in sorted(set(rows), key=attrgetter("idx_mac", "idx_ip")):
+            _macip.upsert_row(row)
 
 
 def insert_ipports(items, test=False):
@@ -557,52 +889,121 @@ def insert_ipports(items, test=False):
     # Initialize key variables
     rows = []
 
-    # Process data
-    for item in items:
-        # Create expanded lower case versions of the IP address
-        myp = general.ipaddress(item.ip)
-        if bool(myp) is False:
-            continue
-
-        # Create lowercase version of mac address
-        mactest = general.mac(item.mac)
-        if bool(mactest.valid) is False:
-            continue
-        else:
-            next_mac = mactest.mac
+    # Process data a zone at a time
+    for idx_zone, _items in _by_zone(items).items():
+        # Get the zone's MAC and IP indexes in bulk
+        idx_macs, idx_ips = _indexes(
+            idx_zone,
+            [item.mac for item in _items],
+            [item.ip for item in _items],
+        )
 
-        # Verify prerequisites
-        mac_exists = _mac.exists(item.idx_zone, next_mac)
-        ip_exists = _ip.exists(item.idx_zone, myp.address)
+        # Get the ports on which the MAC addresses reside
+        macports = defaultdict(list)
+        for macport in _macport.find_idx_macs(list(idx_macs.values())):
+            macports[macport.idx_mac].append(macport)
 
-        # Skip if the IP doesn't exist, or else the following logic will crash
-        if bool(ip_exists) is False:
-            continue
+        for item in _items:
+            # Skip invalid MAC and IP addresses
+            mac_key = _mac_key(item.mac)
+            ip_key = _ip_key(item.ip)
+            if bool(mac_key) is False or bool(ip_key) is False:
+                continue
 
-        # Iterate over existing MAC entries
-        if bool(mac_exists) is True:
-            # Get the ports on which the MAC address resides
-            macports = _macport.find_idx_mac(mac_exists.idx_mac)
+            # Skip if the IP doesn't exist
+            idx_ip = idx_ips.get(ip_key)
+            if bool(idx_ip) is False:
+                continue
 
             # Iterate over the MAC assignments to interfaces
-            for macport in macports:
-                ipport_exists = _ipport.exists(
-                    macport.idx_l1interface, ip_exists.idx_ip
-                )
-
+            for macport in macports.get(idx_macs.get(mac_key), []):
                 # Assign the IP to this port
-                if bool(ipport_exists) is False:
-                    rows.append(
-                        IIpPort(
-                            idx_l1interface=macport.idx_l1interface,
-                            idx_ip=ip_exists.idx_ip,
-                            enabled=1,
-                        )
+                rows.append(
+                    IIpPort(
+                        idx_l1interface=macport.idx_l1interface,
+                        idx_ip=idx_ip,
+                        enabled=1,
                     )
+                )
 
-    # Do the inserts
+    # Do the inserts. Existing entries are updated
     if bool(test) is False:
-        _ipport.insert_row(rows)
+        _ipport.upsert_row(rows)
     else:
-        for row in sorted(rows, key=attrgetter("idx_ip", "idx_l1interface")):
-            _ipport.insert_row(row)
+        for row in sorted(
+            set(rows), key=attrgetter("idx_ip", "idx_l1interface")
+        ):
+            _ipport.upsert_row(row)
+
+
+def _by_zone(items):
+    """Group PairMacIp objects by zone.
+
+    Args:
+        items: List of PairMacIp objects
+
+    Returns:
+        result: Dict of PairMacIp object lists keyed by idx_zone
+
+    """
+    # Group
+    result = defaultdict(list)
+    for item in items:
+        result[item.idx_zone].append(item)
+    return result
+
+
+def _indexes(idx_zone, macs, ips):
+    """Get the database indexes of a zone's MAC and IP addresses in bulk.
+
+    Args:
+        idx_zone: Zone index
+        macs: List of MAC addresses
+        ips: List of IP addresses
+
+    Returns:
+        result: Tuple of dicts (idx_macs, idx_ips). idx_macs maps MAC
+            addresses to Mac.idx_mac values and idx_ips maps IP addresses
+            to Ip.idx_ip values. The addresses are in the format returned
+            by _mac_key() and _ip_key()
+
+    """
+    # Get the indexes
+    idx_macs = {_.mac: _.idx_mac for _ in _mac.findmac(idx_zone, macs)}
+    idx_ips = {_.address: _.idx_ip for _ in _ip.findip(idx_zone, ips)}
+
+    # Return
+    result = (idx_macs, idx_ips)
+    return result
+
+
+def _mac_key(_mac_):
+    """Get the format in which a MAC address is stored in the database.
+
+    Args:
+        _mac_: MAC address
+
+    Returns:
+        result: MAC address, None if invalid
+
+    """
+    # Return
+    mactest = general.mac(_mac_)
+    result = mactest.mac if bool(mactest.valid) is True else None
+    return result
+
+
+def _ip_key(_ip_):
+    """Get the format in which an IP address is stored in the database.
+
+    Args:
+        _ip_: IP address
+
+    Returns:
+        result: IP address, None if invalid
+
+    """
+    # Return
+    myp = general.ipaddress(_ip_)
+    result = myp.address if bool(myp) is True else None
+    return result
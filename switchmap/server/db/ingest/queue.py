@@ -0,0 +1,227 @@
+"""Durable queue of device data waiting to be ingested.
+
+The API server adds each device's data to the queue as it is posted and
+the ingester removes it as soon as it has been written to the database.
+The queue is a local SQLite database so that queued data survives
+restarts of either daemon.
+
+"""
+
+# Standard libraries
+import time
+
+# Import project libraries
+from switchmap.core import codec
+from switchmap.core import files
+from switchmap.core import sqlite
+
+# Seconds after which data claimed by an ingester that hasn't finished with
+# it, probably because it crashed, is given to another
+CLAIM_TIMEOUT = 3600
+
+# Data that fails to be ingested is retried after an exponentially
+# increasing delay, starting at RETRY_DELAY seconds. It is kept but no
+# longer retried after MAX_ATTEMPTS attempts, until newer data from the
+# device replaces it.
+RETRY_DELAY = 60
+MAX_ATTEMPTS = 10
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS items (
+    idx_item INTEGER PRIMARY KEY AUTOINCREMENT,
+    hostname TEXT NOT NULL,
+    zone TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    ts_created REAL NOT NULL,
+    ts_claimed REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    ts_retry REAL
+)"""
+
+# Columns added to queues created by earlier versions
+_COLUMNS = {
+    "attempts": "INTEGER NOT NULL DEFAULT 0",
+    "ts_retry": "REAL",
+}
+
+
+class Queue:
+    """Class for the ingest queue."""
+
+    def __init__(self, config):
+        """Initialize the class.
+
+        Args:
+            config: ConfigServer object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._filename = files.queue_file(config)
+
+        # Create the queue. WAL journaling lets the API server add data
+        # while the ingester is reading.
+        with self._connection() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            columns = [
+                _[1] for _ in connection.execute("PRAGMA table_info(items)")
+            ]
+            for column, definition in _COLUMNS.items():
+                if column not in columns:
+                    connection.execute(
+                        "ALTER TABLE items ADD COLUMN {} {}".format(
+                            column, definition
+                        )
+                    )
+
+    def put(self, hostname, zone, data, payload=None):
+        """Add device data to the queue.
+
+        Data from the device that is still waiting to be ingested, or
+        that failed to be ingested, is replaced as it is out of date.
+
+        Args:
+            hostname: Hostname of the device
+            zone: Zone of the device
+            data: Device data
+            payload: Data already encoded by switchmap.core.codec
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        if payload is None:
+            payload = codec.encode(data)
+
+        # Add
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                """\
+DELETE FROM items WHERE hostname = ? AND zone = ? AND ts_claimed IS NULL""",
+                (hostname, zone),
+            )
+            connection.execute(
+                """\
+INSERT INTO items (hostname, zone, payload, ts_created) VALUES (?, ?, ?, ?)""",
+                (hostname, zone, payload, time.time()),
+            )
+
+    def get(self):
+        """Claim the oldest device data in the queue.
+
+        Args:
+            None
+
+        Returns:
+            result: Tuple of (idx_item, data), None if the queue is empty
+
+        """
+        # Initialize key variables
+        result = None
+        now = time.time()
+
+        # Claim the data
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                """\
+SELECT idx_item, payload FROM items WHERE attempts < ? AND \
+((ts_claimed IS NULL AND (ts_retry IS NULL OR ts_retry <= ?)) OR \
+ts_claimed < ?) ORDER BY idx_item LIMIT 1""",
+                (MAX_ATTEMPTS, now, now - CLAIM_TIMEOUT),
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    """\
+UPDATE items SET ts_claimed = ?, attempts = attempts + 1 WHERE idx_item = ?""",
+                    (now, row[0]),
+                )
+                result = (row[0], codec.decode(row[1]))
+
+        # Return
+        return result
+
+    def done(self, idx_item):
+        """Remove ingested device data from the queue.
+
+        Args:
+            idx_item: Index of the data returned by get()
+
+        Returns:
+            None
+
+        """
+        # Remove
+        with self._connection() as connection:
+            connection.execute(
+                "DELETE FROM items WHERE idx_item = ?", (idx_item,)
+            )
+
+    def fail(self, idx_item):
+        """Release device data that failed to be ingested.
+
+        Args:
+            idx_item: Index of the data returned by get()
+
+        Returns:
+            result: Number of times ingesting the data has been attempted
+
+        """
+        # Initialize key variables
+        result = MAX_ATTEMPTS
+
+        # Schedule the next attempt
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT attempts FROM items WHERE idx_item = ?", (idx_item,)
+            ).fetchone()
+            if row is not None:
+                result = row[0]
+                connection.execute(
+                    """\
+UPDATE items SET ts_claimed = NULL, ts_retry = ? WHERE idx_item = ?""",
+                    (
+                        time.time() + RETRY_DELAY * 2 ** max(0, result - 1),
+                        idx_item,
+                    ),
+                )
+
+        # Return
+        return result
+
+    def size(self):
+        """Get the number of device data items in the queue.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of items
+
+        """
+        # Return
+        with self._connection() as connection:
+            result = connection.execute(
+                "SELECT COUNT(*) FROM items"
+            ).fetchone()[0]
+        return result
+
+    def _connection(self):
+        """Connect to the queue.
+
+        Args:
+            None
+
+        Returns:
+            result: sqlite.Connection object
+
+        """
+        # Return
+        result = sqlite.Connection(self._filename)
+        return result
@@ -0,0 +1,211 @@
+"""Reverse DNS resolution of the IP addresses found during ingest.
+
+Addresses are resolved concurrently and the results, including failures,
+are cached in a local SQLite database so that they survive between ingest
+cycles. Most hosts keep their PTR records between polls, so only a small
+fraction of the addresses in each cycle need to be looked up.
+
+"""
+
+# Standard libraries
+import time
+import socket
+from concurrent import futures
+
+# PIP libraries
+import more_itertools as mit
+
+# Import project libraries
+from switchmap.core import log
+from switchmap.core import files
+from switchmap.core import sqlite
+
+# Number of addresses read from the cache per query
+_CHUNK_SIZE = 500
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS hostnames (
+    address TEXT PRIMARY KEY,
+    hostname TEXT,
+    ts_expires REAL NOT NULL
+)"""
+
+
+class Resolver:
+    """Class resolving the hostnames of IP addresses."""
+
+    def __init__(self, config):
+        """Initialize the class.
+
+        Args:
+            config: ConfigServer object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._filename = files.dns_file(config)
+        self._ttl = config.dns_cache_ttl()
+        self._negative_ttl = config.dns_negative_cache_ttl()
+        self._timeout = config.dns_timeout()
+        self._workers = max(1, config.dns_workers())
+
+        # Create the cache. WAL journaling lets parallel ingest processes
+        # use the cache at the same time.
+        with self._connection() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+
+    def resolve(self, addresses):
+        """Get the hostnames of IP addresses.
+
+        Args:
+            addresses: List of IP addresses
+
+        Returns:
+            result: Dict of hostnames keyed by IP address. The hostname is
+                None if it couldn't be found
+
+        """
+        # Initialize key variables
+        addresses = sorted(set(addresses))
+        now = time.time()
+
+        # Get the hostnames in the cache
+        result = self._cached(addresses, now)
+        missing = [_ for _ in addresses if _ not in result]
+        if bool(missing) is False:
+            return result
+
+        # Resolve the remainder. Lookups that timed out have no hostname
+        hostnames = self._lookup(missing)
+        result.update({_: None for _ in missing})
+        result.update(hostnames)
+
+        # Update the cache. Lookups that timed out are retried next time
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                "INSERT OR REPLACE INTO hostnames VALUES (?, ?, ?)",
+                [
+                    (
+                        address,
+                        hostname,
+                        now
+                        + (
+                            self._negative_ttl
+                            if hostname is None
+                            else self._ttl
+                        ),
+                    )
+                    for address, hostname in hostnames.items()
+                ],
+            )
+
+        # Return
+        return result
+
+    def _cached(self, addresses, now):
+        """Get the unexpired hostnames of IP addresses from the cache.
+
+        Args:
+            addresses: List of IP addresses
+            now: Current time
+
+        Returns:
+            result: Dict of hostnames keyed by IP address
+
+        """
+        # Initialize key variables
+        result = {}
+
+        # Get the hostnames in chunks to stay within SQLite's limit on the
+        # number of query parameters
+        with self._connection() as connection:
+            for chunk in mit.chunked(addresses, _CHUNK_SIZE):
+                rows = connection.execute(
+                    """\
+SELECT address, hostname FROM hostnames WHERE ts_expires > ? AND address IN \
+({})""".format(
+                        ", ".join("?" * len(chunk))
+                    ),
+                    [now] + chunk,
+                )
+                result.update(rows)
+
+        # Return
+        return result
+
+    def _lookup(self, addresses):
+        """Look up the hostnames of IP addresses concurrently.
+
+        The system resolver can't be given a timeout, so the timeout is
+        applied to the batch as a whole rather than to each lookup. This
+        limits the time spent on DNS whatever the number of addresses.
+
+        Args:
+            addresses: List of IP addresses
+
+        Returns:
+            result: Dict of hostnames keyed by IP address. The hostname is
+                None if it couldn't be found. Lookups that didn't complete
+                within the timeout are omitted
+
+        """
+        # Initialize key variables
+        result = {}
+
+        # Resolve
+        executor = futures.ThreadPoolExecutor(max_workers=self._workers)
+        try:
+            jobs = {executor.submit(_gethostbyaddr, _): _ for _ in addresses}
+            done, not_done = futures.wait(jobs, timeout=self._timeout)
+            for job in done:
+                result[jobs[job]] = job.result()
+        finally:
+            # Don't wait for lookups that timed out
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Log
+        if bool(not_done) is True:
+            log_message = """\
+DNS lookups of {} of {} IP addresses timed out""".format(
+                len(not_done), len(addresses)
+            )
+            log.log2info(2036, log_message)
+
+        # Return
+        return result
+
+    def _connection(self):
+        """Connect to the cache.
+
+        Args:
+            None
+
+        Returns:
+            result: sqlite.Connection object
+
+        """
+        # Return
+        result = sqlite.Connection(self._filename)
+        return result
+
+
+def _gethostbyaddr(address):
+    """Get the hostname of an IP address.
+
+    Args:
+        address: IP address
+
+    Returns:
+        result: Hostname, None if not found
+
+    """
+    # Return
+    try:
+        result = socket.gethostbyaddr(address)[0]
+    except (OSError, UnicodeError):
+        result = None
+    return result
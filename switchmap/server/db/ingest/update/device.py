@@ -7,6 +7,7 @@ from operator import attrgetter
 
 # Application imports
 from switchmap.core import log
+from switchmap.core import general
 from switchmap.server.db.ingest.query import device as _misc_device
 from switchmap.server.db.misc import interface as _historical
 from switchmap.server.db.table import device as _device
@@ -109,6 +110,40 @@ def _lookup(idx_device):
     return result
 
 
+def _maclookup(idx_zone, macs):
+    """Create in memory lookup data for the MACs learned by a device.
+
+    Args:
+        idx_zone: Zone index
+        macs: List of MAC addresses in the format reported by the device
+
+    Returns:
+        result: Dict of RMac tuples keyed by MAC address in the format
+            reported by the device. Invalid and unknown MACs are omitted
+
+    """
+    # Initialize key variables
+    result = {}
+    keys = {}
+
+    # Validate each unique MAC only once
+    for item in set(macs):
+        mactest = general.mac(item)
+        if bool(mactest.valid) is True:
+            keys[item] = mactest.mac
+
+    # Get the MACs from the database
+    rows = {
+        _.mac: _ for _ in _mac.findmac(idx_zone, sorted(set(keys.values())))
+    }
+
+    # Return
+    for item, key in keys.items():
+        if key in rows:
+            result[item] = rows[key]
+    return result
+
+
 class Status:
     """Tracks the status of various Topology methods."""
 
@@ -475,6 +510,16 @@ class Topology:
         # Get all the existing ifindexes
         db_ifindexes = {_.ifindex: _ for _ in lookup.ifindexes}
 
+        # Get all the existing MACs learned by the device in one bulk query
+        db_macs = _maclookup(
+            self._device.idx_zone,
+            [
+                item
+                for interface in interfaces.values()
+                for item in interface.get("l1_macs") or []
+            ],
+        )
+
         # Process each interface
         for ifindex, interface in sorted(interfaces.items()):
             if_exists = db_ifindexes.get(ifindex)
@@ -494,7 +539,7 @@ class Topology:
                 # Iterate over the MACs found
                 for item in sorted(_macs):
                     # Ensure the MAC exists in the database
-                    mac_exists = _mac.exists(self._device.idx_zone, item)
+                    mac_exists = db_macs.get(item)
 
                     # If True update the port to MAC address mapping
                     if bool(mac_exists) is True:
@@ -506,15 +551,15 @@ class Topology:
                             )
                         )
 
-        # Insert rows
+        # Insert rows. Existing entries are updated
         if bool(inserts) is True:
             if bool(test) is False:
-                _macport.insert_row(inserts)
+                _macport.upsert_row(inserts)
             else:
                 for insert in sorted(
-                    inserts, key=attrgetter("idx_mac", "idx_l1interface")
+                    set(inserts), key=attrgetter("idx_mac", "idx_l1interface")
                 ):
-                    _macport.insert_row(insert)
+                    _macport.upsert_row(insert)
 
         # Log
         self.log("MacPort", updated=True)
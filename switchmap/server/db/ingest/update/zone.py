@@ -1,13 +1,14 @@
 """Module for updating the database with topology data."""
 
 import time
-import socket
 from copy import deepcopy
 
 # Application imports
 from switchmap.core import log
 from switchmap.core import general
 from switchmap.server.db.table import oui as _oui
+from switchmap.server.db.ingest.resolver import Resolver
+from switchmap.server.configuration import ConfigServer
 from switchmap.server import ZoneObjects
 from switchmap.server import PairMacIp
 from switchmap.server.db.table import (
@@ -16,23 +17,40 @@ from switchmap.server.db.table import (
 )
 
 
-def process(data, idx_zone, dns=True):
+def process(data, idx_zone, dns=True, hostnames=None):
     """Process data received from a device.
 
     Args:
         data: Device data (dict)
         idx_zone: Zone index to which the data belongs
         dns: Do DNS lookups if True
+        hostnames: Dict of hostnames keyed by IP address from hostnames().
+            The hostnames are looked up if None
 
     Returns:
         results: ZoneObjects object
     """
     # Process the device
-    _topology = Topology(data, idx_zone, dns=dns)
+    _topology = Topology(data, idx_zone, dns=dns, hostnames=hostnames)
     result = _topology.process()
     return result
 
 
+def hostnames(data):
+    """Get the hostnames of the IP addresses in a device's ARP tables.
+
+    Args:
+        data: Device data (dict)
+
+    Returns:
+        result: Dict of hostnames keyed by IP address
+    """
+    # Return
+    addresses = [_.ip for _ in _arp_table(None, data)]
+    result = Resolver(ConfigServer()).resolve(addresses)
+    return result
+
+
 class Status:
     """Tracks the status of various Topology methods."""
 
@@ -124,13 +142,15 @@ class Status:
 class Topology:
     """Update Device data in the database."""
 
-    def __init__(self, data, idx_zone, dns=True):
+    def __init__(self, data, idx_zone, dns=True, hostnames=None):
         """Initialize class.
 
         Args:
             data: Dict of device data
             idx_zone: idx_zone of the Zone being processed
             dns: Do DNS lookups if True
+            hostnames: Dict of hostnames keyed by IP address from
+                hostnames(). The hostnames are looked up if None
 
         Returns:
             None
@@ -139,6 +159,7 @@ class Topology:
         self._data = deepcopy(data)
         self._idx_zone = idx_zone
         self._dns = dns
+        self._hostnames = hostnames
         self._valid = False not in [
             bool(data),
             isinstance(data, dict),
@@ -257,16 +278,20 @@ class Topology:
         # Log
         self.log("Ip")
 
+        # Resolve the hostnames of all the addresses at once
+        if bool(dns) is False:
+            hostnames = {}
+        elif self._hostnames is None:
+            hostnames = Resolver(ConfigServer()).resolve(
+                [_.ip for _ in self._arp_table]
+            )
+        else:
+            hostnames = self._hostnames
+
         # Process the ARP Table
         for item in self._arp_table:
             # Get hostname for DB
-            if bool(dns) is True:
-                try:
-                    hostname = socket.gethostbyaddr(item.ip)[0]
-                except:
-                    hostname = None
-            else:
-                hostname = None
+            hostname = hostnames.get(item.ip)
 
             # Create a DB record
             rows.append(
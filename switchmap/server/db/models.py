@@ -5,6 +5,8 @@ import datetime
 
 # SQLalchemy imports
 from sqlalchemy import Column, DateTime, ForeignKey, text, UniqueConstraint
+from sqlalchemy import inspect, exc
+from sqlalchemy.schema import AddConstraint
 from sqlalchemy.dialects.mysql import BIGINT, VARBINARY, BIT
 from sqlalchemy.orm import backref, relationship
 from sqlalchemy.ext.declarative import declarative_base
@@ -13,6 +15,7 @@ from sqlalchemy.orm import Session
 
 # Project imports
 from switchmap.server.db import SCOPED_SESSION, ENGINE
+from switchmap.core import log
 
 ###############################################################################
 # Create BASE SQLAlchemy class. This must be in the same file as the database
@@ -121,7 +124,10 @@ class Zone(BASE):
     """Database table definition."""
 
     __tablename__ = "smap_zone"
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    __table_args__ = (
+        UniqueConstraint("idx_event", "name"),
+        {"mysql_engine": "InnoDB"},
+    )
 
     idx_zone = Column(BIGINT(20, unsigned=True), primary_key=True, unique=True)
     idx_event = Column(
@@ -160,7 +166,10 @@ class Device(BASE):
     """Database table definition."""
 
     __tablename__ = "smap_device"
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    __table_args__ = (
+        UniqueConstraint("idx_zone", "hostname"),
+        {"mysql_engine": "InnoDB"},
+    )
 
     idx_device = Column(
         BIGINT(20, unsigned=True), primary_key=True, unique=True
@@ -648,3 +657,64 @@ def create_all_tables():
     with ENGINE.connect() as connection:
         with Session(bind=connection) as session:
             BASE.metadata.create_all(session.get_bind(), checkfirst=True)
+
+    # Upgrade tables created by earlier versions
+    create_unique_keys()
+
+
+def create_unique_keys():
+    """Add missing unique keys to existing tables.
+
+    Tables created by earlier versions may lack the unique keys on which
+    the ingester's upserts rely. create_all_tables() doesn't alter existing
+    tables.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Get the existing unique keys
+    with ENGINE.connect() as connection:
+        inspector = inspect(connection)
+        existing = {
+            table: set(
+                [
+                    tuple(_["column_names"])
+                    for _ in inspector.get_unique_constraints(table)
+                ]
+                + [
+                    tuple(_["column_names"])
+                    for _ in inspector.get_indexes(table)
+                    if bool(_["unique"]) is True
+                ]
+            )
+            for table in inspector.get_table_names()
+        }
+
+    # Add the missing keys
+    for table in BASE.metadata.sorted_tables:
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint) is False:
+                continue
+            columns = tuple(_.name for _ in constraint.columns)
+            if columns in existing.get(table.name, [columns]):
+                continue
+
+            # Add
+            log_message = "Adding unique key {} to table {}".format(
+                columns, table.name
+            )
+            log.log2info(2046, log_message)
+            try:
+                with ENGINE.begin() as connection:
+                    connection.execute(AddConstraint(constraint))
+            except exc.SQLAlchemyError:
+                log_message = """\
+Unable to add unique key {} to table {}. Remove duplicate rows and restart. \
+Purging old events may help""".format(
+                    columns, table.name
+                )
+                log.log2warning(2047, log_message)
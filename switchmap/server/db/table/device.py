@@ -1,10 +1,15 @@
 """Module for querying the Device table."""
 
-from sqlalchemy import select, update, null, and_
+from sqlalchemy import select, update, null, and_, insert
+from sqlalchemy import delete as _delete
 
 # Import project libraries
 from switchmap.server.db import db
 from switchmap.server.db.models import Device as _Device
+from switchmap.server.db.models import L1Interface as _L1Interface
+from switchmap.server.db.models import IpPort as _IpPort
+from switchmap.server.db.models import MacPort as _MacPort
+from switchmap.server.db.models import VlanPort as _VlanPort
 from switchmap.server.db.misc import rows as _rows
 
 
@@ -87,6 +92,33 @@ def devices(idx_zone):
     return result
 
 
+def delete_ports(idx_device):
+    """Delete the MAC, IP and VLAN to port mappings of a device.
+
+    Args:
+        idx_device: Device index
+
+    Returns:
+        None
+
+    """
+    # Select the device's interfaces
+    l1interfaces = select(_L1Interface.idx_l1interface).where(
+        _L1Interface.idx_device == idx_device
+    )
+
+    # Delete the mappings
+    for code, table in [
+        (2055, _IpPort),
+        (2056, _MacPort),
+        (2057, _VlanPort),
+    ]:
+        statement = _delete(table).where(
+            table.idx_l1interface.in_(l1interfaces)
+        )
+        db.db_delete(code, statement)
+
+
 def insert_row(rows):
     """Create a Device table entry.
 
@@ -110,38 +142,38 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            _Device(
-                idx_zone=row.idx_zone,
-                sys_name=(
-                    null() if row.sys_name is None else row.sys_name.encode()
+            {
+                "idx_zone": row.idx_zone,
+                "sys_name": (
+                    None if row.sys_name is None else row.sys_name.encode()
                 ),
-                hostname=(
-                    null() if row.hostname is None else row.hostname.encode()
+                "hostname": (
+                    None if row.hostname is None else row.hostname.encode()
                 ),
-                name=(null() if row.name is None else row.name.encode()),
-                sys_description=(
-                    null()
+                "name": (None if row.name is None else row.name.encode()),
+                "sys_description": (
+                    None
                     if row.sys_description is None
                     else row.sys_description.encode()
                 ),
-                sys_objectid=(
-                    null()
+                "sys_objectid": (
+                    None
                     if row.sys_objectid is None
                     else row.sys_objectid.encode()
                 ),
-                sys_uptime=(
-                    null() if row.sys_uptime is None else row.sys_uptime
+                "sys_uptime": (
+                    None if row.sys_uptime is None else row.sys_uptime
                 ),
-                last_polled=(
+                "last_polled": (
                     0 if row.last_polled is None else row.last_polled
                 ),
-                enabled=int(bool(row.enabled) is True),
-            )
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1156, inserts)
+        db.db_insert(1156, insert(_Device), inserts)
 
 
 def update_row(idx, row):
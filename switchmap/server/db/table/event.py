@@ -1,22 +1,39 @@
 """Module for querying the Event table."""
 
 # Standard imports
+import time
 from datetime import datetime, timezone
 from operator import attrgetter
 
 # PIP imports
-from sqlalchemy import select, update, delete as _delete
+from sqlalchemy import select, update, delete as _delete, insert
 
 # Import project libraries
 from switchmap.server.db import db
 from switchmap.server.db.models import Event
 from switchmap.server.db.misc import rows as _rows
 
-from switchmap.server.db.models import Root
+from switchmap.server.db.models import (
+    Root,
+    Zone,
+    Device,
+    L1Interface,
+    Vlan,
+    VlanPort,
+    Mac,
+    MacPort,
+    Ip,
+    IpPort,
+    MacIp,
+)
 from switchmap.server.db.table import IEvent
 from switchmap.server.db.table import IRoot
 from switchmap.server.db.table import root
 from switchmap.core import general
+from switchmap.core import log
+
+# Maximum number of rows deleted per statement when purging an event
+PURGE_BATCH_SIZE = 5000
 
 
 def idx_exists(idx):
@@ -92,16 +109,16 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            Event(
-                name=row.name.encode(),
-                epoch_utc=row.epoch_utc,
-                enabled=int(bool(row.enabled) is True),
-            )
+            {
+                "name": row.name.encode(),
+                "epoch_utc": row.epoch_utc,
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1157, inserts)
+        db.db_insert(1157, insert(Event), inserts)
 
 
 def update_row(idx, row):
@@ -153,11 +170,18 @@ def events():
     return result
 
 
-def delete(idx):
+def delete(idx, batch_size=PURGE_BATCH_SIZE, pause=0):
     """Delete event.
 
+    The event's data is deleted table by table, children first, in batches
+    of limited size. This keeps transactions and row locks short instead
+    of relying on cascading deletes of all the data in one transaction.
+
     Args:
         idx: idx_event
+        batch_size: Maximum number of rows to delete per statement
+        pause: Seconds to wait between statements to give other database
+            users a chance to run
 
     Returns:
         None
@@ -171,14 +195,87 @@ def delete(idx):
     # Don't delete the very first record.
     # This must always exist for polling to work correctly
     if idx != 1:
-        # Delete data
-        statement = _delete(Event).where(Event.idx_event == idx)
-        db.db_delete(1055, statement)
+        # Delete the data
+        for table, key, condition in _children(idx):
+            count = 0
+            while True:
+                statement = (
+                    select(key).where(condition).limit(max(1, batch_size))
+                )
+                keys = db.db_select_row(2037, statement)
+                if bool(keys) is False:
+                    break
+                count += db.db_delete(
+                    2038, _delete(table).where(key.in_(keys))
+                )
+                time.sleep(pause)
+
+            # Report progress
+            if bool(count) is True:
+                log_message = "Purged {} {} rows of event {}".format(
+                    count, table.__tablename__, idx
+                )
+                log.log2debug(2039, log_message)
 
         # Delete root
         statement = _delete(Root).where(Root.idx_event == idx)
         db.db_delete(1053, statement)
 
+        # Delete event
+        statement = _delete(Event).where(Event.idx_event == idx)
+        db.db_delete(1055, statement)
+
+
+def _children(idx):
+    """Get the tables holding the data of an event, children first.
+
+    Args:
+        idx: idx_event
+
+    Returns:
+        result: List of (table, primary key, condition) tuples. The
+            condition selects the table's rows belonging to the event
+
+    """
+    # Select the parents of the event's rows
+    zones = select(Zone.idx_zone).where(Zone.idx_event == idx)
+    devices = select(Device.idx_device).where(Device.idx_zone.in_(zones))
+    l1interfaces = select(L1Interface.idx_l1interface).where(
+        L1Interface.idx_device.in_(devices)
+    )
+    ips = select(Ip.idx_ip).where(Ip.idx_zone.in_(zones))
+
+    # Return
+    result = [
+        (
+            IpPort,
+            IpPort.idx_ipport,
+            IpPort.idx_l1interface.in_(l1interfaces),
+        ),
+        (
+            MacPort,
+            MacPort.idx_macport,
+            MacPort.idx_l1interface.in_(l1interfaces),
+        ),
+        (
+            VlanPort,
+            VlanPort.idx_vlanport,
+            VlanPort.idx_l1interface.in_(l1interfaces),
+        ),
+        (MacIp, MacIp.idx_macip, MacIp.idx_ip.in_(ips)),
+        (
+            L1Interface,
+            L1Interface.idx_l1interface,
+            L1Interface.idx_device.in_(devices),
+        ),
+        (Vlan, Vlan.idx_vlan, Vlan.idx_device.in_(devices)),
+        (Device, Device.idx_device, Device.idx_zone.in_(zones)),
+        (Mac, Mac.idx_mac, Mac.idx_zone.in_(zones)),
+        (Ip, Ip.idx_ip, Ip.idx_zone.in_(zones)),
+        (Zone, Zone.idx_zone, Zone.idx_event == idx),
+    ]
+    return result
+
 
 def create(name=None):
     """Create an event.
@@ -215,11 +312,12 @@ def create(name=None):
     return result
 
 
-def purge():
+def purge(batch_size=PURGE_BATCH_SIZE, pause=0):
     """Purge all events except the most recent two.
 
     Args:
-        None
+        batch_size: Maximum number of rows to delete per statement
+        pause: Seconds to wait between statements
 
     Returns:
         result: None
@@ -235,8 +333,14 @@ def purge():
     last = indexes[-1]
     penultimate = indexes[-2] if len(indexes) > 1 else 1
 
-    for item in _events:
-        if item.idx_event in [1, last, penultimate]:
-            continue
-        else:
-            delete(item.idx_event)
+    # Get the events to purge, oldest first
+    purges = [_ for _ in indexes if _ not in [1, last, penultimate]]
+
+    for count, item in enumerate(purges, start=1):
+        delete(item, batch_size=batch_size, pause=pause)
+
+        # Report progress
+        log_message = "Purged event {}. {} of {} events purged".format(
+            item, count, len(purges)
+        )
+        log.log2info(2040, log_message)
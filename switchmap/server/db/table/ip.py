@@ -1,6 +1,8 @@
 """Module for querying the Ip table."""
 
 from sqlalchemy import select, update, null, and_, func
+from sqlalchemy.dialects.mysql import insert
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
@@ -123,12 +125,12 @@ def findip(idx_zone, ips):
             if bool(ip_):
                 all_ips.append(general.ipaddress(item).address.encode())
 
-        # Get row from dataase
-        if bool(all_ips):
+        # Get rows from database in chunks to limit the query size
+        for chunk in mit.chunked(sorted(set(all_ips)), db.CHUNK_SIZE):
             statement = select(Ip).where(
-                and_(Ip.address.in_(all_ips), Ip.idx_zone == idx_zone)
+                and_(Ip.address.in_(chunk), Ip.idx_zone == idx_zone)
             )
-            rows = db.db_select_row(1068, statement)
+            rows.extend(db.db_select_row(1068, statement))
 
     # Return
     for row in rows:
@@ -145,9 +147,54 @@ def insert_row(rows):
     Returns:
         None
 
+    """
+    # Get the values
+    values = _values(rows)
+
+    # Insert
+    if bool(values):
+        db.db_insert(1065, insert(Ip), values)
+
+
+def upsert_row(rows):
+    """Create Ip table entries, updating those that already exist.
+
+    Rows are matched on the (idx_zone, address) unique key, so no query is
+    needed to find out whether they exist.
+
+    Args:
+        rows: IIp objects
+
+    Returns:
+        None
+
+    """
+    # Get the values
+    values = _values(rows)
+
+    # Insert
+    if bool(values):
+        statement = insert(Ip)
+        statement = statement.on_duplicate_key_update(
+            hostname=statement.inserted.hostname,
+            version=statement.inserted.version,
+            enabled=statement.inserted.enabled,
+        )
+        db.db_insert(2042, statement, values)
+
+
+def _values(rows):
+    """Convert IIp objects to Ip table column values.
+
+    Args:
+        rows: IIp objects
+
+    Returns:
+        values: List of dicts of column values, one per unique row
+
     """
     # Initialize key variables
-    inserts = []
+    values = []
 
     # Create list
     if isinstance(rows, list) is False:
@@ -162,23 +209,24 @@ def insert_row(rows):
         ip = general.ipaddress(row.address)
 
         # Do the insertion
-        inserts.append(
-            Ip(
-                idx_zone=row.idx_zone,
-                hostname=(
-                    null()
+        values.append(
+            {
+                "idx_zone": row.idx_zone,
+                "hostname": (
+                    None
                     if bool(row.hostname) is False
                     else row.hostname.encode()
                 ),
-                version=row.version,
-                address=(null() if bool(ip) is False else ip.address.encode()),
-                enabled=int(bool(row.enabled) is True),
-            )
+                "version": row.version,
+                "address": (
+                    None if bool(ip) is False else ip.address.encode()
+                ),
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
-    # Insert
-    if bool(inserts):
-        db.db_add_all(1065, inserts)
+    # Return
+    return values
 
 
 def update_row(idx, row):
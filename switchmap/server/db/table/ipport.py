@@ -1,10 +1,13 @@
 """Module for querying the IpPort table."""
 
 from sqlalchemy import select, update, and_
+from sqlalchemy.dialects.mysql import insert
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
-from switchmap.server.db.models import IpPort
+from switchmap.server.db.models import IpPort, MacPort, MacIp, L1Interface
+from switchmap.server.db.table import IIpPort
 from switchmap.server.db.misc import rows as _rows
 
 
@@ -88,6 +91,61 @@ def find_idx_ip(idx_ip):
     return result
 
 
+def find_idx_ips(idx_ips):
+    """Find all ports on which a list of IP addresses have been found.
+
+    Args:
+        idx_ips: List of Ip.idx_ip values
+
+    Returns:
+        result: List of RIpPort tuples
+
+    """
+    # Initialize key variables
+    result = []
+
+    # Get rows from database in chunks to limit the query size
+    for chunk in mit.chunked(sorted(set(idx_ips)), db.CHUNK_SIZE):
+        statement = select(IpPort).where(IpPort.idx_ip.in_(chunk))
+        rows = db.db_select_row(2035, statement)
+        result.extend(_rows.ipport(row) for row in rows)
+
+    # Return
+    return result
+
+
+def implied(idx_device):
+    """Find the IP addresses of the MAC addresses on a device's ports.
+
+    Args:
+        idx_device: Device.idx_device
+
+    Returns:
+        result: List of IIpPort tuples
+
+    """
+    # Get rows from the MAC to port and MAC to IP address mappings
+    statement = (
+        select(MacPort.idx_l1interface, MacIp.idx_ip)
+        .join(MacIp, MacIp.idx_mac == MacPort.idx_mac)
+        .join(
+            L1Interface,
+            L1Interface.idx_l1interface == MacPort.idx_l1interface,
+        )
+        .where(L1Interface.idx_device == idx_device)
+    )
+    rows = db.db_select(2058, statement)
+
+    # Return
+    result = [
+        IIpPort(
+            idx_l1interface=row.idx_l1interface, idx_ip=row.idx_ip, enabled=1
+        )
+        for row in rows
+    ]
+    return result
+
+
 def insert_row(rows):
     """Create a IpPort table entry.
 
@@ -97,9 +155,52 @@ def insert_row(rows):
     Returns:
         None
 
+    """
+    # Get the values
+    values = _values(rows)
+
+    # Insert
+    if bool(values):
+        db.db_insert(1063, insert(IpPort), values)
+
+
+def upsert_row(rows):
+    """Create IpPort table entries, updating those that already exist.
+
+    Rows are matched on the (idx_l1interface, idx_ip) unique key, so no
+    query is needed to find out whether they exist.
+
+    Args:
+        rows: IIpPort objects
+
+    Returns:
+        None
+
+    """
+    # Get the values
+    values = _values(rows)
+
+    # Insert
+    if bool(values):
+        statement = insert(IpPort)
+        statement = statement.on_duplicate_key_update(
+            enabled=statement.inserted.enabled
+        )
+        db.db_insert(2045, statement, values)
+
+
+def _values(rows):
+    """Convert IIpPort objects to IpPort table column values.
+
+    Args:
+        rows: IIpPort objects
+
+    Returns:
+        values: List of dicts of column values, one per unique row
+
     """
     # Initialize key variables
-    inserts = []
+    values = []
 
     # Create list
     if isinstance(rows, list) is False:
@@ -110,17 +211,16 @@ def insert_row(rows):
 
     # Create objects
     for row in rows:
-        inserts.append(
-            IpPort(
-                idx_l1interface=row.idx_l1interface,
-                idx_ip=row.idx_ip,
-                enabled=int(bool(row.enabled) is True),
-            )
+        values.append(
+            {
+                "idx_l1interface": row.idx_l1interface,
+                "idx_ip": row.idx_ip,
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
-    # Insert
-    if bool(inserts):
-        db.db_add_all(1063, inserts)
+    # Return
+    return values
 
 
 def update_row(idx, row):
@@ -1,6 +1,6 @@
 """Module for querying the L1Interface table."""
 
-from sqlalchemy import select, update, and_, null, func
+from sqlalchemy import select, update, and_, null, func, insert
 
 # Import project libraries
 from switchmap.server.db import db
@@ -152,73 +152,75 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            L1Interface(
-                idx_device=row.idx_device,
-                ifindex=row.ifindex,
-                duplex=null() if row.duplex is None else row.duplex,
-                ethernet=null() if row.ethernet is None else row.ethernet,
-                nativevlan=(
-                    null() if row.nativevlan is None else row.nativevlan
+            {
+                "idx_device": row.idx_device,
+                "ifindex": row.ifindex,
+                "duplex": None if row.duplex is None else row.duplex,
+                "ethernet": None if row.ethernet is None else row.ethernet,
+                "nativevlan": (
+                    None if row.nativevlan is None else row.nativevlan
                 ),
-                trunk=null() if row.trunk is None else row.trunk,
-                iftype=null() if row.iftype is None else row.iftype,
-                ifspeed=null() if row.ifspeed is None else row.ifspeed,
-                ifalias=(
-                    null() if row.ifalias is None else row.ifalias.encode()
+                "trunk": None if row.trunk is None else row.trunk,
+                "iftype": None if row.iftype is None else row.iftype,
+                "ifspeed": None if row.ifspeed is None else row.ifspeed,
+                "ifalias": (
+                    None if row.ifalias is None else row.ifalias.encode()
                 ),
-                ifname=(null() if row.ifname is None else row.ifname.encode()),
-                ifdescr=(
-                    null() if row.ifdescr is None else row.ifdescr.encode()
+                "ifname": (
+                    None if row.ifname is None else row.ifname.encode()
                 ),
-                ifadminstatus=(
-                    null() if row.ifadminstatus is None else row.ifadminstatus
+                "ifdescr": (
+                    None if row.ifdescr is None else row.ifdescr.encode()
                 ),
-                ifoperstatus=(
-                    null() if row.ifoperstatus is None else row.ifoperstatus
+                "ifadminstatus": (
+                    None if row.ifadminstatus is None else row.ifadminstatus
                 ),
-                ts_idle=0 if not bool(row.ts_idle) else row.ts_idle,
-                cdpcachedeviceid=(
-                    null()
+                "ifoperstatus": (
+                    None if row.ifoperstatus is None else row.ifoperstatus
+                ),
+                "ts_idle": 0 if not bool(row.ts_idle) else row.ts_idle,
+                "cdpcachedeviceid": (
+                    None
                     if row.cdpcachedeviceid is None
                     else row.cdpcachedeviceid.encode()
                 ),
-                cdpcachedeviceport=(
-                    null()
+                "cdpcachedeviceport": (
+                    None
                     if row.cdpcachedeviceport is None
                     else row.cdpcachedeviceport.encode()
                 ),
-                cdpcacheplatform=(
-                    null()
+                "cdpcacheplatform": (
+                    None
                     if row.cdpcacheplatform is None
                     else row.cdpcacheplatform.encode()
                 ),
-                lldpremportdesc=(
-                    null()
+                "lldpremportdesc": (
+                    None
                     if row.lldpremportdesc is None
                     else row.lldpremportdesc.encode()
                 ),
-                lldpremsyscapenabled=(
-                    null()
+                "lldpremsyscapenabled": (
+                    None
                     if row.lldpremsyscapenabled is None
                     else row.lldpremsyscapenabled.encode()
                 ),
-                lldpremsysdesc=(
-                    null()
+                "lldpremsysdesc": (
+                    None
                     if row.lldpremsysdesc is None
                     else row.lldpremsysdesc.encode()
                 ),
-                lldpremsysname=(
-                    null()
+                "lldpremsysname": (
+                    None
                     if row.lldpremsysname is None
                     else row.lldpremsysname.encode()
                 ),
-                enabled=int(bool(row.enabled) is True),
-            )
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1154, inserts)
+        db.db_insert(1154, insert(L1Interface), inserts)
 
 
 def update_row(idx, row):
@@ -1,6 +1,8 @@
 """Module for querying the Mac table."""
 
 from sqlalchemy import select, update, null, and_
+from sqlalchemy.dialects.mysql import insert
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
@@ -99,11 +101,12 @@ def findmac(idx_zone, macs):
                 _mac_ = mactest.mac
             all_macs.append(_mac_.encode())
 
-        # Get row from dataase
-        statement = select(Mac).where(
-            and_(Mac.mac.in_(all_macs), Mac.idx_zone == idx_zone)
-        )
-        rows = db.db_select_row(1193, statement)
+        # Get rows from database in chunks to limit the query size
+        for chunk in mit.chunked(sorted(set(all_macs)), db.CHUNK_SIZE):
+            statement = select(Mac).where(
+                and_(Mac.mac.in_(chunk), Mac.idx_zone == idx_zone)
+            )
+            rows.extend(db.db_select_row(1193, statement))
 
     # Return
     for row in rows:
@@ -120,9 +123,53 @@ def insert_row(rows):
     Returns:
         None
 
+    """
+    # Get the values
+    values = _values(rows)
+
+    # Insert
+    if bool(values):
+        db.db_insert(1087, insert(Mac), values)
+
+
+def upsert_row(rows):
+    """Create Mac table entries, updating those that already exist.
+
+    Rows are matched on the (mac, idx_zone) unique key, so no query is
+    needed to find out whether they exist.
+
+    Args:
+        rows: IMac objects
+
+    Returns:
+        None
+
+    """
+    # Get the values
+    values = _values(rows)
+
+    # Insert
+    if bool(values):
+        statement = insert(Mac)
+        statement = statement.on_duplicate_key_update(
+            enabled=statement.inserted.enabled
+        )
+        db.db_insert(2041, statement, values)
+
+
+def _values(rows):
+    """Convert IMac objects to Mac table column values.
+
+    Args:
+        rows: IMac objects
+
+    Returns:
+        values: List of dicts of column values, one per unique row
+
     """
     # Initialize key variables
-    inserts = []
+    values = []
+    idx_ouis = {}
 
     # Create list
     if isinstance(rows, list) is False:
@@ -142,22 +189,23 @@ def insert_row(rows):
         else:
             mac = mactest.mac
 
-        # Find the true idx_oui
-        idx_oui = oui.idx_oui(mac)
+        # Find the true idx_oui. Look up each OUI only once
+        if mac[:6] not in idx_ouis:
+            idx_ouis[mac[:6]] = oui.idx_oui(mac)
+        idx_oui = idx_ouis[mac[:6]]
 
         # Do the insertion
-        inserts.append(
-            Mac(
-                idx_oui=idx_oui,
-                idx_zone=row.idx_zone,
-                mac=(null() if bool(mac) is False else mac.encode()),
-                enabled=int(bool(row.enabled) is True),
-            )
+        values.append(
+            {
+                "idx_oui": idx_oui,
+                "idx_zone": row.idx_zone,
+                "mac": (None if bool(mac) is False else mac.encode()),
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
-    # Insert
-    if bool(inserts):
-        db.db_add_all(1087, inserts)
+    # Return
+    return values
 
 
 def update_row(idx, row):
@@ -1,6 +1,8 @@
 """Module for querying the MacIp table."""
 
 from sqlalchemy import select, update, and_
+from sqlalchemy.dialects.mysql import insert
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
@@ -64,6 +66,29 @@ def exists(idx_mac, idx_ip):
     return result
 
 
+def find_idx_macs(idx_macs):
+    """Find all the entries for a list of MAC addresses.
+
+    Args:
+        idx_macs: List of Mac.idx_mac values
+
+    Returns:
+        result: List of RMacIp tuples
+
+    """
+    # Initialize key variables
+    result = []
+
+    # Get rows from database in chunks to limit the query size
+    for chunk in mit.chunked(sorted(set(idx_macs)), db.CHUNK_SIZE):
+        statement = select(MacIp).where(MacIp.idx_mac.in_(chunk))
+        rows = db.db_select_row(2033, statement)
+        result.extend(_rows.macip(row) for row in rows)
+
+    # Return
+    return result
+
+
 # def findip(idx_ip, ipaddress):
 #     """Find IP address.
 
@@ -140,9 +165,52 @@ def insert_row(rows):
     Returns:
         None
 
+    """
+    # Get the values
+    values = _values(rows)
+
+    # Insert
+    if bool(values):
+        db.db_insert(1091, insert(MacIp), values)
+
+
+def upsert_row(rows):
+    """Create MacIp table entries, updating those that already exist.
+
+    Rows are matched on the (idx_ip, idx_mac) unique key, so no query is
+    needed to find out whether they exist.
+
+    Args:
+        rows: IMacIp objects
+
+    Returns:
+        None
+
+    """
+    # Get the values
+    values = _values(rows)
+
+    # Insert
+    if bool(values):
+        statement = insert(MacIp)
+        statement = statement.on_duplicate_key_update(
+            enabled=statement.inserted.enabled
+        )
+        db.db_insert(2043, statement, values)
+
+
+def _values(rows):
+    """Convert IMacIp objects to MacIp table column values.
+
+    Args:
+        rows: IMacIp objects
+
+    Returns:
+        values: List of dicts of column values, one per unique row
+
     """
     # Initialize key variables
-    inserts = []
+    values = []
 
     # Create list
     if isinstance(rows, list) is False:
@@ -153,17 +221,16 @@ def insert_row(rows):
 
     # Create objects
     for row in rows:
-        inserts.append(
-            MacIp(
-                idx_ip=row.idx_ip,
-                idx_mac=row.idx_mac,
-                enabled=int(bool(row.enabled) is True),
-            )
+        values.append(
+            {
+                "idx_ip": row.idx_ip,
+                "idx_mac": row.idx_mac,
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
-    # Insert
-    if bool(inserts):
-        db.db_add_all(1091, inserts)
+    # Return
+    return values
 
 
 def update_row(idx, row):
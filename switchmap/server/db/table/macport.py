@@ -1,6 +1,8 @@
 """Module for querying the MacPort table."""
 
 from sqlalchemy import select, update, and_
+from sqlalchemy.dialects.mysql import insert
+import more_itertools as mit
 
 # Import project libraries
 from switchmap.server.db import db
@@ -88,6 +90,29 @@ def find_idx_mac(idx_mac):
     return result
 
 
+def find_idx_macs(idx_macs):
+    """Find all ports on which a list of MAC addresses have been found.
+
+    Args:
+        idx_macs: List of Mac.idx_mac values
+
+    Returns:
+        result: List of RMacPort tuples
+
+    """
+    # Initialize key variables
+    result = []
+
+    # Get rows from database in chunks to limit the query size
+    for chunk in mit.chunked(sorted(set(idx_macs)), db.CHUNK_SIZE):
+        statement = select(MacPort).where(MacPort.idx_mac.in_(chunk))
+        rows = db.db_select_row(2034, statement)
+        result.extend(_rows.macport(row) for row in rows)
+
+    # Return
+    return result
+
+
 def insert_row(rows):
     """Create a MacPort table entry.
 
@@ -97,9 +122,52 @@ def insert_row(rows):
     Returns:
         None
 
+    """
+    # Get the values
+    values = _values(rows)
+
+    # Insert
+    if bool(values):
+        db.db_insert(1092, insert(MacPort), values)
+
+
+def upsert_row(rows):
+    """Create MacPort table entries, updating those that already exist.
+
+    Rows are matched on the (idx_l1interface, idx_mac) unique key, so no
+    query is needed to find out whether they exist.
+
+    Args:
+        rows: IMacPort objects
+
+    Returns:
+        None
+
+    """
+    # Get the values
+    values = _values(rows)
+
+    # Insert
+    if bool(values):
+        statement = insert(MacPort)
+        statement = statement.on_duplicate_key_update(
+            enabled=statement.inserted.enabled
+        )
+        db.db_insert(2044, statement, values)
+
+
+def _values(rows):
+    """Convert IMacPort objects to MacPort table column values.
+
+    Args:
+        rows: IMacPort objects
+
+    Returns:
+        values: List of dicts of column values, one per unique row
+
     """
     # Initialize key variables
-    inserts = []
+    values = []
 
     # Create list
     if isinstance(rows, list) is False:
@@ -110,17 +178,16 @@ def insert_row(rows):
 
     # Create objects
     for row in rows:
-        inserts.append(
-            MacPort(
-                idx_l1interface=row.idx_l1interface,
-                idx_mac=row.idx_mac,
-                enabled=int(bool(row.enabled) is True),
-            )
+        values.append(
+            {
+                "idx_l1interface": row.idx_l1interface,
+                "idx_mac": row.idx_mac,
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
-    # Insert
-    if bool(inserts):
-        db.db_add_all(1092, inserts)
+    # Return
+    return values
 
 
 def update_row(idx, row):
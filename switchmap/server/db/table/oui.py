@@ -1,6 +1,6 @@
 """Module for querying the Oui table."""
 
-from sqlalchemy import select, update, null
+from sqlalchemy import select, update, null, insert
 
 # Import project libraries
 from switchmap.server.db import db
@@ -104,20 +104,20 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            Oui(
-                oui=(null() if bool(row.oui) is False else row.oui.encode()),
-                organization=(
-                    null()
+            {
+                "oui": (None if bool(row.oui) is False else row.oui.encode()),
+                "organization": (
+                    None
                     if bool(row.organization) is False
                     else row.organization.encode()
                 ),
-                enabled=int(bool(row.enabled) is True),
-            )
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1096, inserts)
+        db.db_insert(1096, insert(Oui), inserts)
 
 
 def update_row(idx, row):
@@ -1,6 +1,6 @@
 """Module for querying the Root table."""
 
-from sqlalchemy import select, update
+from sqlalchemy import select, update, insert
 
 # Import project libraries
 from switchmap.server.db import db
@@ -81,16 +81,16 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            Root(
-                idx_event=row.idx_event,
-                name=row.name.encode(),
-                enabled=int(bool(row.enabled) is True),
-            )
+            {
+                "idx_event": row.idx_event,
+                "name": row.name.encode(),
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1033, inserts)
+        db.db_insert(1033, insert(Root), inserts)
 
 
 def update_row(idx, row):
@@ -1,6 +1,6 @@
 """Module for querying the VlanPort table."""
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, and_, insert
 
 # Import project libraries
 from switchmap.server.db import db
@@ -111,16 +111,16 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            VlanPort(
-                idx_l1interface=row.idx_l1interface,
-                idx_vlan=row.idx_vlan,
-                enabled=int(bool(row.enabled) is True),
-            )
+            {
+                "idx_l1interface": row.idx_l1interface,
+                "idx_vlan": row.idx_vlan,
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1185, inserts)
+        db.db_insert(1185, insert(VlanPort), inserts)
 
 
 def update_row(idx, row):
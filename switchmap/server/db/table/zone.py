@@ -1,6 +1,6 @@
 """Module for querying the Zone table."""
 
-from sqlalchemy import select, update, null, and_
+from sqlalchemy import select, update, null, and_, insert
 
 # Import project libraries
 from switchmap.server.db import db
@@ -108,21 +108,21 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            Zone(
-                idx_event=row.idx_event,
-                name=(
-                    null() if bool(row.name) is False else row.name.encode()
+            {
+                "idx_event": row.idx_event,
+                "name": (
+                    None if bool(row.name) is False else row.name.encode()
                 ),
-                notes=(
-                    null() if bool(row.notes) is False else row.notes.encode()
+                "notes": (
+                    None if bool(row.notes) is False else row.notes.encode()
                 ),
-                enabled=int(bool(row.enabled) is True),
-            )
+                "enabled": int(bool(row.enabled) is True),
+            }
         )
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1155, inserts)
+        db.db_insert(1155, insert(Zone), inserts)
 
 
 def update_row(idx, row):
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test the codec module."""
+
+import unittest
+import os
+import sys
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+from tests.testlib_ import data
+from switchmap.core import codec as testimport
+
+
+class TestCodec(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test_encode(self):
+        """Testing function encode."""
+        # Encoded data is versioned and smaller than the original
+        polled = data.polled_data()
+        result = testimport.encode(polled)
+        self.assertTrue(result.startswith(testimport.MAGIC))
+        self.assertEqual(result[len(testimport.MAGIC)], testimport.VERSION)
+        self.assertLess(len(result), len(str(polled)))
+
+    def test_decode(self):
+        """Testing function decode."""
+        # Data must survive the round trip with integer keys intact
+        polled = data.polled_data()
+        result = testimport.decode(testimport.encode(polled))
+        self.assertEqual(result, polled)
+        self.assertTrue(
+            all(isinstance(_, int) for _ in result["layer1"].keys())
+        )
+
+        # Test invalid payloads
+        encoded = testimport.encode({1: "a"})
+        for payload in [
+            b"",
+            b"{}",
+            testimport.MAGIC,
+            testimport.MAGIC + bytes([testimport.VERSION + 1]),
+            encoded[:-4],
+        ]:
+            with self.assertRaises(ValueError):
+                testimport.decode(payload)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
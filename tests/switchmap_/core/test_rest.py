@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Test the rest module."""
+
+import unittest
+import os
+import sys
+import gzip
+import json
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+from tests.testlib_ import data
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import codec
+from switchmap.core import rest as testimport
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test__session(self):
+        """Testing function _session."""
+        # The session must be reused
+        result = testimport._session()
+        self.assertIs(testimport._session(), result)
+
+    def test__request(self):
+        """Testing function _request."""
+        # Initialize key variables
+        posted = {"misc": {"host": "a"}, "layer1": {1: {"ifIndex": 1}}}
+
+        # Test JSON
+        result = testimport._request(posted, None, None, False, False)
+        self.assertEqual(result, {"json": posted})
+
+        # Test gzipped JSON
+        result = testimport._request(posted, "user", "pass", False, True)
+        self.assertEqual(result["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(result["auth"], ("user", "pass"))
+        self.assertEqual(
+            json.loads(gzip.decompress(result["data"])),
+            {"misc": {"host": "a"}, "layer1": {"1": {"ifIndex": 1}}},
+        )
+
+        # Test binary data. It is never gzipped
+        result = testimport._request(posted, None, None, True, True)
+        self.assertEqual(
+            result["headers"], {"Content-Type": codec.CONTENT_TYPE}
+        )
+        self.assertEqual(codec.decode(result["data"]), posted)
+
+    def test__clean_url(self):
+        """Testing function _clean_url."""
+        # Run test
+        result = testimport._clean_url("http://localhost:7000//a//b")
+        self.assertEqual(result, "http://localhost:7000/a/b")
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
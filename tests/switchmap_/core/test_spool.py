@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Test the spool module."""
+
+import unittest
+import tempfile
+import os
+import sys
+
+import yaml
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+from tests.testlib_ import data
+from switchmap.core import spool as testimport
+
+
+class TestSpool(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def setUp(self):
+        """Create a directory for spool files."""
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+
+    def tearDown(self):
+        """Remove the directory for spool files."""
+        self._directory.cleanup()
+
+    def test_filename(self):
+        """Testing function filename."""
+        # The zone is encoded in the filename
+        filename = testimport.filename(self.directory, "switch.local", "Z 1")
+        self.assertEqual(os.path.dirname(filename), self.directory)
+        self.assertTrue(os.path.basename(filename).startswith("switch.local-"))
+        self.assertTrue(filename.endswith(".5a2031"))
+
+        # Long zone names are left out
+        filename = testimport.filename(self.directory, "switch", "z" * 65)
+        self.assertNotIn(".", os.path.basename(filename))
+
+    def test_zone(self):
+        """Testing function zone."""
+        # Zones are read from the names of files of any format
+        for name in ["Z 1", "", "zone.with-punctuation", "\u00e9t\u00e9"]:
+            filename = testimport.filename(self.directory, "switch.lan", name)
+            for spool in testimport.FORMATS.values():
+                filepath = "{}{}".format(filename, spool.extension)
+                self.assertEqual(testimport.zone(filepath), name)
+
+        # Files of earlier versions and long zone names don't include it
+        for filepath in [
+            "/tmp/switch.local-1a2b3.yaml",
+            "/tmp/switch-1a2b3.yaml",
+            testimport.filename(self.directory, "switch", "z" * 65) + ".yaml",
+        ]:
+            self.assertIsNone(testimport.zone(filepath))
+
+    def test_write(self):
+        """Testing function write."""
+        # Data must survive the round trip with integer keys intact
+        polled = data.polled_data()
+        for spool_format, spool in testimport.FORMATS.items():
+            filename = os.path.join(self.directory, spool_format)
+            filepath = testimport.write(filename, polled, spool_format)
+            self.assertEqual(filepath, filename + spool.extension)
+            self.assertEqual(testimport.read(filepath), polled)
+
+        # Pre-encoded payloads are written as is
+        filename = os.path.join(self.directory, "payload")
+        filepath = testimport.write(
+            filename, None, "msgpack", payload=testimport.codec.encode(polled)
+        )
+        self.assertEqual(testimport.read(filepath), polled)
+
+    def test_read(self):
+        """Testing function read."""
+        # Legacy YAML files have string keys that must be converted
+        filepath = os.path.join(self.directory, "legacy.yaml")
+        with open(filepath, "w") as f_handle:
+            yaml.dump({"layer1": {"1": {"ifIndex": 1}}}, f_handle)
+        result = testimport.read(filepath)
+        self.assertEqual(result, {"layer1": {1: {"ifIndex": 1}}})
+
+    def test_exists(self):
+        """Testing function exists."""
+        # Files of any format count
+        filename = os.path.join(self.directory, "host")
+        self.assertFalse(testimport.exists(filename))
+        testimport.write(filename, {}, "yaml")
+        self.assertTrue(testimport.exists(filename))
+
+    def test_filepaths(self):
+        """Testing function filepaths."""
+        # Only spool files are found
+        expected = []
+        for spool_format in sorted(testimport.FORMATS):
+            filename = os.path.join(self.directory, spool_format)
+            expected.append(testimport.write(filename, {}, spool_format))
+        for filename in ["other.txt", "partial.msgpack.tmp"]:
+            open(os.path.join(self.directory, filename), "w").close()
+        result = testimport.filepaths(self.directory)
+        self.assertEqual(result, expected)
+
+    def test_move(self):
+        """Testing function move."""
+        # Only spool files are moved
+        testimport.write(os.path.join(self.directory, "a"), {}, "msgpack")
+        open(os.path.join(self.directory, "other.txt"), "w").close()
+        with tempfile.TemporaryDirectory() as dst:
+            testimport.move(self.directory, dst)
+            self.assertEqual(os.listdir(dst), ["a.msgpack"])
+        self.assertEqual(os.listdir(self.directory), ["other.txt"])
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Test the sqlite module."""
+
+import unittest
+import os
+import sys
+import tempfile
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+from switchmap.core import sqlite as testimport
+
+
+class TestConnection(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def setUp(self):
+        """Create a database before each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "test.sqlite")
+        with testimport.Connection(self.filename) as connection:
+            connection.execute("CREATE TABLE items (value INTEGER)")
+
+    def tearDown(self):
+        """Remove the database after each test."""
+        self.directory.cleanup()
+
+    def _count(self):
+        """Count the rows in the database.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of rows
+
+        """
+        with testimport.Connection(self.filename) as connection:
+            result = connection.execute(
+                "SELECT COUNT(*) FROM items"
+            ).fetchone()[0]
+        return result
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test___enter__(self):
+        """Testing function __enter__."""
+        # Statements outside transactions are committed immediately
+        with testimport.Connection(self.filename) as connection:
+            connection.execute("INSERT INTO items VALUES (1)")
+        self.assertEqual(self._count(), 1)
+
+    def test___exit__(self):
+        """Testing function __exit__."""
+        # Transactions are committed
+        with testimport.Connection(self.filename) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("INSERT INTO items VALUES (1)")
+        self.assertEqual(self._count(), 1)
+
+        # Transactions are rolled back on error
+        with self.assertRaises(ValueError):
+            with testimport.Connection(self.filename) as connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("INSERT INTO items VALUES (2)")
+                raise ValueError()
+        self.assertEqual(self._count(), 1)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
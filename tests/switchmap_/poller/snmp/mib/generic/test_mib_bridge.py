@@ -4,6 +4,7 @@
 import unittest
 import os
 import sys
+from mock import Mock
 
 # Try to create a working PYTHONPATH
 EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -60,6 +61,7 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+from switchmap.poller.snmp.mib.generic import mib_bridge as testimport
 
 
 class Query:
@@ -114,6 +116,17 @@ class Query:
         """
         pass
 
+    def concurrency(self):
+        """Get the maximum number of concurrent requests to the device.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
 
 class TestMibBridgeFunctions(unittest.TestCase):
     """Checks all methods."""
@@ -200,7 +213,36 @@ class TestMibBridge(unittest.TestCase):
 
     def test__dot1dtpfdbport(self):
         """Testing function _dot1dtpfdbport."""
-        pass
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.17.4.3.1.2"
+        walks = {
+            "": {"{}.0.1.2.3.4.5".format(oid): 1},
+            "vlan-10": {
+                "{}.0.1.2.3.4.5".format(oid): 2,
+                "{}.6.7.8.9.10.11".format(oid): 3,
+            },
+            "vlan-20": {"{}.12.13.14.15.16.17".format(oid): 4},
+        }
+        expected = {
+            ".0.1.2.3.4.5": 2,
+            ".6.7.8.9.10.11": 3,
+            ".12.13.14.15.16.17": 4,
+        }
+
+        # Results must be the same however many contexts are walked at once
+        for concurrency in [1, 2, 4]:
+            snmpobj = Mock(spec=Query)
+            snmpobj.concurrency.return_value = concurrency
+            snmpobj.swalk.side_effect = (
+                lambda _oid, normalized=False, context_name="": (
+                    walks[context_name] if _oid == oid else {}
+                )
+            )
+            testobj = testimport.init_query(snmpobj)
+            result = testobj._dot1dtpfdbport(
+                context_names=["", "vlan-10", "vlan-20"]
+            )
+            self.assertEqual(result, expected)
 
     def test__dot1qtpfdbport(self):
         """Testing function _dot1qtpfdbport."""
@@ -117,6 +117,17 @@ class Query:
         """
         pass
 
+    def table(self):
+        """Do a multi-column SNMPwalk.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
 
 class TestMibIfFunctions(unittest.TestCase):
     """Checks all methods."""
@@ -116,6 +116,17 @@ class Query:
         """
         pass
 
+    def table(self):
+        """Do a multi-column SNMPwalk.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
 
 class TestMibIf64Functions(unittest.TestCase):
     """Checks all methods."""
@@ -233,17 +244,22 @@ class TestMibIf64(unittest.TestCase):
 
     def test_layer1(self):
         """Testing method / function layer1."""
+        # Set the stage for a table walk returning every column at once
+        snmpobj = Mock(spec=Query)
+        snmpobj.table.side_effect = lambda oids, normalized: {
+            oid: self.nwalk_results_integer for oid in oids
+        }
+
         # Get results
-        testobj = testimport.init_query(self.snmpobj_integer)
+        testobj = testimport.init_query(snmpobj)
         results = testobj.layer1()
 
+        # The whole table must be fetched in one pass
+        self.assertEqual(snmpobj.table.call_count, 1)
+        self.assertEqual(snmpobj.swalk.call_count, 0)
+
         # Basic testing of results
-        for primary in results.keys():
-            for secondary in results[primary].keys():
-                self.assertEqual(
-                    results[primary][secondary],
-                    self.expected_dict[primary][secondary],
-                )
+        self.assertEqual(results, self.expected_dict)
 
     def test_ifhighspeed(self):
         """Testing method / function ifhighspeed."""
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Test the capability module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import time
+import yaml
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+from switchmap.poller.snmp import capability as testimport
+
+
+class TestCache(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    hostname = "capability.example.org"
+    sysobjectid = ".1.3.6.1.4.1.9.1.1208"
+    oid = ".1.3.6.1.2.1.2.2.1.1"
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above.
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Remove the cache file before each test."""
+        self.config = ConfigPoller()
+        self.filename = files.capability_file(self.hostname, self.config)
+        if os.path.isfile(self.filename) is True:
+            os.remove(self.filename)
+
+    def _cache(self, sysobjectid=None, sysuptime=1000):
+        """Create a cache object.
+
+        Args:
+            sysobjectid: sysObjectID of the device
+            sysuptime: sysUpTime of the device
+
+        Returns:
+            result: Cache object
+
+        """
+        # Return
+        result = testimport.Cache(
+            self.hostname,
+            sysobjectid if bool(sysobjectid) else self.sysobjectid,
+            sysuptime,
+            self.config,
+        )
+        return result
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_get(self):
+        """Testing function get."""
+        # Nothing is cached at first
+        cache = self._cache()
+        self.assertIsNone(cache.get(self.oid))
+
+        # Test
+        cache.set(self.oid, True)
+        self.assertTrue(cache.get(self.oid))
+        cache.set(self.oid, False)
+        self.assertFalse(cache.get(self.oid))
+
+    def test_set(self):
+        """Testing function set."""
+        # Test
+        cache = self._cache()
+        cache.set(self.oid, 1)
+        self.assertIs(cache.get(self.oid), True)
+
+    def test_save(self):
+        """Testing function save."""
+        # Save results
+        cache = self._cache()
+        cache.set(self.oid, True)
+        cache.save()
+        self.assertTrue(os.path.isfile(self.filename))
+
+        # Results must survive to the next poll
+        cache = self._cache(sysuptime=2000)
+        self.assertTrue(cache.get(self.oid))
+
+    def test__load(self):
+        """Testing function _load."""
+        # Save results
+        cache = self._cache(sysuptime=1000)
+        cache.set(self.oid, True)
+        cache.save()
+
+        # A new sysObjectID invalidates the cache
+        cache = self._cache(sysobjectid=".1.3.6.1.4.1.2636.1.1.1.2.29")
+        self.assertIsNone(cache.get(self.oid))
+
+        # A reboot invalidates the cache
+        cache = self._cache(sysuptime=10)
+        self.assertIsNone(cache.get(self.oid))
+
+        # An expired cache is ignored
+        with open(self.filename) as f_handle:
+            data = yaml.safe_load(f_handle)
+        data["timestamp"] = int(time.time()) - (
+            self.config.capability_cache_ttl() + 1
+        )
+        with open(self.filename, "w") as f_handle:
+            yaml.safe_dump(data, f_handle)
+        cache = self._cache(sysuptime=2000)
+        self.assertIsNone(cache.get(self.oid))
+
+        # A corrupted cache is ignored
+        with open(self.filename, "w") as f_handle:
+            f_handle.write("- [")
+        cache = self._cache(sysuptime=2000)
+        self.assertIsNone(cache.get(self.oid))
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""Test the incremental module."""
+
+import unittest
+import os
+import sys
+from mock import Mock, patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import json
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+from switchmap.poller.snmp import incremental as testimport
+
+
+class TestState(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    hostname = "incremental.example.org"
+    data = {
+        "misc": {"host": hostname},
+        "layer1": {
+            "1": {"ifDescr": "Gi1/0/1", "ifOperStatus": 1, "ifLastChange": 100}
+        },
+        "layer2": {"10": {"vlan": 10}},
+        "layer3": {"ipNetToMediaTable": {}},
+        "system": {"SNMPv2-MIB": {"sysUpTime": {0: 1000}}},
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above.
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Remove the state file before each test."""
+        self.config = ConfigPoller()
+        self.filename = files.state_file(self.hostname, self.config)
+        if os.path.isfile(self.filename) is True:
+            os.remove(self.filename)
+
+    def _state(self, sysuptime=1000, iflastchange=None):
+        """Create a state object for a device.
+
+        Args:
+            sysuptime: sysUpTime of the device
+            iflastchange: Dict of ifLastChange values keyed by ifIndex
+
+        Returns:
+            result: State object
+
+        """
+        # Initialize key variables
+        snmpobj = Mock()
+        snmpobj.hostname.return_value = self.hostname
+        snmpobj.sysuptime.return_value = sysuptime
+        snmpobj.swalk.return_value = (
+            {"1": 100} if iflastchange is None else iflastchange
+        )
+        snmpobj.get.side_effect = lambda oid, normalized: {
+            oid.split(".")[-1]: 2
+        }
+
+        # Return
+        result = testimport.State(snmpobj, self.config)
+        return result
+
+    def _age(self, seconds):
+        """Make the saved state older.
+
+        Args:
+            seconds: Number of seconds
+
+        Returns:
+            None
+
+        """
+        # Update the file
+        with open(self.filename) as f_handle:
+            saved = json.load(f_handle)
+        saved["walked"] = {
+            key: value - seconds for key, value in saved["walked"].items()
+        }
+        with open(self.filename, "w") as f_handle:
+            json.dump(saved, f_handle)
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_reusable(self):
+        """Testing function reusable."""
+        # Nothing can be reused without a previous poll
+        state = self._state()
+        self.assertEqual(state.reusable(), [])
+        state.save(self.data, [])
+
+        # Everything can be reused if nothing changed
+        state = self._state(sysuptime=2000)
+        self.assertEqual(
+            state.reusable(), ["layer1", "layer2", "layer3", "system"]
+        )
+
+        # Interface changes only invalidate the static sections
+        state = self._state(sysuptime=2000, iflastchange={"1": 1500})
+        self.assertEqual(state.reusable(), ["layer1", "layer3"])
+
+        # Reboots and new interfaces invalidate everything
+        state = self._state(sysuptime=10)
+        self.assertEqual(state.reusable(), [])
+        state = self._state(sysuptime=2000, iflastchange={"1": 100, "2": 1})
+        self.assertEqual(state.reusable(), [])
+
+        # The MAC and ARP tables are walked more often than the rest
+        self._age(self.config.incremental_table_interval())
+        state = self._state(sysuptime=2000)
+        self.assertEqual(state.reusable(), ["layer2", "system"])
+
+        # Data older than the refresh interval is not reused
+        self._age(self.config.incremental_refresh_interval())
+        state = self._state(sysuptime=2000)
+        self.assertEqual(state.reusable(), [])
+
+    def test_section(self):
+        """Testing function section."""
+        # Test
+        state = self._state()
+        state.save(self.data, [])
+        state = self._state(sysuptime=2000)
+        self.assertEqual(state.section("layer2"), {10: {"vlan": 10}})
+        self.assertEqual(state.section("misc"), self.data["misc"])
+
+        # The uptime is the one polled now, not the saved one
+        self.assertEqual(
+            state.section("system"), {"SNMPv2-MIB": {"sysUpTime": {0: 2000}}}
+        )
+
+        # Unchanged interfaces aren't queried
+        self.assertEqual(
+            state.section("layer1"),
+            {
+                1: {
+                    "ifDescr": "Gi1/0/1",
+                    "ifOperStatus": 1,
+                    "ifLastChange": 100,
+                }
+            },
+        )
+        self.assertEqual(state._snmp_object.get.call_count, 0)
+
+        # Only the state of the interfaces that changed is refreshed
+        state = self._state(sysuptime=2000, iflastchange={"1": 1500})
+        self.assertEqual(
+            state.section("layer1"),
+            {
+                1: {
+                    "ifDescr": "Gi1/0/1",
+                    "ifOperStatus": 2,
+                    "ifLastChange": 1500,
+                }
+            },
+        )
+        state._snmp_object.get.assert_called_once_with(
+            "{}.1".format(testimport.IFSTATE["ifOperStatus"]), normalized=True
+        )
+
+    def test_save(self):
+        """Testing function save."""
+        # Save
+        state = self._state()
+        state.save(self.data, [])
+        self.assertTrue(os.path.isfile(self.filename))
+
+        # Reusing a section must not restart its refresh interval
+        self._age(10)
+        with open(self.filename) as f_handle:
+            walked = json.load(f_handle)["walked"]
+        state = self._state(sysuptime=2000)
+        state.save(self.data, ["layer2", "system"])
+        with open(self.filename) as f_handle:
+            saved = json.load(f_handle)["walked"]
+        self.assertEqual(saved["layer2"], walked["layer2"])
+        self.assertEqual(saved["system"], walked["system"])
+        self.assertGreater(saved["layer1"], walked["layer1"])
+
+        # Write errors are logged without failing the poll
+        state = self._state(sysuptime=3000)
+        state._filename = os.path.join(self.filename, "missing", "state")
+        with patch.object(testimport.log, "log2warning") as log2warning:
+            state.save(self.data, [])
+        self.assertEqual(log2warning.call_args[0][0], 2017)
+        self.assertFalse(os.path.exists(state._filename))
+
+    def test__changed(self):
+        """Testing function _changed."""
+        # Test
+        state = self._state()
+        state.save(self.data, [])
+        state = self._state(iflastchange={"1": 100, "2": 5})
+        self.assertEqual(state._changed(), ["2"])
+
+    def test__interface(self):
+        """Testing function _interface."""
+        pass
+
+    def test__fingerprint(self):
+        """Testing function _fingerprint."""
+        # Test
+        state = self._state(sysuptime=2000)
+        self.assertEqual(
+            state._fingerprint(),
+            {"sysuptime": 2000, "iflastchange": {"1": 100}},
+        )
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above.
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test__read(self):
+        """Testing function _read."""
+        # Missing files are ignored
+        config = ConfigPoller()
+        filename = files.state_file("read.example.org", config)
+        self.assertIsNone(testimport._read(filename))
+
+        # Corrupted files are ignored
+        with open(filename, "w") as f_handle:
+            f_handle.write("{")
+        self.assertIsNone(testimport._read(filename))
+        with open(filename, "w") as f_handle:
+            f_handle.write("{}")
+        self.assertIsNone(testimport._read(filename))
+        os.remove(filename)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Test the metrics module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Import other required libraries
+from switchmap.poller.snmp import metrics as testimport
+
+
+class TestMetrics(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_record(self):
+        """Testing function record."""
+        # Record some requests
+        oid = ".1.3.6.1.2.1.2.2.1.2"
+        testobj = testimport.Metrics()
+        testobj.record(oid, seconds=0.5, rows=10, pdus=2)
+        testobj.record(oid, seconds=0.25, rows=5, pdus=1, timeouts=1)
+        testobj.record(oid, retries=1)
+
+        # Test
+        result = testobj.summary()["oids"][oid]
+        self.assertEqual(result["requests"], 2)
+        self.assertEqual(result["seconds"], 0.75)
+        self.assertEqual(result["rows"], 15)
+        self.assertEqual(result["pdus"], 3)
+        self.assertEqual(result["timeouts"], 1)
+        self.assertEqual(result["retries"], 1)
+
+    def test_timer(self):
+        """Testing function timer."""
+        # Time some blocks of code
+        testobj = testimport.Metrics()
+        with testobj.timer("sections", "layer1"):
+            pass
+        with testobj.timer("sections", "layer1"):
+            pass
+        with testobj.timer("mibs", "layer1.IfQuery"):
+            pass
+
+        # Test
+        result = testobj.summary()
+        self.assertEqual(list(result["sections"].keys()), ["layer1"])
+        self.assertEqual(list(result["mibs"].keys()), ["layer1.IfQuery"])
+
+    def test_summary(self):
+        """Testing function summary."""
+        # Record some requests
+        testobj = testimport.Metrics()
+        testobj.record(".1.3.6.1.2.1.1.2.0", seconds=0.1, rows=1, pdus=1)
+        testobj.record(".1.3.6.1.2.1.1.3.0", seconds=0.1, rows=1, pdus=1)
+
+        # Test totals
+        result = testobj.summary()
+        self.assertEqual(result["requests"], 2)
+        self.assertEqual(result["rows"], 2)
+        self.assertEqual(result["pdus"], 2)
+        self.assertEqual(result["timeouts"], 0)
+        self.assertEqual(result["retries"], 0)
+        self.assertEqual(len(result["oids"]), 2)
+        self.assertTrue(result["duration"] >= 0)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
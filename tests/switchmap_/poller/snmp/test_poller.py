@@ -75,6 +75,10 @@ class TestSnmpPollerFunctions(unittest.TestCase):
         # Cleanup the
         CONFIG.cleanup()
 
+    def test__export_metrics(self):
+        """Testing function _export_metrics."""
+        pass
+
     def test__do_poll(self):
         """Testing function _do_poll."""
         pass
@@ -46,6 +46,133 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+import time
+from collections import namedtuple
+from mock import Mock
+from easysnmp import exceptions
+from switchmap.poller import SNMP, POLL, POLLING_OPTIONS
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+from switchmap.poller.snmp import snmp_manager as testimport
+
+# easysnmp SNMPVariable equivalent
+_VARBIND = namedtuple("_VARBIND", "oid oid_index snmp_type value")
+
+# Table columns
+_IFDESCR = ".1.3.6.1.2.1.2.2.1.2"
+_IFTYPE = ".1.3.6.1.2.1.2.2.1.3"
+
+
+def _authorization(group):
+    """Create SNMP credentials.
+
+    Args:
+        group: Name of the credentials
+
+    Returns:
+        result: SNMP object
+
+    """
+    # Return
+    result = SNMP(
+        enabled=True,
+        group=group,
+        authpassword=None,
+        authprotocol=None,
+        community=group,
+        port=161,
+        privpassword=None,
+        privprotocol=None,
+        secname=None,
+        version=2,
+    )
+    return result
+
+
+def _interact(session, max_repetitions=2):
+    """Create an Interact object using a mocked SNMP session.
+
+    Args:
+        session: Mock easysnmp session
+        max_repetitions: GETBULK max-repetitions to use. Read from the
+            cache file if None
+
+    Returns:
+        result: Interact object
+
+    """
+    # Initialize key variables
+    result = testimport.Interact(
+        POLL(
+            hostname="table.example.org",
+            authorization=_authorization("public"),
+        )
+    )
+
+    # Use the mocked session
+    result._sessions[""] = session
+    if max_repetitions is not None:
+        result._max_repetitions = max_repetitions
+        result._saved_repetitions = max_repetitions
+    return result
+
+
+def _get_bulk(rows):
+    """Create a mock of easysnmp's get_bulk using a fixed MIB view.
+
+    Args:
+        rows: Dict of values keyed by column OID and then by index
+
+    Returns:
+        result: Function returning the varbinds following the requested
+            OIDs, interleaved as an agent would
+
+    """
+    # Order the MIB view
+    view = sorted(
+        [
+            ("{}.{}".format(column, index), column, index, value)
+            for column, values in rows.items()
+            for index, value in values.items()
+        ],
+        key=lambda _: [int(octet) for octet in _[0].split(".")[1:]],
+    )
+
+    def get_bulk(oids, non_repeaters=0, max_repetitions=10):
+        """Get the varbinds following each OID.
+
+        Args:
+            oids: List of OIDs
+            non_repeaters: Ignored
+            max_repetitions: Number of varbinds to return per OID
+
+        Returns:
+            result: List of varbinds
+
+        """
+        # Initialize key variables
+        result = []
+        cursors = list(oids)
+
+        # Walk each OID forward one row per repetition
+        for _ in range(max_repetitions):
+            for position, cursor in enumerate(cursors):
+                following = [
+                    _
+                    for _ in view
+                    if [int(octet) for octet in _[0].split(".")[1:]]
+                    > [int(octet) for octet in cursor.split(".")[1:]]
+                ]
+                if bool(following) is False:
+                    result.append(_VARBIND(cursor, "", "ENDOFMIBVIEW", ""))
+                    continue
+                oid, column, index, value = following[0]
+                result.append(_VARBIND(column, index, "OCTETSTR", value))
+                cursors[position] = oid
+        return result
+
+    # Return
+    return get_bulk
 
 
 class TestSnmpManagerValidate(unittest.TestCase):
@@ -87,6 +214,32 @@ class TestSnmpManagerValidate(unittest.TestCase):
         """Testing function _credentials."""
         pass
 
+    def test_validation(self):
+        """Testing function validation."""
+        # Initialize key variables
+        authorizations = [_authorization(_) for _ in ["a", "b", "c"]]
+        validate = testimport.Validate(
+            POLLING_OPTIONS(
+                hostname="validate.example.org",
+                authorizations=authorizations,
+            )
+        )
+
+        # Find the working credentials among several
+        validate._contactable = Mock(side_effect=lambda _: _.group == "b")
+        self.assertEqual(validate.validation(), authorizations[1])
+        self.assertEqual(validate.validation(group="b"), authorizations[1])
+        self.assertIsNone(validate.validation(group="c"))
+
+        # No credentials work
+        validate._contactable = Mock(return_value=False)
+        self.assertIsNone(validate.validation())
+        self.assertEqual(validate._contactable.call_count, 3)
+
+    def test__contactable(self):
+        """Testing function _contactable."""
+        pass
+
 
 class TestSnmpManagerInteract(unittest.TestCase):
     """Checks all methods."""
@@ -119,6 +272,22 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function __init__."""
         pass
 
+    def test_close(self):
+        """Testing function close."""
+        pass
+
+    def test_metrics(self):
+        """Testing function metrics."""
+        pass
+
+    def test_max_repetitions(self):
+        """Testing function max_repetitions."""
+        pass
+
+    def test_session(self):
+        """Testing function session."""
+        pass
+
     def test_enterprise_number(self):
         """Testing function enterprise_number."""
         pass
@@ -135,8 +304,50 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function sysobjectid."""
         pass
 
+    def test_sysuptime(self):
+        """Testing function sysuptime."""
+        pass
+
     def test_oid_exists(self):
         """Testing function oid_exists."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.17.1.1.0"
+
+        # Results of (get, walk) queries and whether they are cached
+        scenarios = [
+            # The get succeeds
+            ([(True, True, {oid: 1})], True, True),
+            # The device says the OID doesn't exist
+            ([(True, False, {}), (True, False, {})], False, True),
+            # The device doesn't answer
+            ([(False, False, {}), (False, False, {})], False, False),
+            # The get times out but the walk finds the OID
+            ([(False, False, {}), (True, True, {oid: 1})], True, True),
+        ]
+
+        for queries, expected, cached in scenarios:
+            cache = Mock()
+            cache.get.return_value = None
+            interact = _interact(Mock())
+            interact._capability_cache = Mock(return_value=cache)
+            interact.query = Mock(side_effect=queries)
+            self.assertEqual(interact.oid_exists(oid), expected)
+            if cached is True:
+                cache.set.assert_called_once_with(oid, expected)
+            else:
+                cache.set.assert_not_called()
+
+        # Use the cache
+        cache = Mock()
+        cache.get.return_value = False
+        interact = _interact(Mock())
+        interact._capability_cache = Mock(return_value=cache)
+        interact.query = Mock()
+        self.assertFalse(interact.oid_exists(oid))
+        interact.query.assert_not_called()
+
+    def test__capability_cache(self):
+        """Testing function _capability_cache."""
         pass
 
     def test__oid_exists_get(self):
@@ -151,6 +362,44 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function swalk."""
         pass
 
+    def test_table(self):
+        """Testing function table."""
+        # Test a successful walk
+        session = Mock()
+        session.get_bulk.side_effect = _get_bulk(
+            {_IFDESCR: {"1": "Gi1/0/1"}, _IFTYPE: {"1": "6"}}
+        )
+        result = _interact(session).table([_IFDESCR, _IFTYPE], normalized=True)
+        self.assertEqual(
+            result, {_IFDESCR: {"1": b"Gi1/0/1"}, _IFTYPE: {"1": b"6"}}
+        )
+
+        # Columns are walked one at a time if the agent can't handle
+        # several in one request
+        session = Mock()
+        session.get_bulk.side_effect = exceptions.EasySNMPError("genErr")
+        interact = _interact(session)
+        interact.swalk = Mock(return_value={"1": b"Gi1/0/1"})
+        result = interact.table([_IFDESCR, _IFTYPE], normalized=True)
+        self.assertEqual(
+            result, {_IFDESCR: {"1": b"Gi1/0/1"}, _IFTYPE: {"1": b"Gi1/0/1"}}
+        )
+        self.assertEqual(interact.swalk.call_count, 2)
+
+        # Timeouts aren't retried column by column
+        session = Mock()
+        session.get_bulk.side_effect = exceptions.EasySNMPTimeoutError(
+            "timeout"
+        )
+        interact = _interact(
+            session, max_repetitions=testimport.MIN_REPETITIONS
+        )
+        interact.swalk = Mock()
+        result = interact.table([_IFDESCR, _IFTYPE], normalized=True)
+        self.assertEqual(result, {_IFDESCR: {}, _IFTYPE: {}})
+        self.assertEqual(interact.swalk.call_count, 0)
+        self.assertEqual(session.get_bulk.call_count, 1)
+
     def test_walk(self):
         """Testing function walk."""
         pass
@@ -163,6 +412,138 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function query."""
         pass
 
+    def test__request(self):
+        """Testing function _request."""
+        pass
+
+    def test__table(self):
+        """Testing function _table."""
+        # Columns of different lengths finish independently. The walk
+        # spans several requests and stops at the end of the MIB view.
+        session = Mock()
+        session.get_bulk.side_effect = _get_bulk(
+            {
+                _IFDESCR: {"1": "Gi1/0/1", "2": "Gi1/0/2", "3": "Gi1/0/3"},
+                _IFTYPE: {"1": "6"},
+            }
+        )
+        rows = _interact(session)._table([_IFDESCR, _IFTYPE], "")
+        self.assertEqual(
+            [(_.oid, _.oid_index) for _ in rows[_IFDESCR]],
+            [(_IFDESCR, "1"), (_IFDESCR, "2"), (_IFDESCR, "3")],
+        )
+        self.assertEqual(
+            [(_.oid, _.oid_index) for _ in rows[_IFTYPE]], [(_IFTYPE, "1")]
+        )
+
+        # Finished columns aren't requested again
+        requests = [_[0][0] for _ in session.get_bulk.call_args_list]
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[0], [_IFDESCR, _IFTYPE])
+        self.assertEqual(requests[1], ["{}.2".format(_IFDESCR)])
+
+        # Stop if the agent returns the same rows again
+        session = Mock()
+        session.get_bulk.return_value = [
+            _VARBIND(_IFDESCR, "1", "OCTETSTR", "Gi1/0/1")
+        ]
+        rows = _interact(session)._table([_IFDESCR], "")
+        self.assertEqual(len(rows[_IFDESCR]), 1)
+        self.assertEqual(session.get_bulk.call_count, 2)
+
+    def test__bulk(self):
+        """Testing function _bulk."""
+        # Initialize key variables
+        filename = files.bulk_file("table.example.org", ConfigPoller())
+        if os.path.isfile(filename) is True:
+            os.remove(filename)
+
+        # Back off when the agent says the response is too big and save the
+        # size that worked
+        request = Mock(
+            side_effect=[exceptions.EasySNMPError("tooBig"), ["row"]]
+        )
+        interact = _interact(Mock(), max_repetitions=None)
+        self.assertEqual(interact._bulk(request, _IFDESCR, ""), ["row"])
+        self.assertEqual(
+            [_[0][0] for _ in request.call_args_list],
+            [testimport.MAX_REPETITIONS, testimport.MAX_REPETITIONS // 2],
+        )
+        self.assertEqual(
+            testimport._read_repetitions(filename),
+            testimport.MAX_REPETITIONS // 2,
+        )
+
+        # Timeouts don't change the size before the device has answered
+        request = Mock(side_effect=exceptions.EasySNMPTimeoutError("timeout"))
+        interact = _interact(Mock(), max_repetitions=None)
+        with self.assertRaises(exceptions.EasySNMPTimeoutError):
+            interact._bulk(request, _IFDESCR, "")
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual(
+            testimport._read_repetitions(filename),
+            testimport.MAX_REPETITIONS // 2,
+        )
+
+        # They do once it has
+        request = Mock(
+            side_effect=[exceptions.EasySNMPTimeoutError("timeout"), ["row"]]
+        )
+        interact = _interact(Mock(), max_repetitions=None)
+        interact._verified.add("")
+        self.assertEqual(interact._bulk(request, _IFDESCR, ""), ["row"])
+        self.assertEqual(
+            testimport._read_repetitions(filename),
+            testimport.MAX_REPETITIONS // 4,
+        )
+
+        # Give up at the smallest size
+        request = Mock(side_effect=exceptions.EasySNMPTimeoutError("timeout"))
+        interact = _interact(
+            Mock(), max_repetitions=testimport.MIN_REPETITIONS
+        )
+        interact._verified.add("")
+        with self.assertRaises(exceptions.EasySNMPTimeoutError):
+            interact._bulk(request, _IFDESCR, "")
+        self.assertEqual(request.call_count, 1)
+
+        # Larger PDUs are tried again once the probe interval has passed
+        past = time.time() - testimport.PROBE_INTERVAL - 1
+        os.utime(filename, (past, past))
+        request = Mock(return_value=["row"])
+        interact = _interact(Mock(), max_repetitions=None)
+        interact._bulk(request, _IFDESCR, "")
+        self.assertEqual(
+            request.call_args[0][0], testimport.MAX_REPETITIONS // 2
+        )
+        self.assertEqual(
+            testimport._read_repetitions(filename),
+            testimport.MAX_REPETITIONS // 2,
+        )
+        os.remove(filename)
+
+    def test__backoff(self):
+        """Testing function _backoff."""
+        # Halve the value down to the minimum
+        interact = _interact(Mock(), max_repetitions=8)
+        interact._backoff(8)
+        self.assertEqual(interact.max_repetitions(), 5)
+        interact._backoff(5)
+        self.assertEqual(interact.max_repetitions(), 5)
+
+        # Ignore values another thread already backed off from
+        interact = _interact(Mock(), max_repetitions=50)
+        interact._backoff(100)
+        self.assertEqual(interact.max_repetitions(), 50)
+
+    def test__learned(self):
+        """Testing function _learned."""
+        pass
+
+    def test__context_lock(self):
+        """Testing function _context_lock."""
+        pass
+
 
 class TestSnmpManagerSession(unittest.TestCase):
     """Checks all methods."""
@@ -255,6 +636,45 @@ class TestSnmpManagerFunctions(unittest.TestCase):
         """Testing function _oid_valid_format."""
         pass
 
+    def test__pdu_too_large(self):
+        """Testing function _pdu_too_large."""
+        # Only tooBig responses mean the PDU was too large
+        self.assertTrue(
+            testimport._pdu_too_large(exceptions.EasySNMPError("tooBig"))
+        )
+        self.assertTrue(
+            testimport._pdu_too_large(
+                exceptions.EasySNMPError("Response too big")
+            )
+        )
+        self.assertFalse(
+            testimport._pdu_too_large(
+                exceptions.EasySNMPTimeoutError("timed out")
+            )
+        )
+        self.assertFalse(
+            testimport._pdu_too_large(exceptions.EasySNMPError("genErr"))
+        )
+
+    def test__read_repetitions(self):
+        """Testing function _read_repetitions."""
+        pass
+
+    def test__probe_executor(self):
+        """Testing function _probe_executor."""
+        # The pool is shared and bounded
+        executor = testimport._probe_executor()
+        self.assertIs(testimport._probe_executor(), executor)
+        self.assertEqual(executor._max_workers, testimport.PROBE_WORKERS)
+
+    def test__recently_unreachable(self):
+        """Testing function _recently_unreachable."""
+        pass
+
+    def test__update_unreachable(self):
+        """Testing function _update_unreachable."""
+        pass
+
     def test__update_cache(self):
         """Testing function _update_cache."""
         pass
@@ -70,6 +70,69 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.polling_interval()
         self.assertEqual(result, expected)
 
+    def test_incremental_polling(self):
+        """Testing function incremental_polling."""
+        # Run test
+        expected = False
+        result = self.config.incremental_polling()
+        self.assertEqual(result, expected)
+
+    def test_incremental_refresh_interval(self):
+        """Testing function incremental_refresh_interval."""
+        # Run test
+        expected = 3600
+        result = self.config.incremental_refresh_interval()
+        self.assertEqual(result, expected)
+
+    def test_incremental_table_interval(self):
+        """Testing function incremental_table_interval."""
+        # Run test
+        expected = 300
+        result = self.config.incremental_table_interval()
+        self.assertEqual(result, expected)
+
+    def test_polling_engine(self):
+        """Testing function polling_engine."""
+        # Run test
+        expected = "multiprocessing"
+        result = self.config.polling_engine()
+        self.assertEqual(result, expected)
+
+    def test_outbox_size(self):
+        """Testing function outbox_size."""
+        # Run test
+        expected = 1000
+        result = self.config.outbox_size()
+        self.assertEqual(result, expected)
+
+    def test_polling_concurrency(self):
+        """Testing function polling_concurrency."""
+        # Run test
+        expected = 100
+        result = self.config.polling_concurrency()
+        self.assertEqual(result, expected)
+
+    def test_binary_posts(self):
+        """Testing function binary_posts."""
+        # Run test
+        expected = True
+        result = self.config.binary_posts()
+        self.assertEqual(result, expected)
+
+    def test_capability_cache_ttl(self):
+        """Testing function capability_cache_ttl."""
+        # Run test
+        expected = 86400
+        result = self.config.capability_cache_ttl()
+        self.assertEqual(result, expected)
+
+    def test_device_concurrency(self):
+        """Testing function device_concurrency."""
+        # Run test
+        expected = 1
+        result = self.config.device_concurrency()
+        self.assertEqual(result, expected)
+
     def test_server_address(self):
         """Testing function server_address."""
         # Run test
@@ -112,6 +175,13 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.server_username()
         self.assertEqual(result, expected)
 
+    def test_post_batch_size(self):
+        """Testing function post_batch_size."""
+        # Run test
+        expected = 1
+        result = self.config.post_batch_size()
+        self.assertEqual(result, expected)
+
     def test_snmp_auth(self):
         """Testing function snmp_auth."""
         # Run test
@@ -145,6 +215,13 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.snmp_auth()
         self.assertEqual(result, expected)
 
+    def test_unreachable_cache_ttl(self):
+        """Testing function unreachable_cache_ttl."""
+        # Run test
+        expected = 3600
+        result = self.config.unreachable_cache_ttl()
+        self.assertEqual(result, expected)
+
     def test_username(self):
         """Testing function username."""
         # Run test
@@ -159,13 +236,15 @@ class Test_ConfigPoller(unittest.TestCase):
             ZONE(
                 name="SITE-A",
                 hostnames=["hostname1", "hostname2", "hostname3"],
+                polling_interval=300,
             ),
             ZONE(
                 name="SITE-B",
                 hostnames=["hostnameA", "hostnameB", "hostnameC"],
+                polling_interval=21600,
             ),
-            ZONE(name="SITE-C", hostnames=None),
-            ZONE(name=None, hostnames=None),
+            ZONE(name="SITE-C", hostnames=None, polling_interval=21600),
+            ZONE(name=None, hostnames=None, polling_interval=21600),
         ]
         result = self.config.zones()
         self.assertEqual(result, expected)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Test the switchmap.poller.engine module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+from tests.testlib_ import data, setup
+
+setup.setenv()
+
+from switchmap.poller import engine as testimport
+
+
+def _double(value):
+    """Double a value, failing for negative values.
+
+    Args:
+        value: Value to double
+
+    Returns:
+        result: Doubled value
+
+    """
+    # Fail for negative values
+    if value < 0:
+        raise ValueError("Negative value")
+    result = value * 2
+    _RESULTS.append(result)
+    return result
+
+
+_RESULTS = []
+
+
+class TestEngine(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the configuration used for logging."""
+        # Setup
+        cls._config = setup.Config(data.configtester(), randomizer=True)
+        cls._config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove any extraneous directories."""
+        # Cleanup
+        cls._config.cleanup()
+
+    def setUp(self):
+        """Reset the results before each test."""
+        _RESULTS.clear()
+
+    def test_run(self):
+        """Testing function run."""
+        # All arguments must be processed
+        result = testimport.run(_double, list(range(10)), 3)
+        self.assertEqual(sorted(_RESULTS), [_ * 2 for _ in range(10)])
+        self.assertEqual(result, [_ * 2 for _ in range(10)])
+
+        # Failures must not stop the other polls
+        _RESULTS.clear()
+        result = testimport.run(_double, [1, -1, 2], 2)
+        self.assertEqual(sorted(_RESULTS), [2, 4])
+        self.assertEqual(result, [2, None, 4])
+
+        # Nothing to do
+        _RESULTS.clear()
+        result = testimport.run(_double, [], 2)
+        self.assertEqual(_RESULTS, [])
+        self.assertEqual(result, [])
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Test the switchmap.poller.outbox module."""
+
+import unittest
+import os
+import sys
+import time
+import json
+import shutil
+from collections import namedtuple
+from mock import patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+from tests.testlib_ import data, setup
+
+setup.setenv()
+
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.poller import outbox as testimport
+
+
+# rest.post() result
+_POST = namedtuple("_POST", "success response")
+_RESPONSE = namedtuple("_RESPONSE", "status_code")
+
+
+class _Config(ConfigPoller):
+    """Configuration with a small outbox."""
+
+    def outbox_size(self):
+        """Get outbox_size.
+
+        Args:
+            None
+
+        Returns:
+            result: result
+
+        """
+        return 3
+
+
+def _data(hostname):
+    """Create device data.
+
+    Args:
+        hostname: Hostname of the device
+
+    Returns:
+        result: Device data
+
+    """
+    result = {"misc": {"host": hostname, "zone": "SITE-A"}, "layer1": {1: 2}}
+    return result
+
+
+def _contents(store):
+    """Get the device data in an outbox.
+
+    Args:
+        store: Outbox object
+
+    Returns:
+        result: List of device data, oldest first
+
+    """
+    result = []
+    for filepath in store.filepaths():
+        with open(filepath, "rb") as f_handle:
+            item = testimport.codec.decode(f_handle.read())
+        result.append(item["data"])
+    return result
+
+
+class TestOutbox(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the configuration."""
+        # Setup
+        cls._config = setup.Config(data.configtester(), randomizer=True)
+        cls._config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove any extraneous directories."""
+        # Cleanup
+        cls._config.cleanup()
+
+    def setUp(self):
+        """Empty the outbox before each test."""
+        store = testimport.Outbox(_Config())
+        for filepath in os.listdir(store._directory):
+            filepath = os.path.join(store._directory, filepath)
+            if os.path.isdir(filepath) is True:
+                shutil.rmtree(filepath)
+            else:
+                os.remove(filepath)
+
+    def test_add(self):
+        """Testing function add."""
+        # Only the newest post per device is kept, in order
+        store = testimport.Outbox(_Config())
+        for hostname in ["a", "b", "a", "c"]:
+            store.add("/post/poller", _data(hostname))
+        self.assertEqual(_contents(store), [_data(_) for _ in ["b", "a", "c"]])
+
+        # Posts are kept up to the size of the outbox
+        store.add("/post/poller", _data("d"))
+        self.assertEqual(_contents(store), [_data(_) for _ in ["a", "c", "d"]])
+
+    def test_discard(self):
+        """Testing function discard."""
+        # Test
+        store = testimport.Outbox(_Config())
+        for hostname in ["a", "b", "c"]:
+            store.add("/post/poller", _data(hostname))
+        store.discard([testimport._key(("b", "SITE-A"))])
+        self.assertEqual(_contents(store), [_data(_) for _ in ["a", "c"]])
+
+    def test_replay(self):
+        """Testing function replay."""
+        # Nothing is posted before the backoff expires
+        store = testimport.Outbox(_Config())
+        store.add("/post/poller", _data("a"))
+        with open(store._backoff_file, "w") as f_handle:
+            json.dump({"failures": 1, "retry": time.time() + 60}, f_handle)
+        store.replay()
+        self.assertEqual(len(store.filepaths()), 1)
+
+        # Corrupted files are discarded and the backoff reset
+        os.remove(store.filepaths()[0])
+        with open(os.path.join(store._directory, "1.msgpack"), "wb") as fh:
+            fh.write(b"corrupted")
+        os.remove(store._backoff_file)
+        store.replay()
+        self.assertEqual(store.filepaths(), [])
+        self.assertFalse(os.path.exists(store._backoff_file))
+
+        # Posts of devices being polled are kept but not replayed
+        for hostname in ["a", "b"]:
+            store.add("/post/poller", _data(hostname))
+        with patch.object(testimport.rest, "post") as post:
+            post.return_value = _POST(True, _RESPONSE(200))
+            store.replay(pending=[("a", "SITE-A")])
+        self.assertEqual([_[0][1] for _ in post.call_args_list], [_data("b")])
+        self.assertEqual(_contents(store), [_data("a")])
+        with patch.object(testimport.rest, "post") as post:
+            post.return_value = _POST(True, _RESPONSE(200))
+            store.replay()
+        self.assertEqual(store.filepaths(), [])
+
+        # Posts the server rejects are moved aside without blocking the
+        # rest. Other failures stop the replay.
+        for hostname in ["a", "b", "c"]:
+            store.add("/post/poller", _data(hostname))
+        with patch.object(testimport.rest, "post") as post:
+            post.side_effect = [
+                _POST(False, _RESPONSE(400)),
+                _POST(True, _RESPONSE(200)),
+                _POST(False, _RESPONSE(503)),
+            ]
+            store.replay()
+        self.assertEqual(_contents(store), [_data("c")])
+        self.assertEqual(len(os.listdir(store._failed_directory)), 1)
+        self.assertTrue(os.path.exists(store._backoff_file))
+
+    def test_delivered(self):
+        """Testing function delivered."""
+        # Delivering a device's new data discards its stored post and
+        # replays the others, even while backing off
+        store = testimport.Outbox(_Config())
+        for hostname in ["a", "b", "c"]:
+            store.add("/post/poller", _data(hostname))
+        with open(store._backoff_file, "w") as f_handle:
+            json.dump({"failures": 1, "retry": time.time() + 60}, f_handle)
+        with patch.object(testimport.rest, "post") as post:
+            post.return_value = _POST(True, _RESPONSE(200))
+            store.delivered([_data("a")], pending=[("c", "SITE-A")])
+        self.assertEqual([_[0][1] for _ in post.call_args_list], [_data("b")])
+        self.assertEqual(_contents(store), [_data("c")])
+        self.assertFalse(os.path.exists(store._backoff_file))
+
+        # Nothing is posted if the outbox is empty
+        store.discard([testimport._key(("c", "SITE-A"))])
+        with patch.object(testimport.rest, "post") as post:
+            store.delivered([_data("a")])
+        self.assertEqual(post.call_count, 0)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Test the switchmap.poller.scheduler module."""
+
+import unittest
+import os
+import sys
+from collections import namedtuple
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+from tests.testlib_ import data, setup
+
+setup.setenv()
+
+from switchmap.poller import ZONE
+from switchmap.poller import scheduler as testimport
+
+# Same fields as switchmap.poller.poll._RESULT
+_RESULT = namedtuple(
+    "_RESULT", "zone hostname started duration success", defaults=[True]
+)
+
+
+class _Config:
+    """Configuration with two zones of devices."""
+
+    def __init__(self, zones=None):
+        """Initialize the class.
+
+        Args:
+            zones: List of ZONE objects. Two zones are used if None
+
+        Returns:
+            None
+
+        """
+        self._zones = (
+            [
+                ZONE(name="FAST", hostnames=["a", "b"], polling_interval=60),
+                ZONE(name="SLOW", hostnames=["c"], polling_interval=300),
+            ]
+            if zones is None
+            else zones
+        )
+
+    def zones(self):
+        """Get zones.
+
+        Args:
+            None
+
+        Returns:
+            result: List of ZONE objects
+
+        """
+        result = self._zones
+        return result
+
+
+class TestScheduler(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the configuration used for logging."""
+        # Setup
+        cls._config = setup.Config(data.configtester(), randomizer=True)
+        cls._config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove any extraneous directories."""
+        # Cleanup
+        cls._config.cleanup()
+
+    def test_due(self):
+        """Testing function due."""
+        # Everything is due at startup
+        schedule = testimport.Scheduler(_Config())
+        self.assertEqual(
+            sorted(schedule.due(now=1000)),
+            [("FAST", "a"), ("FAST", "b"), ("SLOW", "c")],
+        )
+
+        # Nothing is due until the polling interval has elapsed
+        schedule.update(
+            [
+                _RESULT(zone="FAST", hostname="a", started=1000, duration=2),
+                _RESULT(zone="FAST", hostname="b", started=1000, duration=20),
+                _RESULT(zone="SLOW", hostname="c", started=1000, duration=5),
+            ]
+        )
+        self.assertEqual(schedule.due(now=1030), [])
+
+        # Slowest devices come first
+        self.assertEqual(
+            schedule.due(now=1060), [("FAST", "b"), ("FAST", "a")]
+        )
+        self.assertEqual(
+            schedule.due(now=1300),
+            [("FAST", "b"), ("FAST", "a"), ("SLOW", "c")],
+        )
+
+        # Devices that have missed their deadline come first
+        schedule.update(
+            [_RESULT(zone="SLOW", hostname="c", started=1300, duration=400)]
+        )
+        schedule.update(
+            [_RESULT(zone="FAST", hostname="b", started=1700, duration=1)]
+        )
+        self.assertEqual(
+            schedule.due(now=2000),
+            [("SLOW", "c"), ("FAST", "a"), ("FAST", "b")],
+        )
+
+    def test_update(self):
+        """Testing function update."""
+        # Polls that overrun their interval miss their deadline
+        schedule = testimport.Scheduler(_Config())
+        schedule.update(
+            [
+                _RESULT(zone="FAST", hostname="a", started=0, duration=90),
+                _RESULT(zone="FAST", hostname="b", started=0, duration=1),
+            ]
+        )
+        self.assertEqual(
+            schedule.due(now=90),
+            [("FAST", "a"), ("FAST", "b"), ("SLOW", "c")],
+        )
+        self.assertEqual(schedule.due(now=30), [("SLOW", "c")])
+
+        # Unknown devices are ignored
+        schedule.update(
+            [_RESULT(zone="NONE", hostname="z", started=0, duration=1)]
+        )
+        self.assertNotIn(("NONE", "z"), schedule.due(now=1000))
+
+        # Failed polls wait for the next interval without changing the
+        # duration used to order the devices
+        schedule.update(
+            [
+                _RESULT(
+                    zone="FAST",
+                    hostname="b",
+                    started=100,
+                    duration=200,
+                    success=False,
+                )
+            ]
+        )
+        self.assertNotIn(("FAST", "b"), schedule.due(now=130))
+        self.assertEqual(
+            schedule.due(now=160)[:2], [("FAST", "a"), ("FAST", "b")]
+        )
+
+    def test_refresh(self):
+        """Testing function refresh."""
+        # Initialize key variables
+        schedule = testimport.Scheduler(_Config())
+        schedule.update(
+            [
+                _RESULT(zone="FAST", hostname="a", started=1000, duration=2),
+                _RESULT(zone="FAST", hostname="b", started=1000, duration=2),
+                _RESULT(zone="SLOW", hostname="c", started=1000, duration=2),
+            ]
+        )
+
+        # New devices are due immediately, removed ones are dropped and
+        # new polling intervals apply to the next poll
+        schedule.refresh(
+            _Config(
+                [
+                    ZONE(name="FAST", hostnames=["a"], polling_interval=30),
+                    ZONE(
+                        name="SLOW", hostnames=["c", "d"], polling_interval=300
+                    ),
+                ]
+            )
+        )
+        self.assertEqual(schedule.due(now=1010), [("SLOW", "d")])
+        self.assertEqual(
+            sorted(schedule.due(now=1030)), [("FAST", "a"), ("SLOW", "d")]
+        )
+        self.assertEqual(
+            sorted(schedule.due(now=2000)),
+            [("FAST", "a"), ("SLOW", "c"), ("SLOW", "d")],
+        )
+
+    def test_wait(self):
+        """Testing function wait."""
+        # Devices are due immediately at startup
+        schedule = testimport.Scheduler(_Config())
+        self.assertEqual(schedule.wait(now=1000), 1)
+
+        # Wait for the next device
+        schedule.update(
+            [
+                _RESULT(zone="FAST", hostname="a", started=1000, duration=2),
+                _RESULT(zone="FAST", hostname="b", started=1010, duration=2),
+                _RESULT(zone="SLOW", hostname="c", started=1000, duration=2),
+            ]
+        )
+        self.assertEqual(schedule.wait(now=1020), 40)
+        self.assertEqual(schedule.wait(now=1059.5), 1)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Test the switchmap.server.db.ingest.queue module."""
+
+import os
+import sys
+import unittest
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(
+                            os.path.join(
+                                os.path.abspath(
+                                    os.path.join(EXEC_DIR, os.pardir)
+                                ),
+                                os.pardir,
+                            )
+                        ),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db{0}ingest""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.server.configuration import ConfigServer
+from switchmap.server.db.ingest import queue as testimport
+
+
+def _data(hostname, value):
+    """Create device data.
+
+    Args:
+        hostname: Hostname of the device
+        value: Value to identify the data
+
+    Returns:
+        result: Device data
+
+    """
+    result = {"misc": {"host": hostname, "zone": "z"}, "layer1": {1: value}}
+    return result
+
+
+class TestQueue(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def setUp(self):
+        """Empty the queue before each test."""
+        filename = testimport.files.queue_file(ConfigServer())
+        for suffix in ["", "-wal", "-shm"]:
+            if os.path.isfile(filename + suffix) is True:
+                os.remove(filename + suffix)
+        self.queue = testimport.Queue(ConfigServer())
+
+    def test_put(self):
+        """Testing function put."""
+        # Newer data replaces data from the same device
+        self.queue.put("a", "z", _data("a", 1))
+        self.queue.put("b", "z", _data("b", 1))
+        self.queue.put("a", "z", _data("a", 2))
+        self.assertEqual(self.queue.size(), 2)
+
+        # Encoded payloads are stored as is
+        payload = testimport.codec.encode(_data("c", 1))
+        self.queue.put("c", "z", None, payload=payload)
+        self.assertEqual(self.queue.size(), 3)
+
+    def test_get(self):
+        """Testing function get."""
+        # Data is returned oldest first
+        self.assertIsNone(self.queue.get())
+        self.queue.put("a", "z", _data("a", 1))
+        self.queue.put("b", "z", _data("b", 1))
+        _, result = self.queue.get()
+        self.assertEqual(result, _data("a", 1))
+
+        # Claimed data is not returned again or replaced
+        self.queue.put("a", "z", _data("a", 2))
+        _, result = self.queue.get()
+        self.assertEqual(result, _data("b", 1))
+        _, result = self.queue.get()
+        self.assertEqual(result, _data("a", 2))
+        self.assertIsNone(self.queue.get())
+        self.assertEqual(self.queue.size(), 3)
+
+    def test_fail(self):
+        """Testing function fail."""
+        # Failed data is retried after a delay
+        self.queue.put("a", "z", _data("a", 1))
+        idx_item, _ = self.queue.get()
+        self.assertEqual(self.queue.fail(idx_item), 1)
+        self.assertIsNone(self.queue.get())
+        with self.queue._connection() as connection:
+            connection.execute("UPDATE items SET ts_retry = 0")
+        self.assertEqual(self.queue.get()[0], idx_item)
+
+        # Data is no longer retried after too many attempts
+        with self.queue._connection() as connection:
+            connection.execute(
+                "UPDATE items SET ts_retry = 0, attempts = ?",
+                (testimport.MAX_ATTEMPTS,),
+            )
+        self.assertIsNone(self.queue.get())
+
+        # Newer data from the device replaces it
+        self.queue.fail(idx_item)
+        self.queue.put("a", "z", _data("a", 2))
+        self.assertEqual(self.queue.size(), 1)
+        _, result = self.queue.get()
+        self.assertEqual(result, _data("a", 2))
+
+    def test_done(self):
+        """Testing function done."""
+        # Ingested data is removed
+        self.queue.put("a", "z", _data("a", 1))
+        idx_item, _ = self.queue.get()
+        self.queue.done(idx_item)
+        self.assertEqual(self.queue.size(), 0)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
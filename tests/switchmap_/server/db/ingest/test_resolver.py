@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Test the switchmap.server.db.ingest.resolver module."""
+
+import os
+import sys
+import time
+import socket
+import unittest
+from unittest.mock import patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(
+                            os.path.join(
+                                os.path.abspath(
+                                    os.path.join(EXEC_DIR, os.pardir)
+                                ),
+                                os.pardir,
+                            )
+                        ),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db{0}ingest""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.server.configuration import ConfigServer
+from switchmap.server.db.ingest import resolver as testimport
+
+
+def _gethostbyaddr(address):
+    """Mimic socket.gethostbyaddr.
+
+    Args:
+        address: IP address
+
+    Returns:
+        result: Tuple of (hostname, aliases, addresses)
+
+    """
+    if address.startswith("10."):
+        raise socket.herror("Unknown host")
+    if address.startswith("172."):
+        time.sleep(0.5)
+    result = ("host-{}".format(address), [], [address])
+    return result
+
+
+class TestResolver(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def setUp(self):
+        """Empty the cache before each test."""
+        filename = testimport.files.dns_file(ConfigServer())
+        for suffix in ["", "-wal", "-shm"]:
+            if os.path.isfile(filename + suffix) is True:
+                os.remove(filename + suffix)
+        self.resolver = testimport.Resolver(ConfigServer())
+
+    def test_resolve(self):
+        """Testing function resolve."""
+        # Test
+        addresses = ["192.168.1.1", "10.0.0.1", "192.168.1.1"]
+        expected = {"192.168.1.1": "host-192.168.1.1", "10.0.0.1": None}
+        with patch.object(
+            testimport.socket, "gethostbyaddr", side_effect=_gethostbyaddr
+        ) as mock:
+            result = self.resolver.resolve(addresses)
+            self.assertEqual(result, expected)
+            self.assertEqual(mock.call_count, 2)
+
+        # Found and missing hostnames are both cached between instances
+        with patch.object(
+            testimport.socket, "gethostbyaddr", side_effect=_gethostbyaddr
+        ) as mock:
+            result = testimport.Resolver(ConfigServer()).resolve(addresses)
+            self.assertEqual(result, expected)
+            self.assertEqual(mock.call_count, 0)
+
+            # Only uncached addresses are looked up
+            result = self.resolver.resolve(["192.168.1.2", "192.168.1.1"])
+            self.assertEqual(
+                result,
+                {
+                    "192.168.1.1": "host-192.168.1.1",
+                    "192.168.1.2": "host-192.168.1.2",
+                },
+            )
+            self.assertEqual(mock.call_count, 1)
+
+    def test_resolve_timeout(self):
+        """Testing function resolve with lookups that time out."""
+        # Test
+        self.resolver._timeout = 0.1
+        with patch.object(
+            testimport.socket, "gethostbyaddr", side_effect=_gethostbyaddr
+        ):
+            result = self.resolver.resolve(["172.16.0.1", "192.168.1.1"])
+        self.assertEqual(
+            result, {"172.16.0.1": None, "192.168.1.1": "host-192.168.1.1"}
+        )
+
+        # The timeout doesn't grow with the number of addresses per worker
+        self.resolver._workers = 1
+        addresses = ["172.16.0.{}".format(_) for _ in range(2, 6)]
+        with patch.object(
+            testimport.socket, "gethostbyaddr", side_effect=_gethostbyaddr
+        ):
+            start = time.time()
+            result = self.resolver.resolve(addresses)
+            self.assertLess(time.time() - start, 0.4)
+        self.assertEqual(result, {_: None for _ in addresses})
+
+        # Lookups that timed out aren't cached
+        with patch.object(
+            testimport.socket, "gethostbyaddr", side_effect=_gethostbyaddr
+        ) as mock:
+            self.resolver.resolve(["172.16.0.1", "192.168.1.1"])
+            self.assertEqual(mock.call_count, 1)
+
+    def test_resolve_empty(self):
+        """Testing function resolve with no addresses."""
+        # Test
+        self.assertEqual(self.resolver.resolve([]), {})
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
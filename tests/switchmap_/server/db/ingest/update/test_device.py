@@ -6,6 +6,8 @@ import sys
 import unittest
 from copy import deepcopy
 from operator import attrgetter
+from collections import namedtuple
+from mock import patch
 
 
 from sqlalchemy import select
@@ -65,6 +67,7 @@ from tests.testlib_ import data
 CONFIG = setup.config()
 CONFIG.save()
 
+from switchmap.core import general
 from switchmap.poller.update import device
 from switchmap.server.db.ingest.update import device as testimport
 from switchmap.server.db.ingest.update import zone as zone_update
@@ -260,6 +263,41 @@ class TestPollUpdateTopologyFunctions(unittest.TestCase):
             )
         self.assertEqual(result[: self.max_loops], expected)
 
+    def test__maclookup(self):
+        """Testing function _maclookup."""
+        # Initialize key variables
+        RMac = namedtuple("RMac", "idx_mac mac")
+        rows = [RMac(idx_mac=1, mac="001122334455")]
+        macs = ["00:11:22:33:44:55", "0011.2233.4455", "aabbccddeeff", "bad"]
+
+        # Each MAC is looked up once in its standard format and reported
+        # in the format given
+        with patch.object(
+            testimport._mac, "findmac", return_value=rows
+        ) as findmac:
+            result = testimport._maclookup(self.idx_zone, macs + macs)
+        findmac.assert_called_once_with(
+            self.idx_zone, ["001122334455", "aabbccddeeff"]
+        )
+        self.assertEqual(
+            result, {"00:11:22:33:44:55": rows[0], "0011.2233.4455": rows[0]}
+        )
+
+        # Nothing to look up
+        self.assertEqual(testimport._maclookup(self.idx_zone, []), {})
+
+        # The MACs of the polled device are found in the database
+        data = device.Device(_polled_data()).process()
+        macs = [
+            item
+            for interface in data["layer1"].values()
+            for item in interface.get("l1_macs") or []
+        ]
+        result = testimport._maclookup(self.idx_zone, macs)
+        self.assertTrue(bool(result))
+        for item, row in result.items():
+            self.assertEqual(general.mac(item).mac, row.mac)
+
 
 class TestPollUpdateTopologyClasses(unittest.TestCase):
     """Checks all functions and methods."""
@@ -5,6 +5,7 @@ import os
 import sys
 import unittest
 from copy import deepcopy
+from unittest.mock import patch
 
 # Try to create a working PYTHONPATH
 EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -400,6 +401,33 @@ class TestZoneTopology(unittest.TestCase):
         result.sort(key=lambda x: (x.address))
         self.assertEqual(result[: self.max_loops], expected)
 
+        # Hostnames looked up beforehand are used
+        hostnames = {_.address: "host-{}".format(_.address) for _ in expected}
+        tester = testimport.Topology(data, self.idx_zone, hostnames=hostnames)
+        tester.mac()
+        result = tester.ip()
+        result.sort(key=lambda x: (x.address))
+        self.assertEqual(
+            result[: self.max_loops],
+            [_._replace(hostname=hostnames[_.address]) for _ in expected],
+        )
+
+    def test_hostnames(self):
+        """Testing function hostnames."""
+        # Process the device
+        _device = device.Device(_polled_data())
+        data = _device.process()
+        expected = [_.ip for _ in testimport._arp_table(self.idx_zone, data)]
+
+        # Test
+        with patch.object(
+            testimport.Resolver, "resolve", return_value={}
+        ) as mock:
+            result = testimport.hostnames(data)
+        self.assertEqual(result, {})
+        self.assertEqual(sorted(mock.call_args[0][0]), sorted(expected))
+        self.assertTrue(bool(expected))
+
     def test_macip(self):
         """Testing function macip."""
         # Initialize key variables
@@ -57,6 +57,9 @@ CONFIG.save()
 
 from switchmap.server.db.table import device as testimport
 from switchmap.server.db.table import IDevice
+from switchmap.server.db.table import ipport
+from switchmap.server.db.table import macport
+from switchmap.server.db.table import vlanport
 
 from switchmap.server.db import models
 
@@ -230,6 +233,23 @@ class TestDbTableDevice(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(_convert(result), _convert(updated_row))
 
+    def test_delete_ports(self):
+        """Testing function delete_ports."""
+        # All the interfaces of the test data belong to the first device
+        tables = [ipport, macport, vlanport]
+        for table in tables:
+            self.assertTrue(table.idx_exists(1))
+
+        # Deleting the mappings of another device changes nothing
+        testimport.delete_ports(db.TEST_MAXIMUM + 1)
+        for table in tables:
+            self.assertTrue(table.idx_exists(1))
+
+        # Delete the mappings
+        testimport.delete_ports(1)
+        for table in tables:
+            self.assertFalse(table.idx_exists(1))
+
     def test__row(self):
         """Testing function _row."""
         # This function is tested by all the other tests
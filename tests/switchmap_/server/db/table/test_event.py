@@ -322,6 +322,23 @@ class TestDbTableEvent(unittest.TestCase):
         for index in [0, -1, -2]:
             self.assertEqual(indexes_before[index], indexes_after[index])
 
+    def test__children(self):
+        """Testing function _children."""
+        # Children must be deleted before their parents
+        result = [_[0] for _ in testimport._children(2)]
+        self.assertEqual(len(result), 10)
+        self.assertEqual(result[-1], models.Zone)
+        for child, parents in [
+            (models.IpPort, [models.L1Interface, models.Ip]),
+            (models.MacPort, [models.L1Interface, models.Mac]),
+            (models.VlanPort, [models.L1Interface, models.Vlan]),
+            (models.MacIp, [models.Mac, models.Ip]),
+            (models.L1Interface, [models.Device]),
+            (models.Vlan, [models.Device]),
+        ]:
+            for parent in parents:
+                self.assertLess(result.index(child), result.index(parent))
+
     def test__row(self):
         """Testing function _row."""
         # This function is tested by all the other tests
@@ -210,6 +210,27 @@ class TestDbTableIp(unittest.TestCase):
             self.assertTrue(result)
             self.assertEqual(_convert(result), _convert(row))
 
+    def test_upsert_row(self):
+        """Testing function upsert_row."""
+        # Create record
+        row = _row()
+
+        # Test before insertion of an initial row
+        result = testimport.exists(self.idx_zone, row.address)
+        self.assertFalse(result)
+
+        # Test after insertion of an initial row
+        testimport.upsert_row(row)
+        result = testimport.exists(self.idx_zone, row.address)
+        self.assertTrue(result)
+        self.assertEqual(_convert(result), _convert(row))
+
+        # Test that the existing row is updated
+        updated = row._replace(hostname="upserted.example.com")
+        testimport.upsert_row(updated)
+        result = testimport.exists(self.idx_zone, row.address)
+        self.assertEqual(_convert(result), _convert(updated))
+
     def test_update_row(self):
         """Testing function update_row."""
         # Repeat test
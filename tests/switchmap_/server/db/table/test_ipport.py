@@ -58,6 +58,7 @@ CONFIG.save()
 from switchmap.server.db.table import ipport as testimport
 from switchmap.server.db.models import IpPort
 from switchmap.server.db.table import IIpPort
+from switchmap.server.db.table import macport
 from switchmap.server.db import models
 
 from tests.testlib_ import db
@@ -193,6 +194,40 @@ class TestDbTableIpPort(unittest.TestCase):
                 if exists.idx_ip not in finds:
                     finds.append(exists.idx_ip)
 
+    def test_find_idx_ips(self):
+        """Testing function find_idx_ips."""
+        # Insert entries
+        idx_ips = []
+        for _ in range(1, db.TEST_MAXIMUM):
+            row = _row()
+            testimport.insert_row(row)
+            idx_ips.append(row.idx_ip)
+
+        # The bulk find must match the individual finds
+        expected = set()
+        for idx_ip in set(idx_ips):
+            expected.update(
+                _.idx_ipport for _ in testimport.find_idx_ip(idx_ip)
+            )
+        result = testimport.find_idx_ips(idx_ips)
+        self.assertEqual(set(_.idx_ipport for _ in result), expected)
+        self.assertEqual(len(result), len(expected))
+        self.assertEqual(testimport.find_idx_ips([]), [])
+
+    def test_implied(self):
+        """Testing function implied."""
+        # Each MAC address of the test data has the IP address with the
+        # same index
+        macports = macport.find_idx_macs(list(range(1, db.TEST_MAXIMUM + 1)))
+        expected = set((_.idx_l1interface, _.idx_mac) for _ in macports)
+
+        # All the interfaces belong to the first device
+        result = testimport.implied(1)
+        self.assertEqual(
+            set((_.idx_l1interface, _.idx_ip) for _ in result), expected
+        )
+        self.assertEqual(testimport.implied(db.TEST_MAXIMUM + 1), [])
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Start iterative tests
@@ -214,6 +249,31 @@ class TestDbTableIpPort(unittest.TestCase):
             self.assertTrue(result)
             self.assertEqual(_convert(result), _convert(row))
 
+    def test_upsert_row(self):
+        """Testing function upsert_row."""
+        # Find a row combination that does not exist
+        while True:
+            # Create record
+            row = _row()
+
+            # Test before insertion of an initial row
+            result = testimport.exists(row.idx_l1interface, row.idx_ip)
+            if bool(result) is False:
+                self.assertFalse(result)
+                break
+
+        # Test after insertion of an initial row
+        testimport.upsert_row(row)
+        result = testimport.exists(row.idx_l1interface, row.idx_ip)
+        self.assertTrue(result)
+        self.assertEqual(_convert(result), _convert(row))
+
+        # Test that the existing row is updated
+        updated = row._replace(enabled=0)
+        testimport.upsert_row(updated)
+        result = testimport.exists(row.idx_l1interface, row.idx_ip)
+        self.assertEqual(_convert(result), _convert(updated))
+
     def test_update_row(self):
         """Testing function update_row."""
         # Start iterative tests
@@ -172,6 +172,27 @@ class TestDbTableMac(unittest.TestCase):
         self.assertEqual(_convert(result), _convert(row))
         self.assertTrue(row.idx_oui != 1)
 
+    def test_upsert_row(self):
+        """Testing function upsert_row."""
+        # Create record
+        row = _row()
+
+        # Test before insertion of an initial row
+        result = testimport.exists(self.idx_zone, row.mac)
+        self.assertFalse(result)
+
+        # Test after insertion of an initial row
+        testimport.upsert_row(row)
+        result = testimport.exists(self.idx_zone, row.mac)
+        self.assertTrue(result)
+        self.assertEqual(_convert(result), _convert(row))
+
+        # Test that the existing row is updated
+        updated = row._replace(enabled=0)
+        testimport.upsert_row(updated)
+        result = testimport.exists(self.idx_zone, row.mac)
+        self.assertEqual(_convert(result), _convert(updated))
+
     def test_update_row(self):
         """Testing function update_row."""
         # Create record
@@ -142,6 +142,24 @@ class TestDbTableMacIp(unittest.TestCase):
             self.assertTrue(result)
             self.assertEqual(_convert(result), _convert(row))
 
+    def test_find_idx_macs(self):
+        """Testing function find_idx_macs."""
+        # Insert entries
+        rows = []
+        for _ in range(self.loops):
+            row = _row()
+            testimport.insert_row(row)
+            rows.append(row)
+
+        # Every entry must be found
+        result = testimport.find_idx_macs([_.idx_mac for _ in rows])
+        found = set((_.idx_mac, _.idx_ip) for _ in result)
+        for row in rows:
+            self.assertIn((row.idx_mac, row.idx_ip), found)
+        for item in result:
+            self.assertIn(item.idx_mac, [_.idx_mac for _ in rows])
+        self.assertEqual(testimport.find_idx_macs([]), [])
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Loop a lot of times
@@ -159,6 +177,31 @@ class TestDbTableMacIp(unittest.TestCase):
             self.assertTrue(result)
             self.assertEqual(_convert(result), _convert(row))
 
+    def test_upsert_row(self):
+        """Testing function upsert_row."""
+        # Find a row combination that does not exist
+        while True:
+            # Create record
+            row = _row()
+
+            # Test before insertion of an initial row
+            result = testimport.exists(row.idx_mac, row.idx_ip)
+            if bool(result) is False:
+                self.assertFalse(result)
+                break
+
+        # Test after insertion of an initial row
+        testimport.upsert_row(row)
+        result = testimport.exists(row.idx_mac, row.idx_ip)
+        self.assertTrue(result)
+        self.assertEqual(_convert(result), _convert(row))
+
+        # Test that the existing row is updated
+        updated = row._replace(enabled=0)
+        testimport.upsert_row(updated)
+        result = testimport.exists(row.idx_mac, row.idx_ip)
+        self.assertEqual(_convert(result), _convert(updated))
+
     def test_update_row(self):
         """Testing function update_row."""
         # Loop a lot of times
@@ -191,6 +191,28 @@ class TestDbTableMacPort(unittest.TestCase):
                 if exists.idx_mac not in finds:
                     finds.append(exists.idx_mac)
 
+    def test_find_idx_macs(self):
+        """Testing function find_idx_macs."""
+        # Insert entries
+        idx_macs = []
+        for _ in range(1, db.TEST_MAXIMUM):
+            row = _row()
+            exists = testimport.exists(row.idx_l1interface, row.idx_mac)
+            if bool(exists) is False:
+                testimport.insert_row(row)
+            idx_macs.append(row.idx_mac)
+
+        # The bulk find must match the individual finds
+        expected = set()
+        for idx_mac in set(idx_macs):
+            expected.update(
+                _.idx_macport for _ in testimport.find_idx_mac(idx_mac)
+            )
+        result = testimport.find_idx_macs(idx_macs)
+        self.assertEqual(set(_.idx_macport for _ in result), expected)
+        self.assertEqual(len(result), len(expected))
+        self.assertEqual(testimport.find_idx_macs([]), [])
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Find a row combination that does not exist
@@ -210,6 +232,31 @@ class TestDbTableMacPort(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(_convert(result), _convert(row))
 
+    def test_upsert_row(self):
+        """Testing function upsert_row."""
+        # Find a row combination that does not exist
+        while True:
+            # Create record
+            row = _row()
+
+            # Test before insertion of an initial row
+            result = testimport.exists(row.idx_l1interface, row.idx_mac)
+            if bool(result) is False:
+                self.assertFalse(result)
+                break
+
+        # Test after insertion of an initial row
+        testimport.upsert_row(row)
+        result = testimport.exists(row.idx_l1interface, row.idx_mac)
+        self.assertTrue(result)
+        self.assertEqual(_convert(result), _convert(row))
+
+        # Test that the existing row is updated
+        updated = row._replace(enabled=0)
+        testimport.upsert_row(updated)
+        result = testimport.exists(row.idx_l1interface, row.idx_mac)
+        self.assertEqual(_convert(result), _convert(updated))
+
     def test_update_row(self):
         """Testing function update_row."""
         # Find a row combination that does not exist
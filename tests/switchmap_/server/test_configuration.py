@@ -118,6 +118,34 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.db_user()
         self.assertEqual(result, expected)
 
+    def test_dns_cache_ttl(self):
+        """Testing function dns_cache_ttl."""
+        # Run test
+        expected = 86400
+        result = self.config.dns_cache_ttl()
+        self.assertEqual(result, expected)
+
+    def test_dns_negative_cache_ttl(self):
+        """Testing function dns_negative_cache_ttl."""
+        # Run test
+        expected = 3600
+        result = self.config.dns_negative_cache_ttl()
+        self.assertEqual(result, expected)
+
+    def test_dns_timeout(self):
+        """Testing function dns_timeout."""
+        # Run test
+        expected = 2
+        result = self.config.dns_timeout()
+        self.assertEqual(result, expected)
+
+    def test_dns_workers(self):
+        """Testing function dns_workers."""
+        # Run test
+        expected = 20
+        result = self.config.dns_workers()
+        self.assertEqual(result, expected)
+
     def test_ingest_directory(self):
         """Testing function ingest_directory."""
         # Run test
@@ -127,6 +155,13 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.ingest_directory()
         self.assertEqual(result, expected)
 
+    def test_ingest_mode(self):
+        """Testing function ingest_mode."""
+        # Run test
+        expected = "spool"
+        result = self.config.ingest_mode()
+        self.assertEqual(result, expected)
+
     def test_ingest_interval(self):
         """Testing function ingest_interval."""
         # Run test
@@ -141,6 +176,34 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.purge_after_ingest()
         self.assertEqual(result, expected)
 
+    def test_purge_batch_size(self):
+        """Testing function purge_batch_size."""
+        # Run test
+        expected = 5000
+        result = self.config.purge_batch_size()
+        self.assertEqual(result, expected)
+
+    def test_purge_pause(self):
+        """Testing function purge_pause."""
+        # Run test
+        expected = 0.1
+        result = self.config.purge_pause()
+        self.assertEqual(result, expected)
+
+    def test_snapshot_interval(self):
+        """Testing function snapshot_interval."""
+        # Run test
+        expected = 0
+        result = self.config.snapshot_interval()
+        self.assertEqual(result, expected)
+
+    def test_spool_format(self):
+        """Testing function spool_format."""
+        # Run test
+        expected = "msgpack"
+        result = self.config.spool_format()
+        self.assertEqual(result, expected)
+
     def test_username(self):
         """Testing function username."""
         # Run test
@@ -92,6 +92,7 @@ poller:
   server_https: False
   zones:
     - zone: SITE-A
+      polling_interval: 300
       hostnames:
         - hostname1
         - hostname2